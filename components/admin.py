@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hmac
+from typing import Optional
+
+import streamlit as st
+
+from components.config import env_str
+
+ADMIN_TOKEN_ENV_VAR = "RSV_ADMIN_TOKEN"
+
+
+def admin_token_valid(candidate: Optional[str]) -> bool:
+    """True when ``candidate`` matches ``RSV_ADMIN_TOKEN``; admin features stay off while the token is unset."""
+    token = env_str(ADMIN_TOKEN_ENV_VAR)
+    return bool(token and candidate and hmac.compare_digest(token, candidate))
+
+
+def require_admin() -> bool:
+    """Gate an admin-only page behind ``?admin=<token>`` or a token prompt; remembered for the session."""
+
+    if st.session_state.get("admin_authenticated"):
+        return True
+    if not env_str(ADMIN_TOKEN_ENV_VAR):
+        st.info(f"Admin pages are disabled. Set {ADMIN_TOKEN_ENV_VAR} to enable them.")
+        return False
+
+    candidate = st.query_params.get("admin", [None])
+    candidate = candidate[-1] if isinstance(candidate, list) else candidate
+    if not candidate:
+        candidate = st.text_input("Admin token", type="password")
+    if admin_token_valid(candidate):
+        st.session_state["admin_authenticated"] = True
+        return True
+    if candidate:
+        st.error("Invalid admin token.")
+    return False
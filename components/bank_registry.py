@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from components.config import env_str
+from components.response_bank import (
+    DEFAULT_BANK_PATH,
+    DEFAULT_PAGE_MAP_PATH,
+    ResponseBank,
+    load_intent_to_page_map,
+    load_response_bank,
+)
+
+DEFAULT_BANK_ID = "default"
+MANIFEST_ENV_VAR = "RSV_BANKS"
+
+
+@dataclass(frozen=True)
+class BankSource:
+    bank_id: str
+    bank_path: Path
+    page_map_path: Path
+    label: str
+
+
+class BankRegistry:
+    """Response banks (locales or programs) served by one process, each built once and shared by all sessions."""
+
+    def __init__(self) -> None:
+        self._sources: Dict[str, BankSource] = {}
+        self._banks: Dict[str, ResponseBank] = {}
+        self._lock = threading.Lock()
+        self.register(DEFAULT_BANK_ID, DEFAULT_BANK_PATH, DEFAULT_PAGE_MAP_PATH, label="Default")
+
+    @classmethod
+    def from_manifest(cls, path: Path | str) -> "BankRegistry":
+        """Load ``{"banks": {"es": {"bank": "...json", "page_map": "...json", "label": "Español"}}}``.
+
+        Relative paths resolve against the manifest's folder; ``page_map`` defaults to the shared map.
+        """
+        registry = cls()
+        manifest_path = Path(path)
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        for bank_id, entry in manifest.get("banks", {}).items():
+            page_map = entry.get("page_map")
+            registry.register(
+                bank_id,
+                manifest_path.parent / entry["bank"],
+                manifest_path.parent / page_map if page_map else DEFAULT_PAGE_MAP_PATH,
+                label=entry.get("label"),
+            )
+        return registry
+
+    def register(self, bank_id: str, bank_path: Path | str, page_map_path: Path | str = DEFAULT_PAGE_MAP_PATH, label: Optional[str] = None) -> None:
+        with self._lock:
+            self._sources[bank_id] = BankSource(bank_id, Path(bank_path), Path(page_map_path), label or bank_id)
+            self._banks.pop(bank_id, None)
+
+    def bank_ids(self) -> List[str]:
+        return list(self._sources)
+
+    def label(self, bank_id: str) -> str:
+        source = self._sources.get(bank_id)
+        return source.label if source else bank_id
+
+    def resolve(self, requested: Optional[str]) -> str:
+        return requested if requested in self._sources else DEFAULT_BANK_ID
+
+    def get(self, bank_id: Optional[str] = None) -> ResponseBank:
+        resolved = self.resolve(bank_id)
+        with self._lock:
+            bank = self._banks.get(resolved)
+            if bank is None:
+                source = self._sources[resolved]
+                bank = ResponseBank(
+                    bank=load_response_bank(source.bank_path),
+                    page_map=load_intent_to_page_map(source.page_map_path),
+                )
+                self._banks[resolved] = bank
+            return bank
+
+
+_REGISTRY: Optional[BankRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> BankRegistry:
+    """Process-wide registry, read from the ``RSV_BANKS`` manifest when set."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            manifest = env_str(MANIFEST_ENV_VAR)
+            _REGISTRY = BankRegistry.from_manifest(manifest) if manifest else BankRegistry()
+        return _REGISTRY
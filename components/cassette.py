@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import builtins
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from components.config import env_bool, env_str
+
+CASSETTE_ENV_VAR = "RSV_CASSETTE"
+CASSETTE_MODE_ENV_VAR = "RSV_CASSETTE_MODE"
+CASSETTE_VERSION = 1
+CASSETTE_MODES = ("replay", "record")
+
+# Request options that do not change the answer and would make keys unstable.
+_VOLATILE_OPTIONS = {"timeout", "extra_headers", "extra_query", "extra_body", "user"}
+
+
+_SHARED: Dict[tuple, "Cassette"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class CassetteError(Exception):
+    """The cassette file cannot be used (unknown version, malformed)."""
+
+
+class CassetteMiss(LookupError):
+    """Replay was asked for a request that was never recorded."""
+
+
+def canonical_request(endpoint: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    return {"endpoint": endpoint, **{key: value for key, value in options.items() if key not in _VOLATILE_OPTIONS}}
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _dump(obj: Any) -> Any:
+    return obj.model_dump(mode="json") if hasattr(obj, "model_dump") else obj
+
+
+class Cassette:
+    """Versioned JSON file of request/response pairs keyed by a hash of the canonical request."""
+
+    def __init__(self, path: Path | str, mode: str = "replay", replay_latency: bool = False):
+        if mode not in CASSETTE_MODES:
+            raise CassetteError(f"Unknown cassette mode {mode!r}; expected one of {CASSETTE_MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self.interactions: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            self._load()
+        elif mode == "replay":
+            raise CassetteError(f"Cassette {self.path} does not exist; record it first")
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassette"]:
+        """``RSV_CASSETTE=path`` with ``RSV_CASSETTE_MODE=replay|record``; ``RSV_CASSETTE_LATENCY=1`` replays timing.
+
+        One instance per configuration is shared by the process so every classifier records into the same file.
+        """
+        path = env_str(CASSETTE_ENV_VAR)
+        if not path:
+            return None
+        options = (path, env_str(CASSETTE_MODE_ENV_VAR, "replay"), env_bool("RSV_CASSETTE_LATENCY"))
+        with _SHARED_LOCK:
+            if options not in _SHARED:
+                _SHARED[options] = cls(options[0], mode=options[1], replay_latency=options[2])
+            return _SHARED[options]
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise CassetteError(f"Cassette {self.path} is not valid JSON") from exc
+        if data.get("version") != CASSETTE_VERSION:
+            raise CassetteError(f"Cassette {self.path} has version {data.get('version')!r}; expected {CASSETTE_VERSION}. Re-record it.")
+        self.interactions = {entry["key"]: entry for entry in data.get("interactions", [])}
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = sorted(self.interactions.values(), key=lambda entry: entry["key"])
+            payload = {"version": CASSETTE_VERSION, "interactions": interactions}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def record(self, request: Dict[str, Any], latency_ms: float, **outcome: Any) -> None:
+        entry = {"key": request_key(request), "request": request, "latency_ms": round(latency_ms, 1), **outcome}
+        with self._lock:
+            self.interactions[entry["key"]] = entry
+        self.save()
+
+    def lookup(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        entry = self.interactions.get(request_key(request))
+        if entry is None:
+            raise CassetteMiss(f"No recorded interaction for {request.get('endpoint')} request {request_key(request)[:12]} in {self.path}")
+        if self.replay_latency:
+            time.sleep(entry.get("latency_ms", 0) / 1000)
+        return entry
+
+
+def _capture_error(exc: Exception) -> Dict[str, Any]:
+    return {
+        "type": type(exc).__name__,
+        "message": getattr(exc, "message", None) or str(exc),
+        "status_code": getattr(exc, "status_code", None),
+        "body": getattr(exc, "body", None),
+    }
+
+
+def _rebuild_error(error: Dict[str, Any]) -> Exception:
+    """Recreate the recorded exception so callers take the same error path as live.
+
+    OpenAI errors are rebuilt with a stand-in request; built-in exceptions (e.g. the ``TypeError`` an older
+    SDK raises for an unsupported option) are rebuilt as themselves.
+    """
+    import httpx
+    import openai
+
+    builtin = getattr(builtins, error["type"], None)
+    if isinstance(builtin, type) and issubclass(builtin, Exception):
+        return builtin(error["message"])
+
+    request = httpx.Request("POST", "https://cassette.invalid/v1")
+    cls = getattr(openai, error["type"], None)
+    if isinstance(cls, type) and issubclass(cls, openai.APIStatusError):
+        response = httpx.Response(error.get("status_code") or 500, request=request)
+        return cls(error["message"], response=response, body=error.get("body"))
+    if isinstance(cls, type) and issubclass(cls, openai.APIConnectionError):
+        return cls(request=request) if cls is openai.APITimeoutError else cls(message=error["message"], request=request)
+    return RuntimeError(f"{error['type']}: {error['message']}")
+
+
+class _ReplayStream:
+    def __init__(self, chunks: List[Any]):
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._chunks)
+
+    def close(self) -> None:
+        return None
+
+
+class _RecordingStream:
+    """Passes chunks through and records the whole stream, draining it on early close."""
+
+    def __init__(self, inner: Any, on_finish):
+        self._inner = inner
+        self._on_finish = on_finish
+        self._chunks: List[Dict[str, Any]] = []
+        self._finished = False
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._inner:
+            self._chunks.append(_dump(chunk))
+            yield chunk
+        self._finish()
+
+    def close(self) -> None:
+        if not self._finished:
+            for chunk in self._inner:
+                self._chunks.append(_dump(chunk))
+        close = getattr(self._inner, "close", None)
+        if close:
+            close()
+        self._finish()
+
+    def _finish(self) -> None:
+        if not self._finished:
+            self._finished = True
+            self._on_finish(self._chunks)
+
+
+class CassetteClient:
+    """Stands in for ``OpenAI`` on the two calls the classifier makes: chat completions and model listing."""
+
+    def __init__(self, cassette: Cassette, inner: Any = None):
+        if cassette.mode == "record" and inner is None:
+            raise CassetteError("Recording needs a real client; set OPENAI_API_KEY (and OPENAI_BASE_URL for the mock server)")
+        self.cassette = cassette
+        self.inner = inner
+        self.chat = self
+        self.completions = self
+        self.models = _CassetteModels(self)
+        # Canonical requests in the order they were made, so tests can assert what was (or was not) sent.
+        self.requests: List[Dict[str, Any]] = []
+
+    def create(self, **options: Any) -> Any:
+        request = canonical_request("chat.completions", options)
+        self.requests.append(request)
+        if self.cassette.mode == "replay":
+            return self._replay_completion(request)
+
+        started = time.perf_counter()
+        try:
+            response = self.inner.chat.completions.create(**options)
+        except Exception as exc:
+            self.cassette.record(request, (time.perf_counter() - started) * 1000, error=_capture_error(exc))
+            raise
+        if options.get("stream"):
+            return _RecordingStream(
+                response, lambda chunks: self.cassette.record(request, (time.perf_counter() - started) * 1000, chunks=chunks)
+            )
+        self.cassette.record(request, (time.perf_counter() - started) * 1000, response=_dump(response))
+        return response
+
+    def _replay_completion(self, request: Dict[str, Any]) -> Any:
+        from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+        entry = self.cassette.lookup(request)
+        if "error" in entry:
+            raise _rebuild_error(entry["error"])
+        if "chunks" in entry:
+            return _ReplayStream([ChatCompletionChunk.model_validate(chunk) for chunk in entry["chunks"]])
+        return ChatCompletion.model_validate(entry["response"])
+
+
+class _CassetteModels:
+    def __init__(self, client: CassetteClient):
+        self._client = client
+
+    def list(self) -> Any:
+        cassette = self._client.cassette
+        request = canonical_request("models.list", {})
+        self._client.requests.append(request)
+        if cassette.mode == "replay":
+            entry = cassette.lookup(request)
+            if "error" in entry:
+                raise _rebuild_error(entry["error"])
+            return entry["response"]
+        started = time.perf_counter()
+        try:
+            response = self._client.inner.models.list()
+        except Exception as exc:
+            cassette.record(request, (time.perf_counter() - started) * 1000, error=_capture_error(exc))
+            raise
+        data = [_dump(model) for model in response]
+        cassette.record(request, (time.perf_counter() - started) * 1000, response={"object": "list", "data": data})
+        return response
@@ -1,47 +1,109 @@
 from __future__ import annotations
 
+import threading
+import uuid
+import weakref
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List
 from urllib.parse import urlencode
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
+from components.bank_registry import DEFAULT_BANK_ID, get_registry
+from components.classification_jobs import JOBS, submission_key
+from components.conversation_store import get_conversation_store
 from components.intent_classifier import IntentClassifier
+from components.metrics import METRICS
+from components.navigation import page_for
 from components.response_bank import ResponseBank
+from components.session_memory import CHAT_STATE_KEYS, SESSIONS
+from components.typeahead import typeahead_input
+from components.warmup import ensure_process_warmup, process_warmup_handle
 
 FALLBACK_RESPONSE = "I could not find a matching topic in the response bank. Try a guided question or rephrase."
+HISTORY_PAGE_SIZE = 20
+# How long a worker waits for the submitting rerun to store the question before storing its answer anyway.
+QUESTION_STORE_TIMEOUT_SECONDS = 5.0
 
 
 def _init_state() -> None:
     st.session_state.setdefault("chat_mode", "Guided")
-    st.session_state.setdefault("guided_history", [])
-    st.session_state.setdefault("free_history", [])
     st.session_state.setdefault("last_intent_id", None)
     st.session_state.setdefault("guided_auto_prompts", {})
     st.session_state.setdefault("chat_panel_open", False)
     st.session_state.setdefault("api_status", {"state": "unknown", "message": "Status not checked yet."})
     st.session_state.setdefault("api_status_checked_at", None)
     st.session_state.setdefault("last_mode", st.session_state.get("chat_mode", "Guided"))
+    _ensure_session_id()
+
+
+def _ensure_session_id() -> None:
+    """One random conversation id per browser session, kept only in session state.
+
+    The id is the key to the user's health chat in the conversation store, so it is never put in or
+    taken from the URL, where a shared or bookmarked link would hand the conversation to someone else.
+    """
+
+    st.session_state.setdefault("chat_session_id", uuid.uuid4().hex)
+    if "sid" in st.query_params:
+        # Links from before the id left the URL: drop the parameter without honouring it.
+        del st.query_params["sid"]
+
+
+def _session_evictor() -> Callable[[], None]:
+    """Callback that drops this session's chat keys; holds the session only weakly."""
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return lambda: None
+    state_ref = weakref.ref(ctx.session_state)
+
+    def evict() -> None:
+        state = state_ref()
+        if state is None:
+            return
+        for key in CHAT_STATE_KEYS:
+            try:
+                del state[key]
+            except KeyError:
+                pass
+
+    return evict
+
+
+def _track_session_memory() -> None:
+    session_id = st.session_state["chat_session_id"]
+    if SESSIONS.consume_eviction(session_id):
+        st.toast("The chat panel was reset after a period of inactivity.")
+    SESSIONS.touch(session_id, st.session_state, _session_evictor(), store=get_conversation_store())
 
 
 def _render_history(history_key: str) -> None:
-    for message in st.session_state.get(history_key, []):
-        with st.chat_message(message.get("role", "assistant")):
-            st.write(message.get("content", ""))
+    store = get_conversation_store()
+    session_id = st.session_state["chat_session_id"]
+    visible_key = f"{history_key}_visible"
+    visible = st.session_state.setdefault(visible_key, HISTORY_PAGE_SIZE)
+    earlier = store.count(session_id, history_key) - visible
+    if earlier > 0 and st.button(f"Show earlier messages ({earlier})", key=f"{history_key}-earlier"):
+        visible = st.session_state[visible_key] = visible + HISTORY_PAGE_SIZE
+
+    for message in store.recent(session_id, history_key, visible):
+        with st.chat_message(message.get("role") or "assistant"):
+            st.write(message.get("content") or "")
             intent_id = message.get("intent_id")
             if intent_id and message.get("role") == "assistant":
                 _render_deep_links(intent_id)
 
 
 def _append_history(history_key: str, role: str, content: str, intent_id: str | None = None) -> None:
-    st.session_state[history_key].append({"role": role, "content": content, "intent_id": intent_id})
+    get_conversation_store().append(st.session_state["chat_session_id"], history_key, role, content, intent_id)
 
 
 def _render_deep_links(intent_id: str) -> None:
-    bank = st.session_state.get("response_bank")
-    if not isinstance(bank, ResponseBank):
-        return
-
+    # Resolved through the registry so sessions never hold their own bank reference.
+    bank = get_registry().get(st.session_state.get("bank_id", DEFAULT_BANK_ID))
     links = bank.get_page_links_for_intent(intent_id)
     if not links:
         return
@@ -49,7 +111,7 @@ def _render_deep_links(intent_id: str) -> None:
     cols = st.columns(len(links))
     for col, link in zip(cols, links):
         with col:
-            st.page_link(link["page"], label=f"Go to {link['label']}", icon="➡️")
+            st.page_link(page_for(link["page"]), label=f"Go to {link['label']}", icon="➡️")
 
 
 def _render_next_best(next_best: List[Dict], response_bank: ResponseBank, history_key: str) -> None:
@@ -88,6 +150,18 @@ def _sync_mode_with_query_params() -> None:
             st.session_state["chat_panel_open"] = False
 
 
+def select_response_bank() -> ResponseBank:
+    """Return the shared bank for this session, chosen with ``?bank=<id>`` and remembered across pages."""
+
+    registry = get_registry()
+    requested = st.query_params.get("bank", [None])
+    requested = requested[-1] if isinstance(requested, list) else requested
+    if requested:
+        st.session_state["bank_id"] = registry.resolve(requested)
+    bank_id = st.session_state.setdefault("bank_id", DEFAULT_BANK_ID)
+    return registry.get(bank_id)
+
+
 def _build_mode_link(mode: str) -> str:
     params = dict(st.query_params)
     params.update({"chat": mode, "panel": "open"})
@@ -148,9 +222,13 @@ def render_chatbot(response_bank: ResponseBank, classifier: IntentClassifier, pa
     """Render chatbot entrypoints with a reusable floating panel that supports both modes."""
 
     _init_state()
-    _update_api_status(classifier)
+    _track_session_memory()
+    _collect_classification()
+    ensure_process_warmup(classifier)
     _sync_mode_with_query_params()
-    st.session_state["response_bank"] = response_bank
+    if st.session_state.get("chat_mode") == "Free text":
+        # Guided mode never needs OpenAI, so connectivity is only checked once free text is in use.
+        _update_api_status(classifier)
 
     _render_mode_launchers()
 
@@ -243,7 +321,7 @@ def _render_panel_shell(response_bank: ResponseBank, classifier: IntentClassifie
         if st.session_state["chat_mode"] == "Guided":
             _render_guided(response_bank, page_path)
         else:
-            _render_free_text(response_bank, classifier)
+            _render_free_text(response_bank, classifier, page_path)
 
 
 def _render_guided(response_bank: ResponseBank, page_path: str | None) -> None:
@@ -256,9 +334,8 @@ def _render_guided(response_bank: ResponseBank, page_path: str | None) -> None:
 
         page_key = page_path or "__root__"
         seen_map: Dict[str, str] = st.session_state.get("guided_auto_prompts", {})
-        already_present = any(
-            msg.get("intent_id") == page_intent["intent_id"] and msg.get("role") == "assistant"
-            for msg in st.session_state.get("guided_history", [])
+        already_present = get_conversation_store().has_answer(
+            st.session_state["chat_session_id"], "guided_history", page_intent["intent_id"]
         )
         if seen_map.get(page_key) != page_intent["intent_id"] and not already_present:
             _handle_intent(page_intent, "guided_history", response_bank)
@@ -283,39 +360,183 @@ def _handle_intent(intent: Dict, history_key: str, response_bank: ResponseBank)
     _append_history(history_key, "assistant", answer, intent_id=intent.get("intent_id"))
 
 
-def _render_free_text(response_bank: ResponseBank, classifier: IntentClassifier) -> None:
+def _render_free_text(response_bank: ResponseBank, classifier: IntentClassifier, page_path: str | None = None) -> None:
     st.caption("Type your own question. We classify it to an approved intent and respond only from the response bank.")
     if not classifier.has_api_key():
         st.info("Add your OPENAI_API_KEY to a local .env file (see .env.example) and restart to enable free text.")
-
-    user_input = st.text_input("Your question", placeholder="Ask about RSV eligibility, timing, or logistics")
-    if st.button("Send", disabled=not classifier.has_api_key() or not user_input.strip()):
-        _append_history("free_history", "user", user_input.strip())
-        result = classifier.classify(user_input.strip())
-        answer_intent = response_bank.get_intent_by_id(result.intent_id)
-        if not answer_intent:
-            content = FALLBACK_RESPONSE
+    warmup = process_warmup_handle()
+    if warmup and not warmup.ready:
+        st.caption("Warming up the classifier; the first answer may take a moment longer.")
+
+    user_input = typeahead_input(
+        "Your question",
+        key="free-text-query",
+        placeholder="Ask about RSV eligibility, timing, or logistics",
+    )
+    _render_suggestions(user_input, response_bank, classifier)
+    session_id = st.session_state["chat_session_id"]
+    over_budget = classifier.has_api_key() and classifier.budget_status(session_id) != "ok"
+    if over_budget:
+        st.info("Free-text questions are paused because the usage budget was reached. Suggestions and guided questions still work.")
+    pending = bool(st.session_state.get("pending_classification"))
+    if st.button("Send", disabled=not classifier.has_api_key() or over_budget or pending or not user_input.strip()):
+        message = user_input.strip()
+        guarded = classifier.input_guard.check(message)
+        key = submission_key(session_id, message)
+        if guarded.rejected and classifier.emergency_match(message) is None:
+            # Refused outright: nothing is stored or classified, and only the guard's own notice is shown.
+            st.warning(guarded.notice)
+        elif duplicate := JOBS.duplicate_of(key):
+            # Double-click or rerun: the question is already in the history and its job is running or answered.
+            if JOBS.get(duplicate) is not None:
+                st.session_state["pending_classification"] = duplicate
         else:
-            content = answer_intent.get("response", FALLBACK_RESPONSE)
-        _append_history("free_history", "assistant", content, intent_id=result.intent_id if answer_intent else None)
-        st.session_state["last_intent_id"] = result.intent_id if answer_intent else None
-
-        if not classifier.has_api_key():
-            st.warning("Free text requests need an OpenAI API key. Add it to a local .env file and restart the app.")
-        elif result.intent_id == "__NO_MATCH__":
-            st.warning("The classifier could not match your question with enough confidence. Try rephrasing or use guided mode.")
-            fallback_reason = result.rationale or "The classifier could not match your question with enough confidence. Try rephrasing or use guided mode."
-            st.warning(fallback_reason)
+            previous_intent_id = st.session_state.get("last_intent_id")
+            question_stored = threading.Event()
+            job = partial(
+                _answer_free_text, response_bank, classifier, message, session_id, page_path, previous_intent_id, question_stored
+            )
+            job_id = JOBS.submit(job, key=key) if JOBS.has_capacity() else None
+            if job_id is None:
+                st.warning("Many questions are being answered right now. Please try again in a moment.")
+            else:
+                # The question is stored only once its job exists; the worker waits for it before storing the answer.
+                try:
+                    # History keeps the bounded text; the worker still classifies the original so the emergency scan sees all of it.
+                    _append_history("free_history", "user", guarded.text or guarded.cleaned[: classifier.input_guard.limit_chars] + "…")
+                finally:
+                    question_stored.set()
+                if guarded.truncated:
+                    st.toast(guarded.notice)
+                st.session_state.pop("free_text_candidates", None)
+                st.session_state["pending_classification"] = job_id
+
+    notice = st.session_state.pop("free_text_notice", None)
+    if notice:
+        st.warning("The classifier could not match your question with enough confidence. Try rephrasing or use guided mode.")
+        st.warning(notice)
+    _render_candidates(response_bank)
 
     st.markdown("---")
     st.caption("Conversation")
     _render_history("free_history")
+    if st.session_state.get("pending_classification"):
+        _render_pending_answer()
 
     if st.session_state.get("last_intent_id"):
         next_best = response_bank.get_next_best(st.session_state["last_intent_id"])
         _render_next_best(next_best, response_bank, "free_history")
 
 
+def _answer_free_text(
+    response_bank: ResponseBank,
+    classifier: IntentClassifier,
+    message: str,
+    session_id: str,
+    page_path: str | None,
+    previous_intent_id: str | None = None,
+    question_stored: threading.Event | None = None,
+) -> Dict[str, Any]:
+    """Runs on the job pool: classify, store the answer, and report what the session needs to update.
+
+    Worker threads have no Streamlit context, so the answer goes straight to the conversation store, after
+    the submitting rerun has stored the question (``question_stored``). Nothing here may raise: the outcome
+    is collected on every rerun of every page.
+    """
+
+    answer_intent = None
+    result = None
+    try:
+        result = classifier.classify(message, session_id=session_id, page=page_path, previous_intent_id=previous_intent_id)
+        answer_intent = response_bank.get_intent_by_id(result.intent_id)
+        notice = None if answer_intent else result.rationale or FALLBACK_RESPONSE
+    except Exception as exc:  # noqa: BLE001 - the user still gets the fallback answer
+        notice = f"Unexpected error while classifying: {exc}"
+    content = answer_intent.get("response", FALLBACK_RESPONSE) if answer_intent else FALLBACK_RESPONSE
+    intent_id = answer_intent["intent_id"] if answer_intent else None
+    if question_stored is not None:
+        question_stored.wait(QUESTION_STORE_TIMEOUT_SECONDS)
+    try:
+        get_conversation_store().append(session_id, "free_history", "assistant", content, intent_id)
+    except Exception as exc:  # noqa: BLE001 - a store outage must not break the page that collects this job
+        METRICS.increment("chatbot.history.store_errors")
+        notice = f"The answer could not be saved to the conversation: {exc}"
+    candidates = list(result.candidates) if result is not None and not answer_intent else []
+    return {"intent_id": intent_id, "notice": notice, "candidates": candidates}
+
+
+def _collect_classification() -> None:
+    """Apply a finished background classification to this session; runs on every rerun of every page."""
+
+    job_id = st.session_state.get("pending_classification")
+    if not job_id:
+        return
+    future = JOBS.pop_finished(job_id)
+    if future is None:
+        if JOBS.get(job_id) is None:
+            # Unknown job (e.g. the worker restarted); stop waiting for it.
+            st.session_state.pop("pending_classification", None)
+        return
+    st.session_state.pop("pending_classification", None)
+    try:
+        outcome = future.result()
+    except Exception as exc:  # noqa: BLE001 - never let one failed job take down every page of the session
+        outcome = {"intent_id": None, "notice": f"Unexpected error while answering: {exc}", "candidates": []}
+    st.session_state["last_intent_id"] = outcome["intent_id"]
+    if outcome["notice"]:
+        st.session_state["free_text_notice"] = outcome["notice"]
+    st.session_state["free_text_candidates"] = outcome["candidates"]
+
+
+@st.fragment(run_every=0.5)
+def _render_pending_answer() -> None:
+    job_id = st.session_state.get("pending_classification")
+    future = JOBS.get(job_id) if job_id else None
+    if future is None or future.done():
+        # Full rerun so history, next-best questions and notices all pick up the answer.
+        st.rerun()
+    with st.chat_message("assistant"):
+        st.write("Looking for an approved answer…")
+
+
+def _render_candidates(response_bank: ResponseBank) -> None:
+    """One-click choices ranked for the last unmatched question; answered from the bank without another API call.
+
+    They stay in session state until one is picked or the next question is sent, so the click survives the rerun.
+    """
+
+    candidates = [response_bank.get_intent_by_id(intent_id) for intent_id in st.session_state.get("free_text_candidates", [])]
+    candidates = [intent for intent in candidates if intent]
+    if not candidates:
+        return
+
+    st.caption("Did you mean one of these?")
+    for intent in candidates:
+        label = intent.get("user_question", intent.get("display_name", "Question"))
+        if st.button(label, key=f"candidate-{intent['intent_id']}", use_container_width=True):
+            st.session_state.pop("free_text_candidates", None)
+            _handle_intent(intent, "free_history", response_bank)
+            st.session_state["last_intent_id"] = intent["intent_id"]
+            METRICS.increment("chatbot.candidates.accepted")
+            st.rerun()
+
+
+def _render_suggestions(user_input: str, response_bank: ResponseBank, classifier: IntentClassifier) -> None:
+    """Offer approved questions matching the text typed so far; picking one answers locally without an API call."""
+
+    suggestions = classifier.local_matcher.suggest(user_input) if user_input.strip() else []
+    if not suggestions:
+        return
+
+    st.caption("Did you mean")
+    for intent in suggestions:
+        label = intent.get("user_question", intent.get("display_name", "Question"))
+        if st.button(label, key=f"suggest-{intent['intent_id']}", use_container_width=True):
+            _handle_intent(intent, "free_history", response_bank)
+            st.session_state["last_intent_id"] = intent["intent_id"]
+            METRICS.increment("chatbot.typeahead.accepted")
+
+
 def _render_api_status(classifier: IntentClassifier) -> None:
     status = st.session_state.get("api_status", {})
     checked_at = st.session_state.get("api_status_checked_at")
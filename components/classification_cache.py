@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from components.config import env_float, env_int
+
+
+class ClassificationCache:
+    """Process-wide LRU of model classifications, partitioned by namespace (one per response bank)."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[(namespace, key)]
+                return None
+            self._entries.move_to_end((namespace, key))
+            return dict(value)
+
+    def put(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[(namespace, key)] = (time.monotonic(), dict(value))
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def size(self, namespace: Optional[str] = None) -> int:
+        with self._lock:
+            if namespace is None:
+                return len(self._entries)
+            return sum(1 for entry_namespace, _ in self._entries if entry_namespace == namespace)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+SHARED_CACHE = ClassificationCache(
+    max_entries=env_int("RSV_CLASSIFICATION_CACHE_SIZE", 1024),
+    ttl_seconds=env_float("RSV_CLASSIFICATION_CACHE_TTL", 86400.0),
+)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from components.config import env_float, env_int
+from components.local_matcher import normalize_text
+from components.metrics import METRICS, MetricsRegistry
+
+
+class ClassificationJobs:
+    """Bounded background pool for free-text classification so a slow model call never blocks a rerun.
+
+    Jobs are addressed by id, which the submitting session keeps in ``session_state`` and polls on later
+    reruns. Finished jobs that are never collected (the session went away) are dropped after
+    ``retain_seconds``.
+
+    A job submitted with an idempotency ``key`` (see ``submission_key``) is remembered for
+    ``dedup_seconds``, so a double-click or rerun that sends the same question again reuses it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_pending: int = 32,
+        retain_seconds: float = 600,
+        dedup_seconds: float = 10,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retain_seconds = retain_seconds
+        self.dedup_seconds = dedup_seconds
+        self.metrics = metrics or METRICS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, Tuple[float, Future]] = {}
+        self._recent: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="classify")
+        return self._executor
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return sum(1 for _, future in self._jobs.values() if not future.done())
+
+    def has_capacity(self) -> bool:
+        return self.in_flight() < self.max_pending
+
+    def duplicate_of(self, key: str) -> Optional[str]:
+        """Id of the job submitted under ``key`` within ``dedup_seconds`` (running, finished or already collected)."""
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.dedup_seconds:
+                return None
+        self.metrics.increment("classifier.jobs.suppressed")
+        return entry[1]
+
+    def submit(self, func: Callable[[], object], key: Optional[str] = None) -> Optional[str]:
+        """Queue ``func``; returns a job id, or ``None`` when ``max_pending`` jobs are already running."""
+        now = time.monotonic()
+        with self._lock:
+            for job_id, (submitted, future) in list(self._jobs.items()):
+                if future.done() and now - submitted > self.retain_seconds:
+                    del self._jobs[job_id]
+            for recent_key, (submitted, _) in list(self._recent.items()):
+                if now - submitted > self.dedup_seconds:
+                    del self._recent[recent_key]
+            if sum(1 for _, future in self._jobs.values() if not future.done()) >= self.max_pending:
+                self.metrics.increment("classifier.jobs.rejected")
+                return None
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = (now, self._pool().submit(func))
+            if key:
+                self._recent[key] = (now, job_id)
+        self.metrics.increment("classifier.jobs.submitted")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Future]:
+        with self._lock:
+            entry = self._jobs.get(job_id)
+        return entry[1] if entry else None
+
+    def pop_finished(self, job_id: str) -> Optional[Future]:
+        """Remove and return the job's future once it is done; ``None`` while it is still running or unknown."""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is None or not entry[1].done():
+                return None
+            del self._jobs[job_id]
+        self.metrics.observe("classifier.jobs.wait_ms", (time.monotonic() - entry[0]) * 1000)
+        return entry[1]
+
+
+def submission_key(session_id: str, message: str) -> str:
+    """Idempotency key for a Send: the same session sending the same (normalized) question."""
+    return hashlib.sha256(f"{session_id}\x1f{normalize_text(message)}".encode("utf-8")).hexdigest()
+
+
+JOBS = ClassificationJobs(
+    max_workers=env_int("RSV_CLASSIFY_WORKERS", 8),
+    max_pending=env_int("RSV_CLASSIFY_MAX_PENDING", 32),
+    dedup_seconds=env_float("RSV_SEND_DEDUP_SECONDS", 10),
+)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class ClassificationResult(BaseModel):
+    intent_id: str
+    confidence: float = Field(..., ge=0.0, le=1.0)
+    slots: Dict[str, str] = Field(default_factory=dict)
+    rationale: str
+    # Ranked approved intents offered as one-click choices when intent_id is __NO_MATCH__.
+    candidates: List[str] = Field(default_factory=list)
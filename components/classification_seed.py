@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from components.config import env_str
+from components.local_matcher import normalize_text
+from components.response_bank import ResponseBank
+
+SEED_ENV_VAR = "RSV_CLASSIFICATION_SEED"
+DEFAULT_SEED_PATH = Path(__file__).resolve().parent.parent / "data" / "classification_seed.json"
+SEED_VERSION = 1
+
+_TABLES: Dict[tuple, "SeedTable"] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+class SeedTable:
+    """Classifications computed at build time (``scripts/seed_cache.py``), looked up by normalized message.
+
+    The file holds one section per response bank fingerprint; a bank whose content has no section loads
+    empty (``stale``) so an edited bank never serves answers classified against old intents.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None, stale: bool = False):
+        self.entries = entries or {}
+        self.stale = stale
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, message: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(normalize_text(message))
+        return dict(entry) if entry else None
+
+    @classmethod
+    def load(cls, path: Path | str, response_bank: ResponseBank) -> "SeedTable":
+        seed_path = Path(path)
+        if not seed_path.exists():
+            return cls()
+        data = json.loads(seed_path.read_text(encoding="utf-8"))
+        section = data.get("banks", {}).get(response_bank.fingerprint) if data.get("version") == SEED_VERSION else None
+        if section is None:
+            return cls(stale=True)
+        allowed = set(response_bank.get_allowed_intent_ids())
+        entries = {entry["message"]: entry["result"] for entry in section["entries"] if entry["result"]["intent_id"] in allowed}
+        return cls(entries)
+
+    @classmethod
+    def for_bank(cls, response_bank: ResponseBank) -> "SeedTable":
+        """Shared per seed path and bank content, read once per process (``RSV_CLASSIFICATION_SEED`` overrides the path)."""
+        path = Path(env_str(SEED_ENV_VAR) or DEFAULT_SEED_PATH)
+        key = (str(path), response_bank.fingerprint)
+        with _TABLES_LOCK:
+            table = _TABLES.get(key)
+            if table is None:
+                try:
+                    table = cls.load(path, response_bank)
+                except (OSError, ValueError, KeyError):
+                    # A broken seed file only costs the warm start; classification still works without it.
+                    table = cls(stale=True)
+                _TABLES[key] = table
+            return table
+
+
+def build_seed(
+    bank_id: str,
+    response_bank: ResponseBank,
+    results: Iterable[Tuple[str, Dict[str, Any]]],
+    model: str,
+    source: str,
+    existing: Optional[Dict[str, Any]] = None,
+    keep_fingerprints: Iterable[str] = (),
+    min_confidence: float = 0.0,
+) -> Dict[str, Any]:
+    """Seed file payload with this bank's section replaced; no-matches and results below ``min_confidence`` are left out.
+
+    ``results`` are ``(message, ClassificationResult dict)`` pairs. Sections of ``existing`` are kept only for
+    ``keep_fingerprints`` (the other banks still deployed), so edited banks do not leave dead sections behind.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    for message, result in results:
+        normalized = normalize_text(message)
+        if normalized and result["intent_id"] != "__NO_MATCH__" and result["confidence"] >= min_confidence:
+            entries.setdefault(normalized, {"message": normalized, "result": result})
+
+    keep = set(keep_fingerprints)
+    banks = {}
+    if existing and existing.get("version") == SEED_VERSION:
+        banks = {fingerprint: section for fingerprint, section in existing.get("banks", {}).items() if fingerprint in keep}
+    banks[response_bank.fingerprint] = {
+        "bank_id": bank_id,
+        "model": model,
+        "source": source,
+        "entries": sorted(entries.values(), key=lambda entry: entry["message"]),
+    }
+    return {"version": SEED_VERSION, "banks": banks}
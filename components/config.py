@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+from typing import Optional, Tuple
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    value = os.getenv(name)
+    return value.strip() if value and value.strip() else default
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    value = env_str(name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
+
+
+def env_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    value = env_str(name)
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    value = env_str(name)
+    try:
+        return float(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def env_float_pair(name: str, default: Tuple[float, float]) -> Tuple[float, float]:
+    """Parse ``"low,high"`` settings such as confidence bands; malformed values fall back to ``default``."""
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        low, high = (float(part) for part in value.split(","))
+    except ValueError:
+        return default
+    return (low, high) if low <= high else default
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from components.config import env_float, env_str
+from components.session_memory import deep_sizeof
+
+CONVERSATION_STORE_ENV_VAR = "RSV_CONVERSATION_STORE"
+CONVERSATION_DB_ENV_VAR = "RSV_CONVERSATION_DB"
+DEFAULT_CONVERSATION_DB = "conversations.sqlite3"
+CONVERSATION_TTL_ENV_VAR = "RSV_CONVERSATION_TTL"
+DEFAULT_CONVERSATION_TTL_SECONDS = 24 * 3600
+# Expired rows are deleted at most this often, from whichever append comes first.
+PURGE_INTERVAL_SECONDS = 600
+
+Message = Dict[str, Optional[str]]
+
+
+class ConversationStore(ABC):
+    """Chat history keyed by a stable session id and a history name (``guided_history``/``free_history``).
+
+    Messages are read newest-last in pages so a long conversation is never loaded whole. ``in_process``
+    stores hold histories in server memory, so their ``session_bytes`` count toward the session memory cap.
+    """
+
+    in_process = False
+
+    def session_bytes(self, session_id: str) -> int:
+        """Server memory held by this session's histories (0 for stores that keep them elsewhere)."""
+        return 0
+
+    @abstractmethod
+    def append(self, session_id: str, history_key: str, role: str, content: str, intent_id: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    def count(self, session_id: str, history_key: str) -> int:
+        ...
+
+    @abstractmethod
+    def recent(self, session_id: str, history_key: str, limit: int) -> List[Message]:
+        """The last ``limit`` messages in chronological order."""
+
+    @abstractmethod
+    def has_answer(self, session_id: str, history_key: str, intent_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def clear(self, session_id: str) -> None:
+        ...
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Process-local store; the least recently written sessions are dropped past ``max_sessions``.
+
+    Each history keeps only its last ``max_messages`` messages, so one long-lived tab cannot grow without bound.
+    """
+
+    in_process = True
+
+    def __init__(self, max_sessions: int = 1000, max_messages: int = 200):
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self._sessions: "OrderedDict[str, Dict[str, List[Message]]]" = OrderedDict()
+        self._bytes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def append(self, session_id: str, history_key: str, role: str, content: str, intent_id: Optional[str] = None) -> None:
+        message = {"role": role, "content": content, "intent_id": intent_id}
+        with self._lock:
+            histories = self._sessions.setdefault(session_id, {})
+            self._sessions.move_to_end(session_id)
+            history = histories.setdefault(history_key, [])
+            history.append(message)
+            size = self._bytes.get(session_id, 0) + deep_sizeof(message)
+            while len(history) > self.max_messages:
+                size -= deep_sizeof(history.pop(0))
+            self._bytes[session_id] = size
+            while len(self._sessions) > self.max_sessions:
+                self._bytes.pop(self._sessions.popitem(last=False)[0], None)
+
+    def session_bytes(self, session_id: str) -> int:
+        with self._lock:
+            return self._bytes.get(session_id, 0)
+
+    def _history(self, session_id: str, history_key: str) -> List[Message]:
+        return self._sessions.get(session_id, {}).get(history_key, [])
+
+    def count(self, session_id: str, history_key: str) -> int:
+        with self._lock:
+            return len(self._history(session_id, history_key))
+
+    def recent(self, session_id: str, history_key: str, limit: int) -> List[Message]:
+        with self._lock:
+            return [dict(message) for message in self._history(session_id, history_key)[-limit:]] if limit > 0 else []
+
+    def has_answer(self, session_id: str, history_key: str, intent_id: str) -> bool:
+        with self._lock:
+            return any(
+                message["intent_id"] == intent_id and message["role"] == "assistant"
+                for message in self._history(session_id, history_key)
+            )
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._bytes.pop(session_id, None)
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Local SQLite file shared by every worker on the host, keeping history out of worker memory.
+
+    This is a bounded-retention store, not a resumable history: the conversation id lives only in the
+    browser session's state, so a new tab or a restart starts a new conversation. Messages older than
+    ``ttl_seconds`` are deleted by ``purge_expired``, which runs on open and then from ``append`` at most
+    every ``PURGE_INTERVAL_SECONDS``.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            history_key TEXT NOT NULL,
+            role TEXT NOT NULL,
+            content TEXT NOT NULL,
+            intent_id TEXT,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS messages_by_history ON messages (session_id, history_key, id);
+        CREATE INDEX IF NOT EXISTS messages_by_age ON messages (created_at);
+    """
+
+    def __init__(self, path: Path | str, ttl_seconds: float = DEFAULT_CONVERSATION_TTL_SECONDS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+        self._next_purge = 0.0
+        self.purge_expired()
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Delete messages older than ``ttl_seconds``; returns how many were removed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._next_purge = now + PURGE_INTERVAL_SECONDS
+            return self._conn.execute("DELETE FROM messages WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+
+    def append(self, session_id: str, history_key: str, role: str, content: str, intent_id: Optional[str] = None) -> None:
+        now = time.time()
+        if now >= self._next_purge:
+            self.purge_expired(now)
+        self._query(
+            "INSERT INTO messages (session_id, history_key, role, content, intent_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (session_id, history_key, role, content, intent_id, now),
+        )
+
+    def count(self, session_id: str, history_key: str) -> int:
+        return self._query("SELECT COUNT(*) FROM messages WHERE session_id = ? AND history_key = ?", (session_id, history_key))[0][0]
+
+    def recent(self, session_id: str, history_key: str, limit: int) -> List[Message]:
+        rows = self._query(
+            "SELECT role, content, intent_id FROM messages WHERE session_id = ? AND history_key = ? ORDER BY id DESC LIMIT ?",
+            (session_id, history_key, max(limit, 0)),
+        )
+        return [{"role": role, "content": content, "intent_id": intent_id} for role, content, intent_id in reversed(rows)]
+
+    def has_answer(self, session_id: str, history_key: str, intent_id: str) -> bool:
+        rows = self._query(
+            "SELECT 1 FROM messages WHERE session_id = ? AND history_key = ? AND intent_id = ? AND role = 'assistant' LIMIT 1",
+            (session_id, history_key, intent_id),
+        )
+        return bool(rows)
+
+    def clear(self, session_id: str) -> None:
+        self._query("DELETE FROM messages WHERE session_id = ?", (session_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_STORE: Optional[ConversationStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_conversation_store() -> ConversationStore:
+    """Process-wide store: ``RSV_CONVERSATION_STORE=sqlite`` (file at ``RSV_CONVERSATION_DB``, messages kept for
+    ``RSV_CONVERSATION_TTL`` seconds) or in-memory."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            if (env_str(CONVERSATION_STORE_ENV_VAR, "memory") or "memory").lower() == "sqlite":
+                _STORE = SQLiteConversationStore(
+                    env_str(CONVERSATION_DB_ENV_VAR, DEFAULT_CONVERSATION_DB),
+                    ttl_seconds=env_float(CONVERSATION_TTL_ENV_VAR, DEFAULT_CONVERSATION_TTL_SECONDS),
+                )
+            else:
+                _STORE = InMemoryConversationStore()
+        return _STORE
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+EVENT_LOG_ENV_VAR = "RSV_EVENT_LOG"
+
+
+class EventLog:
+    """Append-only JSON-lines log of classifier events for offline analysis."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["EventLog"]:
+        """Return a log writing to ``RSV_EVENT_LOG`` when it is set; logging stays off otherwise."""
+        path = os.getenv(EVENT_LOG_ENV_VAR)
+        return cls(path) if path else None
+
+    def record(self, event: str, **fields: Any) -> None:
+        entry = {"event": event, "ts": datetime.now(timezone.utc).isoformat(), **fields}
+        line = json.dumps(entry, ensure_ascii=False)
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError:
+            # Logging must never break the chat experience.
+            return
+
+
+def read_events(path: Path | str, event: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield logged entries, optionally filtered by event name. Malformed lines are skipped."""
+    log_path = Path(path)
+    if not log_path.exists():
+        return
+    with log_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                entry = json.loads(stripped)
+            except json.JSONDecodeError:
+                continue
+            if event is None or entry.get("event") == event:
+                yield entry
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from components.metrics import METRICS, MetricsRegistry
+
+T = TypeVar("T")
+
+MAX_WORKERS = 16
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SLOTS = threading.BoundedSemaphore(MAX_WORKERS)
+_HEDGERS: Dict[str, "Hedger"] = {}
+_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="hedge")
+        return _EXECUTOR
+
+
+def _submit(func: Callable[[], T]) -> Optional[Future]:
+    """Run ``func`` on an idle hedge worker, or return ``None`` when all are busy (never queue)."""
+    if not _SLOTS.acquire(blocking=False):
+        return None
+    try:
+        future = _executor().submit(func)
+    except BaseException:
+        _SLOTS.release()
+        raise
+    future.add_done_callback(lambda _: _SLOTS.release())
+    return future
+
+
+class HedgeAttempt:
+    """Handed to each attempt so the one that loses can be stopped instead of running to completion.
+
+    Attempts check ``cancelled`` between units of work and register ``on_cancel`` callbacks (such as
+    closing their response stream) for work that cannot be polled.
+    """
+
+    def __init__(self) -> None:
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001 - the attempt is being abandoned either way
+                pass
+
+
+class Hedger:
+    """Issues a second identical call when the first is slower than ``delay``; the first result wins.
+
+    ``delay_ms`` is either a fixed number of milliseconds or ``"pNN"`` to follow the observed
+    latency percentile of single attempts. A token bucket refilled by ``max_hedge_ratio`` per call
+    keeps the share of hedged calls (and therefore extra spend) bounded.
+
+    Attempts receive a ``HedgeAttempt``; the losing one is cancelled so it can stop early. Attempts
+    only run on the shared pool while a worker is free: a saturated pool runs the call unhedged on
+    the caller's thread rather than queueing it behind other sessions.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        delay_ms: float | str = "p95",
+        max_hedge_ratio: float = 0.1,
+        min_samples: int = 20,
+        burst: float = 3.0,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.name = name
+        self.delay_ms = delay_ms
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.burst = burst
+        self.metrics = metrics or METRICS
+        self._tokens = burst
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def _metric(self, suffix: str) -> str:
+        return f"hedge.{self.name}.{suffix}"
+
+    def current_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while there is not enough latency history."""
+        if isinstance(self.delay_ms, (int, float)):
+            return float(self.delay_ms) / 1000
+        if self._samples < self.min_samples:
+            return None
+        observed = self.metrics.percentile(self._metric("attempt_ms"), float(str(self.delay_ms).lstrip("p")))
+        return observed / 1000 if observed is not None else None
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def _has_token(self) -> bool:
+        with self._lock:
+            return self._tokens >= 1.0
+
+    def _refill(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.max_hedge_ratio)
+
+    def _attempt(self, func: Callable[[HedgeAttempt], T], attempt: HedgeAttempt) -> Callable[[], T]:
+        def run() -> T:
+            started = time.perf_counter()
+            try:
+                return func(attempt)
+            finally:
+                if not attempt.cancelled:
+                    # A cancelled attempt's duration says nothing about the endpoint's latency.
+                    self.metrics.observe(self._metric("attempt_ms"), (time.perf_counter() - started) * 1000)
+                    with self._lock:
+                        self._samples += 1
+
+        return run
+
+    def call(self, func: Callable[[HedgeAttempt], T]) -> T:
+        self.metrics.increment(self._metric("calls"))
+        self._refill()
+        delay = self.current_delay()
+        primary_attempt = HedgeAttempt()
+        if delay is None:
+            return self._attempt(func, primary_attempt)()
+        if not self._has_token():
+            # No hedge could be issued, so there is no reason to leave the caller's thread.
+            started = time.perf_counter()
+            try:
+                return self._attempt(func, primary_attempt)()
+            finally:
+                if time.perf_counter() - started > delay:
+                    self.metrics.increment(self._metric("suppressed"))
+
+        primary_started = time.perf_counter()
+        primary = _submit(self._attempt(func, primary_attempt))
+        if primary is None:
+            self.metrics.increment(self._metric("saturated"))
+            return self._attempt(func, primary_attempt)()
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self._take_token():
+            self.metrics.increment(self._metric("suppressed"))
+            return primary.result()
+
+        hedge_attempt = HedgeAttempt()
+        hedge = _submit(self._attempt(func, hedge_attempt))
+        if hedge is None:
+            self.metrics.increment(self._metric("saturated"))
+            return primary.result()
+        self.metrics.increment(self._metric("issued"))
+        return self._first_success((primary, primary_attempt), (hedge, hedge_attempt), primary_started)
+
+    def _estimate_saved_ms(self, primary_elapsed_ms: float) -> Optional[float]:
+        """Latency saved by a winning hedge, judged when it wins.
+
+        The cancelled primary never reports how long it would have taken, so its full latency is estimated
+        as the median of recorded attempts that ran longer than it already had. ``None`` when none did.
+        """
+        slower = sorted(sample for sample in self.metrics.samples(self._metric("attempt_ms")) if sample > primary_elapsed_ms)
+        if not slower:
+            return None
+        return slower[len(slower) // 2] - primary_elapsed_ms
+
+    def _first_success(self, primary: Tuple[Future, HedgeAttempt], hedge: Tuple[Future, HedgeAttempt], primary_started: float) -> T:
+        done, _ = wait([primary[0], hedge[0]], return_when=FIRST_COMPLETED)
+        winner, loser = (primary, hedge) if primary[0] in done else (hedge, primary)
+        if winner[0].exception() is not None:
+            # The fastest attempt failed; the other one may still succeed.
+            wait([loser[0]])
+            if loser[0].exception() is None:
+                winner, loser = loser, winner
+
+        if winner is hedge and winner[0].exception() is None:
+            self.metrics.increment(self._metric("wins"))
+            saved = self._estimate_saved_ms((time.perf_counter() - primary_started) * 1000)
+            if saved is not None:
+                self.metrics.observe(self._metric("saved_ms"), saved)
+        # Stop the loser: a queued attempt is dropped and a running one closes its request (billing stops there).
+        loser[0].cancel()
+        loser[1].cancel()
+        return winner[0].result()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        calls = self.metrics.counter(self._metric("calls"))
+        issued = self.metrics.counter(self._metric("issued"))
+        delay = self.current_delay()
+        return {
+            "calls": calls,
+            "hedged": issued,
+            "hedge_rate": issued / calls if calls else None,
+            "hedge_wins": self.metrics.counter(self._metric("wins")),
+            "suppressed": self.metrics.counter(self._metric("suppressed")),
+            "saturated": self.metrics.counter(self._metric("saturated")),
+            "current_delay_ms": delay * 1000 if delay is not None else None,
+            "saved_p50_ms": self.metrics.percentile(self._metric("saved_ms"), 50),
+            "saved_p95_ms": self.metrics.percentile(self._metric("saved_ms"), 95),
+        }
+
+
+def shared_hedger(name: str, **options) -> Hedger:
+    """Process-wide hedger per name so the rate budget and latency history survive Streamlit reruns."""
+    with _LOCK:
+        hedger = _HEDGERS.get(name)
+        if hedger is None:
+            hedger = _HEDGERS[name] = Hedger(name, **options)
+        return hedger
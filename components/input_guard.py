@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional
+
+from components.config import env_int, env_str
+
+OVERSIZE_POLICIES = ("truncate", "reject")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting before a call."""
+    return len(text) // 4 + 1
+
+
+def clean_text(text: str) -> str:
+    """NFKC-normalize, turn control and format characters into spaces and collapse whitespace."""
+    normalized = unicodedata.normalize("NFKC", text)
+    cleaned = "".join(" " if unicodedata.category(char) in {"Cc", "Cf"} else char for char in normalized)
+    return _WHITESPACE.sub(" ", cleaned).strip()
+
+
+@dataclass
+class GuardedInput:
+    original: str
+    cleaned: str  # full cleaned text, used for the emergency scan
+    text: str  # what is sent for classification
+    truncated: bool = False
+    rejected: bool = False
+    notice: Optional[str] = None
+
+
+class InputGuard:
+    """Bounds what a free-text message may cost before it reaches the prompt.
+
+    Messages over ``max_chars`` characters or ``max_tokens`` estimated tokens are cut at a word boundary
+    (``policy="truncate"``) or refused (``policy="reject"``).
+    """
+
+    def __init__(self, max_chars: int = 1000, max_tokens: int = 256, policy: str = "truncate"):
+        self.max_chars = max_chars
+        self.max_tokens = max_tokens
+        self.policy = policy if policy in OVERSIZE_POLICIES else "truncate"
+
+    @classmethod
+    def from_env(cls) -> "InputGuard":
+        return cls(
+            max_chars=env_int("RSV_MAX_MESSAGE_CHARS", 1000),
+            max_tokens=env_int("RSV_MAX_MESSAGE_TOKENS", 256),
+            policy=env_str("RSV_OVERSIZE_POLICY", "truncate").lower(),
+        )
+
+    @property
+    def limit_chars(self) -> int:
+        """The effective cap: the character limit or the token limit at ~4 characters per token, whichever is lower."""
+        return min(self.max_chars, self.max_tokens * 4)
+
+    def check(self, message: str) -> GuardedInput:
+        cleaned = clean_text(message)
+        if not cleaned:
+            return GuardedInput(message, cleaned, cleaned, rejected=True, notice="Type a question to send.")
+        if len(cleaned) <= self.limit_chars:
+            return GuardedInput(message, cleaned, cleaned)
+        if self.policy == "reject":
+            return GuardedInput(
+                message,
+                cleaned,
+                "",
+                rejected=True,
+                notice=f"Your question is too long ({len(cleaned):,} characters). Please keep it under {self.limit_chars:,} characters.",
+            )
+        cut = cleaned[: self.limit_chars]
+        if " " in cut and not cleaned[self.limit_chars : self.limit_chars + 1].isspace():
+            cut = cut.rsplit(" ", 1)[0]
+        return GuardedInput(
+            message,
+            cleaned,
+            cut.rstrip(),
+            truncated=True,
+            notice=f"Only the first {len(cut):,} characters of your question were used.",
+        )
@@ -2,19 +2,48 @@ from __future__ import annotations
 
 import json
 import os
+import re
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-
-from openai import APIConnectionError, APIStatusError, APITimeoutError, AuthenticationError, OpenAI, OpenAIError
-from pydantic import BaseModel, Field, ValidationError
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
+from components.classification_cache import SHARED_CACHE, ClassificationCache
+from components.classification_seed import SeedTable
+from components.config import env_bool, env_float, env_float_pair, env_int, env_str
+from components.event_log import EventLog
+from components.input_guard import InputGuard, clean_text, estimate_tokens
+from components.local_matcher import LocalMatcher, normalize_text
+from components.metrics import METRICS, MetricsRegistry
 from components.response_bank import ResponseBank
+from components.usage import USAGE, CallContext, UsageTracker, extract_usage
+
+# openai, pydantic and python-dotenv are imported on first free-text use or connectivity check so
+# guided-only page loads never pay for them (see tests/test_import_budget.py).
+if TYPE_CHECKING:  # pragma: no cover
+    from openai import OpenAI
+
+    from components.hedging import HedgeAttempt, Hedger
+
+    from components.classification_schema import ClassificationResult
+    from components.shadow import ShadowEvaluator
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ClassificationResult":
+        from components.classification_schema import ClassificationResult
 
-try:
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover - fallback when dependency isn't installed
-    def load_dotenv() -> bool:
+        return ClassificationResult
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_dotenv() -> bool:
+    try:
+        from dotenv import load_dotenv as _load_dotenv
+    except ImportError:  # pragma: no cover - fallback when dependency isn't installed
         env_path = Path(".env")
         if not env_path.exists():
             return False
@@ -27,13 +56,44 @@ except ImportError:  # pragma: no cover - fallback when dependency isn't install
             key, value = stripped.split("=", 1)
             os.environ.setdefault(key.strip(), value.strip().strip("'\""))
         return True
+    return _load_dotenv()
+
+
+DEFAULT_ESCALATION_BAND = (0.5, 0.85)
+OUTPUT_FORMATS = ("json", "compact")
+COMPACT_NO_MATCH_CODE = 0
+# How many ranked intents a no-match offers as one-click choices.
+NO_MATCH_CANDIDATES = 3
+# Only answers that came from the model are shadowed; local, seed and follow-up hits would agree trivially.
+SHADOW_SOURCES = ("llm", "cache")
+# Follow-ups are answered locally when the best next-best question overlaps this much and leads the runner-up clearly.
+FOLLOW_UP_MIN_SCORE = 0.2
+FOLLOW_UP_MIN_MARGIN = 0.1
+FOLLOW_UP_CONFIDENCE = 0.9
+FOLLOW_UP_MAX_WORDS = 8
+_FOLLOW_UP_OPENERS = ("and ", "also ", "but ", "what about ", "how about ", "same for ", "what if ")
+_COMPACT_ANSWER = re.compile(r"^\s*(\d+)\s*[,;: ]\s*([0-9]*\.?[0-9]+)")
+
+_SYSTEM_PROMPT_CACHE: Dict[str, str] = {}
+_SYSTEM_PROMPT_LOCK = threading.Lock()
+_UNSET: Any = object()
+_CLASSIFIERS: Dict[str, "IntentClassifier"] = {}
+_CLASSIFIERS_LOCK = threading.Lock()
 
 
-class ClassificationResult(BaseModel):
-    intent_id: str
-    confidence: float = Field(..., ge=0.0, le=1.0)
-    slots: Dict[str, str] = Field(default_factory=dict)
-    rationale: str
+@lru_cache(maxsize=4)
+def get_shared_client(api_key: str, base_url: Optional[str] = None, timeout: Optional[float] = None, max_retries: Optional[int] = None) -> OpenAI:
+    """One client per endpoint and key for the whole process so every page and rerun reuses the same connection pool."""
+    from openai import OpenAI
+
+    options: Dict[str, Any] = {"api_key": api_key}
+    if base_url:
+        options["base_url"] = base_url
+    if timeout is not None:
+        options["timeout"] = timeout
+    if max_retries is not None:
+        options["max_retries"] = max_retries
+    return OpenAI(**options)
 
 
 class IntentClassifier:
@@ -43,19 +103,117 @@ class IntentClassifier:
         model: str = "gpt-4.1-mini",
         confidence_threshold: float = 0.7,
         client: Optional[OpenAI] = None,
+        event_log: Optional[EventLog] = None,
+        escalation_model: Optional[str] = None,
+        escalation_band: Optional[Tuple[float, float]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        base_url: Optional[str] = None,
+        hedge_delay_ms: Optional[float | str] = None,
+        hedge_max_ratio: Optional[float] = None,
+        cache: Optional[ClassificationCache] = None,
+        usage: Optional[UsageTracker] = None,
+        streaming: Optional[bool] = None,
+        output_format: Optional[str] = None,
+        input_guard: Optional[InputGuard] = None,
+        shadow: Optional["ShadowEvaluator"] = _UNSET,
     ):
-        load_dotenv()
         self.response_bank = response_bank
+        self.local_matcher = LocalMatcher.for_bank(response_bank)
+        # Build-time classifications of common phrasings (scripts/seed_cache.py), so a fresh deploy starts warm.
+        self.seed = SeedTable.for_bank(response_bank)
+        # Cached answers are namespaced by bank content so locales and programs never share entries.
+        self.cache = cache if cache is not None else SHARED_CACHE
+        self.event_log = event_log if event_log is not None else EventLog.from_env()
+        self.metrics = metrics or METRICS
+        self.usage = usage or USAGE
         self.model = model
         self.confidence_threshold = confidence_threshold
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        self.client: Optional[OpenAI] = client or (OpenAI(api_key=self.api_key) if self.api_key else None)
+        # Cascade: answers from ``model`` whose confidence falls inside the band are re-asked to ``escalation_model``.
+        self.escalation_model = escalation_model or env_str("RSV_ESCALATION_MODEL")
+        self.escalation_band = escalation_band or env_float_pair("RSV_ESCALATION_BAND", DEFAULT_ESCALATION_BAND)
+        # Point at any OpenAI-compatible endpoint, e.g. the bundled mock server (scripts/mock_openai_server.py).
+        self.base_url = base_url or env_str("OPENAI_BASE_URL")
+        # Hedging: a duplicate request is sent when the first is slower than a fixed delay or a "pNN" percentile.
+        self.hedge_delay_ms = _parse_hedge_delay(hedge_delay_ms if hedge_delay_ms is not None else env_str("RSV_HEDGE_DELAY_MS"))
+        self.hedge_max_ratio = hedge_max_ratio if hedge_max_ratio is not None else env_float("RSV_HEDGE_MAX_RATIO", 0.1)
+        # Streaming: stop reading the completion once intent_id and confidence have arrived.
+        self.streaming = streaming if streaming is not None else env_bool("RSV_STREAMING")
+        # "compact": intents are numbered in the prompt and the model answers "<code> <confidence>" only.
+        requested_format = (output_format or env_str("RSV_OUTPUT_FORMAT", "json")).lower()
+        self.output_format = requested_format if requested_format in OUTPUT_FORMATS else "json"
+        # Caps message size (and so prompt tokens) before classification; see components/input_guard.py.
+        self.input_guard = input_guard or InputGuard.from_env()
+        # Shadow mode: a sample of messages is also classified by a candidate off the request path (RSV_SHADOW_RATE).
+        self.shadow = _shadow_from_env(response_bank, self.metrics, self.event_log) if shadow is _UNSET else shadow
+        self._api_key: Optional[str] = _UNSET
+        self._client: Optional[OpenAI] = client if client is not None else _UNSET
         self._last_connectivity_check: Optional[datetime] = None
         self._last_connectivity_ok: Optional[bool] = None
         self._last_connectivity_message: Optional[str] = None
 
+    @classmethod
+    def for_bank(cls, response_bank: ResponseBank) -> "IntentClassifier":
+        """Shared classifier per bank content with settings from the environment, built once per process."""
+        with _CLASSIFIERS_LOCK:
+            classifier = _CLASSIFIERS.get(response_bank.fingerprint)
+            if classifier is None:
+                classifier = _CLASSIFIERS[response_bank.fingerprint] = cls(response_bank=response_bank)
+            return classifier
+
+    @property
+    def api_key(self) -> Optional[str]:
+        if self._api_key is _UNSET:
+            load_dotenv()
+            self._api_key = os.getenv("OPENAI_API_KEY")
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]) -> None:
+        self._api_key = value
+
+    @property
+    def client(self) -> Optional[OpenAI]:
+        """The OpenAI client, created on first use so guided-only sessions never import ``openai``."""
+        if self._client is _UNSET:
+            self._client = (
+                get_shared_client(
+                    self.api_key,
+                    base_url=self.base_url,
+                    timeout=env_float("RSV_OPENAI_TIMEOUT"),
+                    max_retries=env_int("RSV_OPENAI_MAX_RETRIES"),
+                )
+                if self.api_key
+                else None
+            )
+            self._client = self._wrap_with_cassette(self._client)
+        return self._client
+
+    @client.setter
+    def client(self, value: Optional[OpenAI]) -> None:
+        self._client = value
+
+    @staticmethod
+    def _cassette_configured() -> bool:
+        return bool(env_str("RSV_CASSETTE"))
+
+    @classmethod
+    def _wrap_with_cassette(cls, client: Optional[OpenAI]) -> Optional[OpenAI]:
+        """Record or replay model traffic when ``RSV_CASSETTE`` is set (tests, benchmarks, offline demos)."""
+        if not cls._cassette_configured():
+            return client
+        from components.cassette import Cassette, CassetteClient
+
+        return CassetteClient(Cassette.from_env(), inner=client)
+
     def has_api_key(self) -> bool:
-        return self.client is not None
+        """Whether free text can reach a model: an API key, a configured cassette or an injected client.
+
+        Before the client is built this applies the ``client`` property's own rule (a cassette always yields a
+        client, otherwise the key decides) so guided-only reruns can ask without importing ``openai``.
+        """
+        if self._client is _UNSET:
+            return self._cassette_configured() or bool(self.api_key)
+        return self._client is not None
 
     def _load_env_file(self, path: Path | str = ".env") -> None:
         env_path = Path(path)
@@ -103,6 +261,8 @@ class IntentClassifier:
         if not self.client:
             return "error", "OpenAI client is unavailable."
 
+        from openai import APIConnectionError, APIStatusError, APITimeoutError, AuthenticationError, OpenAIError
+
         try:
             self.client.models.list()
             return "ok", "API key loaded and reachable."
@@ -118,6 +278,8 @@ class IntentClassifier:
             return "error", f"Unexpected validation error: {exc}"
 
     def _hard_rule_override(self, message: str) -> Optional[ClassificationResult]:
+        from components.classification_schema import ClassificationResult
+
         lowered = message.lower()
         emergency_terms = [
             "emergency",
@@ -142,11 +304,25 @@ class IntentClassifier:
                 )
         return None
 
+    def emergency_match(self, message: str) -> Optional[ClassificationResult]:
+        """The hard-rule answer for ``message``, scanning both the raw and the cleaned text however long it is."""
+        return self._hard_rule_override(message) or self._hard_rule_override(clean_text(message))
+
     def _build_system_prompt(self) -> str:
+        cache_key = f"{self.response_bank.fingerprint}:{self.output_format}"
+        prompt = _SYSTEM_PROMPT_CACHE.get(cache_key)
+        if prompt is None:
+            render = self._render_compact_prompt if self.output_format == "compact" else self._render_system_prompt
+            with _SYSTEM_PROMPT_LOCK:
+                prompt = _SYSTEM_PROMPT_CACHE.setdefault(cache_key, render())
+        return prompt
+
+    def _render_system_prompt(self) -> str:
         lines = [
             "You classify user RSV questions into intents and never provide medical advice.",
             "Select the best intent_id from the approved list. If nothing fits, return __NO_MATCH__.",
             "Use only the JSON schema supplied and avoid additional text.",
+            "Return the keys in this order: intent_id, confidence, slots, rationale.",
             "Allowed intents:",
         ]
         for intent in self.response_bank.intents:
@@ -159,24 +335,126 @@ class IntentClassifier:
         ])
         return "\n".join(lines)
 
-    def classify(self, message: str) -> ClassificationResult:
-        hard_rule = self._hard_rule_override(message)
-        if hard_rule:
-            return hard_rule
+    def _render_compact_prompt(self) -> str:
+        lines = [
+            "You classify user RSV questions into intents and never provide medical advice.",
+            f"Pick the code of the best intent below, or {COMPACT_NO_MATCH_CODE} if nothing fits. Never invent codes.",
+            "Reply with only the code and your confidence between 0 and 1, separated by a space, e.g. \"3 0.92\".",
+            "Intents:",
+        ]
+        for code, intent in enumerate(self.response_bank.intents, start=1):
+            lines.append(f"{code}: {intent.get('user_question')} (examples: {', '.join(intent.get('sample_user_phrases', []))})")
+        return "\n".join(lines)
 
-        if not self.client:
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale="Add an OPENAI_API_KEY to a local .env file or environment variable, then restart the app.",
-            )
+    def _parse_compact_answer(self, text: str) -> ClassificationResult:
+        """Map ``"<code> <confidence>"`` back to a full result; raises ``ValueError`` on anything else."""
+        from components.classification_schema import ClassificationResult
+
+        match = _COMPACT_ANSWER.match(text or "")
+        if not match:
+            raise ValueError(f"Unrecognised compact answer: {text!r}")
+        code, confidence = int(match.group(1)), float(match.group(2))
+        intents = self.response_bank.intents
+        intent_id = intents[code - 1]["intent_id"] if 1 <= code <= len(intents) else "__NO_MATCH__"
+        return ClassificationResult(intent_id=intent_id, confidence=confidence, slots={}, rationale=f"Compact answer code {code}")
+
+    def _local_match(self, message: str) -> Optional[ClassificationResult]:
+        intent_id = self.local_matcher.exact_match(message)
+        if not intent_id:
+            return None
+        from components.classification_schema import ClassificationResult
+
+        return ClassificationResult(
+            intent_id=intent_id,
+            confidence=1.0,
+            slots={},
+            rationale="Matched an approved phrasing from the response bank",
+        )
+
+    def _seed_match(self, message: str) -> Optional[ClassificationResult]:
+        entry = self.seed.lookup(message)
+        if entry is None:
+            return None
+        from components.classification_schema import ClassificationResult
+
+        result = self._apply_guards(ClassificationResult.model_validate(entry))
+        if result.intent_id == "__NO_MATCH__":
+            return None
+        self.metrics.increment("classifier.seed.hits")
+        return result
+
+    def _resolve_follow_up(self, message: str, previous_intent_id: str) -> Optional[ClassificationResult]:
+        """Answer locally when one of the previous intent's next-best questions clearly wins on word overlap.
+
+        The winner must clear the other next-best questions by a margin and also beat every other intent in
+        the bank, so a follow-up that reads better as a different topic still goes to the model.
+        """
+        next_best = {intent["intent_id"] for intent in self.response_bank.get_next_best(previous_intent_id)}
+        scores = self.local_matcher.scores(message)
+        candidates = [(intent_id, score) for intent_id, score in scores if intent_id in next_best]
+        if not candidates:
+            return None
+        winner_id, winner_score = candidates[0]
+        if winner_score < FOLLOW_UP_MIN_SCORE:
+            return None
+        if len(candidates) > 1 and winner_score - candidates[1][1] < FOLLOW_UP_MIN_MARGIN:
+            return None
+        best_elsewhere = next((score for intent_id, score in scores if intent_id not in next_best), 0.0)
+        if winner_score <= best_elsewhere:
+            return None
+        from components.classification_schema import ClassificationResult
 
-        system_prompt = self._build_system_prompt()
+        return ClassificationResult(
+            intent_id=winner_id,
+            confidence=FOLLOW_UP_CONFIDENCE,
+            slots={},
+            rationale=f"Follow-up resolved against the next-best questions of {previous_intent_id}",
+        )
 
+    def _with_previous_topic(self, message: str, previous_intent_id: str) -> str:
+        question = self.response_bank.get_intent_by_id(previous_intent_id).get("user_question", previous_intent_id)
+        return f'{message}\n\n(Follow-up to the previous answer about: "{question}")'
+
+    def _record_classification(self, message: str, result: ClassificationResult, source: str, model: Optional[str] = None) -> None:
+        if not self.event_log:
+            return
+        self.event_log.record(
+            "classification",
+            message=message,
+            intent_id=result.intent_id,
+            confidence=result.confidence,
+            source=source,
+            model=model,
+        )
+
+    def _query_model(
+        self,
+        model: str,
+        system_prompt: str,
+        message: str,
+        context: Optional[CallContext] = None,
+        attempt: Optional[HedgeAttempt] = None,
+    ) -> ClassificationResult:
+        """Ask ``model`` for a classification; raises ``_ModelCallError`` carrying a user-facing fallback."""
+
+        from pydantic import ValidationError
+
+        from components.classification_schema import ClassificationResult
+
+        if attempt is not None:
+            # Hedged attempts always go over a stream: the SDK cannot abort a plain request, but closing a
+            # stream ends the losing attempt (and its billed output) as soon as the other one wins.
+            return self._query_model_streaming(model, system_prompt, message, context, attempt)
+        if self.output_format == "compact":
+            # Compact answers are a handful of tokens, so they are never streamed.
+            return self._query_model_compact(model, system_prompt, message, context)
+        if self.streaming:
+            return self._query_model_streaming(model, system_prompt, message, context)
+
+        started = time.perf_counter()
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": message},
@@ -188,7 +466,7 @@ class IntentClassifier:
             # Some client versions do not support response_format; fall back to plain JSON instructions.
             try:
                 response = self.client.chat.completions.create(
-                    model=self.model,
+                    model=model,
                     messages=[
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": message},
@@ -197,65 +475,460 @@ class IntentClassifier:
                 )
                 parsed_text = response.choices[0].message.content or ""
             except Exception as exc:  # noqa: BLE001
-                return ClassificationResult(
-                    intent_id="__NO_MATCH__",
-                    confidence=0.0,
-                    slots={},
-                    rationale=f"OpenAI call failed: {exc}",
-                )
-        except AuthenticationError:
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale="OpenAI rejected the API key. Double-check OPENAI_API_KEY in your environment or .env file.",
-            )
-        except (APIConnectionError, APITimeoutError):
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale="Unable to reach OpenAI. Check your internet/VPN connection and try again.",
-            )
-        except APIStatusError as exc:
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale=f"OpenAI request failed ({exc.status_code}). Please try again shortly.",
-            )
-        except OpenAIError as exc:
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale=f"OpenAI call failed: {exc}",
-            )
+                raise _ModelCallError(_no_match(f"OpenAI call failed: {exc}")) from exc
         except Exception as exc:  # noqa: BLE001
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale=f"Unexpected OpenAI error: {exc}",
-            )
+            raise _openai_failure(exc) from exc
 
+        candidate: Optional[ClassificationResult] = None
         try:
             candidate = ClassificationResult.model_validate(json.loads(parsed_text))
-        except (json.JSONDecodeError, ValidationError):
-            return ClassificationResult(
-                intent_id="__NO_MATCH__",
-                confidence=0.0,
-                slots={},
-                rationale="Could not parse model output",
+            return candidate
+        except (json.JSONDecodeError, ValidationError) as exc:
+            raise _ModelCallError(_no_match("Could not parse model output")) from exc
+        finally:
+            self._record_usage(model, response, started, context, candidate)
+
+    def _query_model_compact(self, model: str, system_prompt: str, message: str, context: Optional[CallContext]) -> ClassificationResult:
+        from pydantic import ValidationError
+
+        started = time.perf_counter()
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": message},
+                ],
             )
+            answer_text = response.choices[0].message.content or ""
+        except Exception as exc:  # noqa: BLE001
+            raise _openai_failure(exc) from exc
 
+        candidate: Optional[ClassificationResult] = None
+        try:
+            candidate = self._parse_compact_answer(answer_text)
+            return candidate
+        except (ValueError, ValidationError) as exc:
+            raise _ModelCallError(_no_match("Could not parse model output")) from exc
+        finally:
+            self._record_usage(model, response, started, context, candidate)
+
+    def _query_model_streaming(
+        self,
+        model: str,
+        system_prompt: str,
+        message: str,
+        context: Optional[CallContext],
+        attempt: Optional[HedgeAttempt] = None,
+    ) -> ClassificationResult:
+        """Stream the completion and stop as soon as leading ``intent_id`` and ``confidence`` validate.
+
+        Only ``streaming`` JSON classification exits early; hedged compact or non-streaming attempts read
+        the whole (short) answer, and stop when ``attempt`` is cancelled.
+        """
+
+        from pydantic import ValidationError
+
+        from components.classification_schema import ClassificationResult
+        from components.stream_parser import IncrementalClassificationParser
+
+        started = time.perf_counter()
+        parser = IncrementalClassificationParser()
+        usage_chunk: object = None
+        candidate: Optional[ClassificationResult] = None
+        compact = self.output_format == "compact"
+        # Early exit only where the caller opted into it; other formats need the full answer.
+        rejected = compact or not self.streaming
+        stream = None
+        try:
+            try:
+                stream = self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": message},
+                    ],
+                    **({} if compact else {"response_format": {"type": "json_object"}}),
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                if attempt is not None:
+                    attempt.on_cancel(getattr(stream, "close", lambda: None))
+                try:
+                    for chunk in stream:
+                        if attempt is not None and attempt.cancelled:
+                            break
+                        if getattr(chunk, "usage", None):
+                            usage_chunk = chunk
+                        for choice in getattr(chunk, "choices", None) or []:
+                            parser.feed(getattr(choice.delta, "content", None) or "")
+                        decided = None if rejected else parser.decided()
+                        if decided is None:
+                            continue
+                        try:
+                            candidate = ClassificationResult.model_validate(
+                                {**decided, "slots": {}, "rationale": "Decided from the leading fields of a streamed answer"}
+                            )
+                            break
+                        except ValidationError:
+                            # Leading fields are unusable; read to the end and let the full parse decide.
+                            rejected = True
+                finally:
+                    # Closing the stream drops the connection, so the rest of the answer is never read.
+                    close = getattr(stream, "close", None)
+                    if close:
+                        close()
+            except Exception as exc:  # noqa: BLE001
+                if attempt is not None and attempt.cancelled:
+                    raise _ModelCallError(_no_match("Superseded by a faster hedged attempt")) from exc
+                raise _openai_failure(exc) from exc
+            if attempt is not None and attempt.cancelled:
+                raise _ModelCallError(_no_match("Superseded by a faster hedged attempt"))
+
+            if candidate is not None:
+                self.metrics.increment("classifier.stream.early_exit")
+                self.metrics.observe("classifier.stream.decided_ms", (time.perf_counter() - started) * 1000)
+                return candidate
+
+            if self.streaming and not compact:
+                self.metrics.increment("classifier.stream.full_parse")
+            try:
+                candidate = self._parse_compact_answer(parser.text) if compact else ClassificationResult.model_validate(json.loads(parser.text))
+                return candidate
+            except (ValueError, ValidationError) as exc:
+                raise _ModelCallError(_no_match("Could not parse model output")) from exc
+        finally:
+            if stream is not None:
+                if usage_chunk is None:
+                    # The usage chunk only arrives at the end of the stream, so estimate it.
+                    usage_chunk = SimpleNamespace(
+                        usage=SimpleNamespace(
+                            prompt_tokens=estimate_tokens(system_prompt + message),
+                            completion_tokens=estimate_tokens(parser.text),
+                        )
+                    )
+                self._record_usage(model, usage_chunk, started, context, candidate)
+
+    def _record_usage(
+        self,
+        model: str,
+        response: object,
+        started: float,
+        context: Optional[CallContext],
+        candidate: Optional[ClassificationResult],
+    ) -> None:
+        tokens = extract_usage(response)
+        context = context or CallContext()
+        self.usage.record(
+            model,
+            tokens["prompt_tokens"],
+            tokens["completion_tokens"],
+            (time.perf_counter() - started) * 1000,
+            intent_id=candidate.intent_id if candidate else None,
+            page=context.page,
+            session_id=context.session_id,
+        )
+
+    def _hedger(self, model: str) -> Optional[Hedger]:
+        if self.hedge_delay_ms is None:
+            return None
+        from components.hedging import shared_hedger
+
+        return shared_hedger(
+            f"classifier.{model}",
+            delay_ms=self.hedge_delay_ms,
+            max_hedge_ratio=self.hedge_max_ratio,
+            metrics=self.metrics,
+        )
+
+    def hedge_stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Hedge rate, wins and latency saved per model; empty when hedging is off."""
+        models = [self.model, *([self.escalation_model] if self.escalation_model else [])]
+        return {model: hedger.stats() for model in models if (hedger := self._hedger(model))}
+
+    def _timed_query(
+        self, tier: str, model: str, system_prompt: str, message: str, context: Optional[CallContext] = None
+    ) -> ClassificationResult:
+        started = time.perf_counter()
+        hedger = self._hedger(model)
+        try:
+            if hedger:
+                return hedger.call(lambda attempt: self._query_model(model, system_prompt, message, context, attempt))
+            return self._query_model(model, system_prompt, message, context)
+        finally:
+            self.metrics.observe(f"classifier.{tier}.latency_ms", (time.perf_counter() - started) * 1000)
+
+    def query_once(self, message: str) -> Tuple[ClassificationResult, bool]:
+        """One model call for ``message``, judged by the same guards as ``classify``, for offline tools.
+
+        Local matching, the seed table, the cache, the cascade and hedging are bypassed. Returns the result and
+        whether the call succeeded; a failed call comes back as its user-facing no-match answer.
+        """
+        if not self.client:
+            return _no_match("Add an OPENAI_API_KEY to a local .env file or environment variable, then restart the app."), False
+        try:
+            return self._apply_guards(self._query_model(self.model, self._build_system_prompt(), message)), True
+        except _ModelCallError as exc:
+            return exc.result, False
+
+    def _needs_escalation(self, candidate: ClassificationResult) -> bool:
+        if not self.escalation_model:
+            return False
+        low, high = self.escalation_band
+        return low <= candidate.confidence < high
+
+    def _escalate(
+        self, message: str, system_prompt: str, primary: ClassificationResult, context: Optional[CallContext] = None
+    ) -> ClassificationResult:
+        self.metrics.increment("classifier.cascade.escalations")
+        try:
+            escalated = self._timed_query("escalation", self.escalation_model, system_prompt, message, context)
+        except _ModelCallError:
+            # The cheap answer is still usable; judge it against the normal threshold.
+            self.metrics.increment("classifier.cascade.escalation_errors")
+            return primary
+
+        self._record_classification(message, escalated, source="llm", model=self.escalation_model)
+        agreed = escalated.intent_id == primary.intent_id
+        if agreed:
+            self.metrics.increment("classifier.cascade.agreements")
+        if self.event_log:
+            self.event_log.record(
+                "escalation",
+                message=message,
+                primary_model=self.model,
+                primary_intent_id=primary.intent_id,
+                primary_confidence=primary.confidence,
+                escalation_model=self.escalation_model,
+                escalation_intent_id=escalated.intent_id,
+                escalation_confidence=escalated.confidence,
+                agreed=agreed,
+            )
+        return escalated
+
+    def cascade_stats(self) -> Dict[str, Optional[float]]:
+        """Escalation rate, agreement rate and per-tier latency percentiles for tuning ``escalation_band``."""
+        return {
+            "requests": self.metrics.counter("classifier.cascade.requests"),
+            "escalation_rate": self.metrics.ratio("classifier.cascade.escalations", "classifier.cascade.requests"),
+            "agreement_rate": self.metrics.ratio("classifier.cascade.agreements", "classifier.cascade.escalations"),
+            "primary_p50_ms": self.metrics.percentile("classifier.primary.latency_ms", 50),
+            "primary_p95_ms": self.metrics.percentile("classifier.primary.latency_ms", 95),
+            "escalation_p50_ms": self.metrics.percentile("classifier.escalation.latency_ms", 50),
+            "escalation_p95_ms": self.metrics.percentile("classifier.escalation.latency_ms", 95),
+        }
+
+    @property
+    def cache_namespace(self) -> str:
+        return self.response_bank.fingerprint
+
+    def _cache_key(self, message: str) -> str:
+        return f"{self.model}|{self.escalation_model or ''}|{self.output_format}|{normalize_text(message)}"
+
+    def _cache_lookup(self, message: str) -> Optional[ClassificationResult]:
+        if not self.cache.enabled:
+            return None
+        entry = self.cache.get(self.cache_namespace, self._cache_key(message))
+        if entry is None:
+            self.metrics.increment("classifier.cache.misses")
+            return None
+        self.metrics.increment("classifier.cache.hits")
+        from components.classification_schema import ClassificationResult
+
+        return ClassificationResult.model_validate(entry)
+
+    def _cache_store(self, message: str, result: ClassificationResult) -> None:
+        self.cache.put(self.cache_namespace, self._cache_key(message), result.model_dump())
+
+    def budget_status(self, session_id: Optional[str] = None) -> str:
+        return self.usage.budget_status(session_id)
+
+    def classify(
+        self,
+        message: str,
+        *,
+        session_id: Optional[str] = None,
+        page: Optional[str] = None,
+        previous_intent_id: Optional[str] = None,
+    ) -> ClassificationResult:
+        """Classify ``message``; ``session_id`` and ``page`` attribute token spend and enforce budgets.
+
+        ``previous_intent_id`` is the intent answered last in this conversation, used to resolve short follow-ups.
+        """
+
+        started = time.perf_counter()
+        guarded = self.input_guard.check(message)
+        # The emergency scan always sees the whole message, however much of it is classified.
+        result = self.emergency_match(message)
+        source = None
+        if result is None and guarded.rejected:
+            self.metrics.increment("classifier.input.rejected")
+            result = _no_match(guarded.notice)
+        elif result is None:
+            if guarded.truncated:
+                self.metrics.increment("classifier.input.truncated")
+            message = guarded.text
+            result, source = self._classify(message, CallContext(session_id=session_id, page=page), previous_intent_id)
+            if result.intent_id == "__NO_MATCH__":
+                result = self._with_candidates(message, result)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.metrics.increment("classifier.requests")
+        if result.intent_id == "__NO_MATCH__":
+            self.metrics.increment("classifier.no_match")
+        self.metrics.observe("classifier.total.latency_ms", elapsed_ms)
+        if self.shadow is not None and source in SHADOW_SOURCES:
+            # The candidate's calls are extra spend, so they stop as soon as production is over budget.
+            if self.usage.budget_status(session_id) == "ok":
+                self.shadow.maybe_submit(
+                    message, result, elapsed_ms, source, session_id=session_id, page=page, previous_intent_id=previous_intent_id
+                )
+            else:
+                self.metrics.increment("classifier.shadow.over_budget")
+        return result
+
+    def _classify(
+        self, message: str, context: CallContext, previous_intent_id: Optional[str] = None
+    ) -> Tuple[ClassificationResult, Optional[str]]:
+        """The result and the stage that produced it (``local``, ``seed``, ``follow_up``, ``cache`` or ``llm``).
+
+        The stage is ``None`` when no answer could be produced (no key, budget reached, failed model call).
+        """
+        local = self._local_match(message)
+        if local:
+            self._record_classification(message, local, source="local")
+            return local, "local"
+
+        seeded = self._seed_match(message)
+        if seeded:
+            self._record_classification(message, seeded, source="seed")
+            return seeded, "seed"
+
+        # Only short or elliptical messages are treated as follow-ups; standalone questions are classified on
+        # their own and keep sharing cache entries.
+        if previous_intent_id and self.response_bank.get_intent_by_id(previous_intent_id) and _looks_like_follow_up(message):
+            follow_up = self._resolve_follow_up(message, previous_intent_id)
+            if follow_up:
+                self.metrics.increment("classifier.follow_up.local")
+                self._record_classification(message, follow_up, source="follow_up")
+                return follow_up, "follow_up"
+            self.metrics.increment("classifier.follow_up.context")
+            message = self._with_previous_topic(message, previous_intent_id)
+
+        if not self.client:
+            return _no_match("Add an OPENAI_API_KEY to a local .env file or environment variable, then restart the app."), None
+
+        cached = self._cache_lookup(message)
+        source = "cache" if cached else "llm"
+        if cached:
+            candidate = cached
+        else:
+            budget = self.usage.budget_status(context.session_id)
+            if budget != "ok":
+                self.metrics.increment(f"classifier.budget.{budget}")
+                return _no_match(
+                    "The free-text budget has been reached for now. Pick one of the suggested or guided questions instead."
+                ), None
+
+            system_prompt = self._build_system_prompt()
+
+            try:
+                candidate = self._timed_query("primary", self.model, system_prompt, message, context)
+            except _ModelCallError as exc:
+                return exc.result, None
+
+            self._record_classification(message, candidate, source="llm", model=self.model)
+
+            if self.escalation_model:
+                self.metrics.increment("classifier.cascade.requests")
+                if self._needs_escalation(candidate):
+                    candidate = self._escalate(message, system_prompt, candidate, context)
+            self._cache_store(message, candidate)
+
+        return self._apply_guards(candidate), source
+
+    def _with_candidates(self, message: str, result: ClassificationResult) -> ClassificationResult:
+        """Fill up to ``NO_MATCH_CANDIDATES`` choices from the local ranking so a no-match needs no second round trip."""
+        candidates = list(result.candidates)
+        for intent_id in self.local_matcher.rank(message, limit=NO_MATCH_CANDIDATES):
+            if intent_id not in candidates:
+                candidates.append(intent_id)
+        candidates = candidates[: NO_MATCH_CANDIDATES]
+        if candidates:
+            self.metrics.increment("classifier.no_match.with_candidates")
+        return result.model_copy(update={"candidates": candidates})
+
+    def _apply_guards(self, candidate: ClassificationResult) -> ClassificationResult:
+        """Only approved intents at or above the confidence threshold are answered."""
         allowed = set(self.response_bank.get_allowed_intent_ids())
         if candidate.intent_id not in allowed or candidate.confidence < self.confidence_threshold:
+            from components.classification_schema import ClassificationResult
+
             return ClassificationResult(
                 intent_id="__NO_MATCH__",
                 confidence=candidate.confidence,
                 slots=candidate.slots,
                 rationale="Below confidence threshold or invalid intent",
+                # The model's low-confidence pick is still the best first choice to offer.
+                candidates=[candidate.intent_id] if candidate.intent_id in allowed else [],
             )
 
         return candidate
+
+
+def _shadow_from_env(response_bank: ResponseBank, metrics: MetricsRegistry, event_log: Optional[EventLog]) -> Optional["ShadowEvaluator"]:
+    if env_float("RSV_SHADOW_RATE", 0.0) <= 0:
+        return None
+    from components.shadow import ShadowEvaluator
+
+    return ShadowEvaluator.from_env(response_bank, metrics, event_log)
+
+
+def _parse_hedge_delay(value: Optional[float | str]) -> Optional[float | str]:
+    """Accept a number of milliseconds or a percentile such as ``"p95"``; anything else disables hedging."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    text = value.strip().lower()
+    try:
+        if text.startswith("p"):
+            float(text[1:])
+            return text
+        return float(text)
+    except ValueError:
+        return None
+
+
+class _ModelCallError(Exception):
+    """Raised when a model call fails; ``result`` is the no-match answer shown to the user."""
+
+    def __init__(self, result: ClassificationResult):
+        super().__init__(result.rationale)
+        self.result = result
+
+
+def _openai_failure(exc: Exception) -> _ModelCallError:
+    """Map an exception from the OpenAI client to the user-facing no-match answer."""
+    from openai import APIConnectionError, APIStatusError, APITimeoutError, AuthenticationError, OpenAIError
+
+    if isinstance(exc, AuthenticationError):
+        return _ModelCallError(
+            _no_match("OpenAI rejected the API key. Double-check OPENAI_API_KEY in your environment or .env file.")
+        )
+    if isinstance(exc, (APIConnectionError, APITimeoutError)):
+        return _ModelCallError(_no_match("Unable to reach OpenAI. Check your internet/VPN connection and try again."))
+    if isinstance(exc, APIStatusError):
+        return _ModelCallError(_no_match(f"OpenAI request failed ({exc.status_code}). Please try again shortly."))
+    if isinstance(exc, OpenAIError):
+        return _ModelCallError(_no_match(f"OpenAI call failed: {exc}"))
+    return _ModelCallError(_no_match(f"Unexpected OpenAI error: {exc}"))
+
+
+def _looks_like_follow_up(message: str) -> bool:
+    """Short or elliptical messages ("and for pregnant people?") that depend on the previous answer."""
+    normalized = normalize_text(message)
+    return len(normalized.split()) <= FOLLOW_UP_MAX_WORDS or normalized.startswith(_FOLLOW_UP_OPENERS)
+
+
+def _no_match(rationale: str) -> ClassificationResult:
+    from components.classification_schema import ClassificationResult
+
+    return ClassificationResult(intent_id="__NO_MATCH__", confidence=0.0, slots={}, rationale=rationale)
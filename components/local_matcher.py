@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from components.response_bank import ResponseBank
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+# Words too common in questions to tell intents apart while the user is still typing.
+_STOPWORDS = frozenset(
+    {"a", "about", "an", "and", "are", "can", "do", "does", "for", "how", "i", "if", "in", "is", "it", "me", "my", "of", "on", "should", "the", "to", "what", "when", "who", "why", "with"}
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so phrasings compare cleanly."""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub("", text.lower())).strip()
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    return frozenset(normalize_text(text).split())
+
+
+def jaccard(left: Iterable[str], right: Iterable[str]) -> float:
+    left_set, right_set = set(left), set(right)
+    if not left_set or not right_set:
+        return 0.0
+    return len(left_set & right_set) / len(left_set | right_set)
+
+
+_MATCHERS: Dict[str, "LocalMatcher"] = {}
+_MATCHERS_LOCK = threading.Lock()
+
+
+class LocalMatcher:
+    """Answers messages from the response bank without a model call when the phrasing is already known."""
+
+    def __init__(self, response_bank: ResponseBank):
+        self.response_bank = response_bank
+        self.phrase_index: Dict[str, str] = {}
+        self.suggestion_index: List[Tuple[Dict[str, Any], List[Tuple[str, Tuple[str, ...]]]]] = []
+        for intent in response_bank.intents:
+            phrases = [intent.get("user_question", ""), *intent.get("sample_user_phrases", [])]
+            searchable = [normalize_text(text) for text in [*phrases, intent.get("display_name", "")]]
+            self.suggestion_index.append((intent, [(text, tuple(text.split())) for text in searchable if text]))
+            for phrase in phrases:
+                normalized = normalize_text(phrase)
+                if normalized:
+                    # First intent wins so the bank order stays authoritative for duplicated phrasings.
+                    self.phrase_index.setdefault(normalized, intent["intent_id"])
+
+    @classmethod
+    def for_bank(cls, response_bank: ResponseBank) -> "LocalMatcher":
+        """Shared index per bank content, so reruns and sessions on the same bank do not rebuild it."""
+        with _MATCHERS_LOCK:
+            matcher = _MATCHERS.get(response_bank.fingerprint)
+            if matcher is None:
+                matcher = _MATCHERS[response_bank.fingerprint] = cls(response_bank)
+            return matcher
+
+    def exact_match(self, message: str) -> Optional[str]:
+        return self.phrase_index.get(normalize_text(message))
+
+    def suggest(self, query: str, limit: int = 3, min_score: float = 0.5) -> List[Dict[str, Any]]:
+        """Rank approved questions for a partially typed query; the last word may be incomplete."""
+
+        normalized = normalize_text(query)
+        words = normalized.split()
+        if len(normalized) < 2 or not words:
+            return []
+        significant = [word for word in words if word not in _STOPWORDS] or words
+
+        scored = []
+        for position, (intent, entries) in enumerate(self.suggestion_index):
+            best = 0.0
+            for text, tokens in entries:
+                matched = sum(1 for word in significant if any(token.startswith(word) for token in tokens))
+                score = matched / len(significant)
+                if text.startswith(normalized):
+                    score += 0.5
+                best = max(best, score)
+            if best >= min_score:
+                scored.append((-best, position, intent))
+        scored.sort(key=lambda item: (item[0], item[1]))
+        return [intent for _, _, intent in scored[:limit]]
+
+    def scores(self, message: str, intent_ids: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """``(intent_id, score)`` by word overlap with a complete message, best first; ``intent_ids`` narrows the field."""
+
+        words = {word for word in normalize_text(message).split() if word not in _STOPWORDS}
+        if not words:
+            return []
+        allowed = set(intent_ids) if intent_ids is not None else None
+        scored = []
+        for position, (intent, entries) in enumerate(self.suggestion_index):
+            if allowed is not None and intent["intent_id"] not in allowed:
+                continue
+            best = max((jaccard(words, (token for token in tokens if token not in _STOPWORDS)) for _, tokens in entries), default=0.0)
+            if best > 0:
+                scored.append((-best, position, intent["intent_id"]))
+        scored.sort()
+        return [(intent_id, -score) for score, _, intent_id in scored]
+
+    def rank(self, message: str, limit: int = 3, min_score: float = 0.15) -> List[str]:
+        """Intent ids ordered by word overlap with a complete message, for offering choices on a no-match."""
+        return [intent_id for intent_id, score in self.scores(message) if score >= min_score][:limit]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional
+
+
+class MetricsRegistry:
+    """Thread-safe in-process counters and latency samples shared by the chatbot components."""
+
+    def __init__(self, max_samples: int = 1024):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._samples: Dict[str, Deque[float]] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.max_samples)
+            samples.append(value)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauge(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._gauges.get(name)
+
+    def counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0.0)
+
+    def ratio(self, numerator: str, denominator: str) -> Optional[float]:
+        with self._lock:
+            total = self._counters.get(denominator, 0.0)
+            return self._counters.get(numerator, 0.0) / total if total else None
+
+    def samples(self, name: str) -> List[float]:
+        """The retained samples for ``name``, oldest first."""
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def percentile(self, name: str, pct: float) -> Optional[float]:
+        """Nearest-rank percentile over the retained samples, or ``None`` when nothing was observed."""
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return None
+        rank = max(1, math.ceil(pct / 100.0 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            sample_names = list(self._samples)
+        summaries = {}
+        for name in sample_names:
+            summaries[name] = {
+                "p50": self.percentile(name, 50) or 0.0,
+                "p95": self.percentile(name, 95) or 0.0,
+                "p99": self.percentile(name, 99) or 0.0,
+            }
+        return {"counters": counters, "gauges": gauges, "samples": summaries}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._samples.clear()
+
+
+METRICS = MetricsRegistry()
@@ -1,19 +1,66 @@
 from __future__ import annotations
 
-from typing import Optional
+from importlib import import_module
+from typing import Any, Dict, List, Optional
 
 import streamlit as st
 
-NAV_ITEMS = [
-    {"label": "Home", "page": "app.py"},
-    {"label": "RSV Basics", "page": "pages/1_RSV_Basics.py"},
-    {"label": "Symptoms", "page": "pages/2_Symptoms.py"},
-    {"label": "Eligibility", "page": "pages/3_Eligibility.py"},
-    {"label": "Vaccination", "page": "pages/4_Vaccination.py"},
-    {"label": "Prevention", "page": "pages/5_Prevention.py"},
-    {"label": "Appointments", "page": "pages/6_Appointments.py"},
-    {"label": "Get Support", "page": "pages/7_Get_Support.py"},
+# One entry per page of the single-entry app (app.py). ``page`` is the page's historical script path: it is
+# still the key used by intent_to_page_map.json, guided auto-prompts, usage attribution and the static export,
+# so it never changes when content moves. ``url_path`` keeps the URLs the multipage version served.
+SITE_PAGES: List[Dict[str, Any]] = [
+    {"label": "Home", "page": "app.py", "title": "RSV POC Assistant", "url_path": "", "view": "views.home"},
+    {"label": "RSV Basics", "page": "pages/1_RSV_Basics.py", "title": "RSV Basics", "url_path": "RSV_Basics", "view": "views.rsv_basics"},
+    {"label": "Symptoms", "page": "pages/2_Symptoms.py", "title": "Symptoms", "url_path": "Symptoms", "view": "views.symptoms"},
+    {"label": "Eligibility", "page": "pages/3_Eligibility.py", "title": "Eligibility", "url_path": "Eligibility", "view": "views.eligibility"},
+    {"label": "Vaccination", "page": "pages/4_Vaccination.py", "title": "Vaccination", "url_path": "Vaccination", "view": "views.vaccination"},
+    {"label": "Prevention", "page": "pages/5_Prevention.py", "title": "Prevention", "url_path": "Prevention", "view": "views.prevention"},
+    {"label": "Appointments", "page": "pages/6_Appointments.py", "title": "Appointments", "url_path": "Appointments", "view": "views.appointments"},
+    {"label": "Get Support", "page": "pages/7_Get_Support.py", "title": "Support", "url_path": "Get_Support", "view": "views.get_support"},
+    {
+        "label": "Operations",
+        "page": "pages/8_Operations.py",
+        "title": "Operations",
+        "url_path": "Operations",
+        "view": "views.operations",
+        "nav": False,
+        "chatbot": False,
+    },
 ]
+NAV_ITEMS = [item for item in SITE_PAGES if item.get("nav", True)]
+
+
+def _view(module_name: str):
+    def render() -> None:
+        import_module(module_name).render()
+
+    return render
+
+
+def _page(item: Dict[str, Any]) -> Any:
+    return st.Page(_view(item["view"]), title=item["title"], url_path=item["url_path"] or None, default=item["page"] == "app.py")
+
+
+def site_pages() -> Dict[str, Any]:
+    """``{page path: st.Page}``; view modules are only imported when their page is shown.
+
+    Page objects are cheap descriptors and ``st.navigation`` marks the selected one as runnable, so they are
+    built per run rather than shared between sessions.
+    """
+    return {item["page"]: _page(item) for item in SITE_PAGES}
+
+
+def page_for(page_path: str) -> Any:
+    """The ``st.Page`` for a page path from the response bank, for ``st.page_link``; unknown paths pass through."""
+    item = next((item for item in SITE_PAGES if item["page"] == page_path), None)
+    if item is None:
+        return page_path
+    return _page(item)
+
+
+def page_item(page: Any) -> Dict[str, Any]:
+    """The ``SITE_PAGES`` entry for the page ``st.navigation`` selected."""
+    return next((item for item in SITE_PAGES if item["url_path"] == page.url_path), SITE_PAGES[0])
 
 
 def render_top_nav(active_label: Optional[str] = None):
@@ -22,4 +69,4 @@ def render_top_nav(active_label: Optional[str] = None):
     for col, item in zip(cols, NAV_ITEMS):
         with col:
             icon = "👉" if item["label"] == active_label else None
-            st.page_link(item["page"], label=item["label"], icon=icon)
+            st.page_link(page_for(item["page"]), label=item["label"], icon=icon)
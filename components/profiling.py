@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+from components.admin import admin_token_valid
+from components.config import env_int, env_str
+
+PROFILE_ENV_VAR = "RSV_PROFILE"
+PROFILE_DIR_ENV_VAR = "RSV_PROFILE_DIR"
+PROFILE_MODES = ("sample", "cprofile")
+
+logger = logging.getLogger(__name__)
+_env_profile_taken = False
+_LOCK = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Samples the profiled thread's stack from a helper thread; output is collapsed stacks for flame graphs."""
+
+    def __init__(self, interval_seconds: float = 0.002):
+        self.interval_seconds = interval_seconds
+        self.samples: Counter = Counter()
+        self._target: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="rerun-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self._target)
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed format, readable by flamegraph.pl and speedscope."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common())
+
+    def summary(self, limit: int) -> str:
+        total = sum(self.samples.values())
+        if not total:
+            return "No samples collected; the rerun finished faster than the sampling interval.\n"
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.samples.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                inclusive[label] += count
+        lines = [f"{total} samples at {self.interval_seconds * 1000:.1f} ms", "", "Top functions by inclusive time:"]
+        lines += [f"  {count / total:6.1%}  {label}" for label, count in inclusive.most_common(limit)]
+        lines += ["", "Top functions by self time:"]
+        lines += [f"  {count / total:6.1%}  {label}" for label, count in own.most_common(limit)]
+        return "\n".join(lines) + "\n"
+
+
+class DeterministicProfiler:
+    """``cProfile`` over the rerun thread; the ``.prof`` output opens in snakeviz or flameprof."""
+
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profile.enable()
+
+    def stop(self) -> None:
+        self.profile.disable()
+
+    def summary(self, limit: int) -> str:
+        buffer = io.StringIO()
+        pstats.Stats(self.profile, stream=buffer).sort_stats("cumulative").print_stats(limit)
+        return buffer.getvalue()
+
+
+def write_profile(label: str, profiler: SamplingProfiler | DeterministicProfiler, elapsed_ms: float, top_n: int = 25) -> Dict[str, Path]:
+    output_dir = Path(env_str(PROFILE_DIR_ENV_VAR, "profiles"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')}-{re.sub(r'[^A-Za-z0-9_-]+', '_', label)}"
+    paths: Dict[str, Path] = {"summary": output_dir / f"{stem}.txt"}
+    header = f"Rerun profile for {label}: {elapsed_ms:.1f} ms wall\n\n"
+    paths["summary"].write_text(header + profiler.summary(top_n), encoding="utf-8")
+    if isinstance(profiler, SamplingProfiler):
+        paths["flamegraph"] = output_dir / f"{stem}.collapsed"
+        paths["flamegraph"].write_text(profiler.collapsed(), encoding="utf-8")
+    else:
+        paths["flamegraph"] = output_dir / f"{stem}.prof"
+        profiler.profile.dump_stats(str(paths["flamegraph"]))
+    return paths
+
+
+def requested_profile_mode() -> Tuple[Optional[str], bool]:
+    """``(mode, admin)`` for this rerun, or ``(None, False)`` when it should not be profiled.
+
+    Both triggers are one-shot: ``RSV_PROFILE`` profiles the first rerun the server process handles, and
+    ``?profile=<mode>`` profiles one rerun for an admin (see ``RSV_ADMIN_TOKEN``).
+    """
+
+    global _env_profile_taken
+    env_mode = env_str(PROFILE_ENV_VAR)
+    if env_mode and not _env_profile_taken:
+        with _LOCK:
+            first, _env_profile_taken = not _env_profile_taken, True
+        if first:
+            return (env_mode if env_mode in PROFILE_MODES else "sample"), False
+
+    requested = st.query_params.get("profile")
+    if not requested:
+        return None, False
+    token = st.query_params.get("admin")
+    if not (st.session_state.get("admin_authenticated") or admin_token_valid(token)):
+        return None, False
+    # One-shot: drop the parameter so the next rerun runs unprofiled.
+    del st.query_params["profile"]
+    return (requested if requested in PROFILE_MODES else "sample"), True
+
+
+@contextmanager
+def profile_rerun(label: str) -> Iterator[Optional[Tuple[str, ...]]]:
+    """Profile the wrapped block when requested; costs one env and query-param lookup otherwise.
+
+    Only the rerun thread is profiled. Free-text classification runs on the background job pool
+    (``components.classification_jobs``), so model calls show up as the poll that collects their result,
+    not as their own stacks; use the ``classifier.*`` latency metrics on the Operations page for those.
+    """
+
+    mode, admin = requested_profile_mode()
+    if not mode:
+        yield None
+        return
+
+    profiler = SamplingProfiler() if mode == "sample" else DeterministicProfiler()
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield (mode,)
+    finally:
+        profiler.stop()
+        paths = write_profile(label, profiler, (time.perf_counter() - started) * 1000, top_n=env_int("RSV_PROFILE_TOP_N", 25))
+        logger.info("Profile of %s written to %s", label, ", ".join(str(path) for path in paths.values()))
+        if admin:
+            # Only the admin who asked sees where the file went; other visitors never learn server paths.
+            st.toast(f"Profile written to {paths['summary']}")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from functools import lru_cache
+import threading
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -10,27 +12,47 @@ DEFAULT_BANK_PATH = DATA_DIR / "response_bank.json"
 DEFAULT_PAGE_MAP_PATH = DATA_DIR / "intent_to_page_map.json"
 
 
-@lru_cache(maxsize=1)
+_INTERNED: Dict[str, Any] = {}
+_INTERN_LOCK = threading.Lock()
+
+
+def intern_content(value: Any) -> Any:
+    """Return a previously loaded object with identical content, so banks that share intents share memory."""
+    key = hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    with _INTERN_LOCK:
+        return _INTERNED.setdefault(key, value)
+
+
+@lru_cache(maxsize=16)
 def load_response_bank(path: Path = DEFAULT_BANK_PATH) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        bank = json.load(f)
+    bank["intents"] = [intern_content(intent) for intent in bank.get("intents", [])]
+    return bank
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=16)
 def load_intent_to_page_map(path: Path = DEFAULT_PAGE_MAP_PATH) -> Dict[str, List[Dict[str, str]]]:
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        page_map = json.load(f)
+    return {intent_id: intern_content(links) for intent_id, links in page_map.items()}
 
 
 class ResponseBank:
     """Helper for working with the response bank and related mappings."""
 
     def __init__(self, bank: Optional[Dict[str, Any]] = None, page_map: Optional[Dict[str, List[Dict[str, str]]]] = None):
-        self.bank = bank or load_response_bank()
-        self.page_map = page_map or load_intent_to_page_map()
+        self.bank = bank or load_response_bank(DEFAULT_BANK_PATH)
+        self.page_map = page_map or load_intent_to_page_map(DEFAULT_PAGE_MAP_PATH)
         self.intents = self.bank.get("intents", [])
         self.intent_lookup = {intent["intent_id"]: intent for intent in self.intents}
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable content hash of the bank and page map, used to key derived caches."""
+        canonical = json.dumps({"bank": self.bank, "page_map": self.page_map}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
     def get_categories(self) -> List[str]:
         seen = []
         for intent in self.intents:
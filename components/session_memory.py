@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional
+
+from components.config import env_float, env_int
+from components.metrics import METRICS, MetricsRegistry
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from components.conversation_store import ConversationStore
+
+# Keys owned by the chatbot widget; histories live in the conversation store and are accounted (and, for the
+# in-process store, evicted) through it. ``chat_session_id`` and ``bank_id`` are deliberately kept so an
+# evicted session keeps its budget attribution, bank and any durably stored history.
+CHAT_STATE_KEYS = (
+    "chat_mode",
+    "guided_history_visible",
+    "free_history_visible",
+    "last_intent_id",
+    "guided_auto_prompts",
+    "chat_panel_open",
+    "api_status",
+    "api_status_checked_at",
+    "last_mode",
+    "pending_classification",
+    "free_text_notice",
+    "free_text_candidates",
+)
+
+
+def deep_sizeof(value: Any, _seen: Optional[set] = None) -> int:
+    """Approximate retained size of plain containers; shared objects are counted once."""
+
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    return size
+
+
+def measure_chat_state(state: Mapping[str, Any]) -> int:
+    seen: set = set()
+    return sum(deep_sizeof(state[key], seen) for key in CHAT_STATE_KEYS if key in state)
+
+
+@dataclass
+class _SessionEntry:
+    last_seen: float
+    bytes: int
+    evict: Callable[[], None]
+
+
+class SessionMemoryTracker:
+    """Process-wide accounting of chatbot state per browser session, with idle-TTL and total-size eviction.
+
+    Sessions report in on every rerun via ``touch``; eviction runs the session's ``evict`` callback,
+    which drops its chat keys so the next rerun starts from fresh defaults. When the session's history
+    lives in an ``in_process`` conversation store, its bytes are counted too and eviction clears it.
+    """
+
+    def __init__(
+        self,
+        idle_ttl_seconds: float = 1800,
+        max_total_bytes: int = 256 * 1024 * 1024,
+        sweep_interval_seconds: float = 30,
+        metrics: Optional[MetricsRegistry] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_total_bytes = max_total_bytes
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.metrics = metrics or METRICS
+        self.clock = clock
+        self._sessions: Dict[str, _SessionEntry] = {}
+        self._evicted: set = set()
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SessionMemoryTracker":
+        return cls(
+            idle_ttl_seconds=env_float("RSV_SESSION_IDLE_TTL", 1800),
+            max_total_bytes=env_int("RSV_SESSION_MEMORY_CAP_MB", 256) * 1024 * 1024,
+        )
+
+    def touch(
+        self,
+        session_id: str,
+        state: Mapping[str, Any],
+        evict: Callable[[], None],
+        store: Optional["ConversationStore"] = None,
+    ) -> int:
+        """Record activity and current chat-state size for a session; returns the measured bytes."""
+
+        nbytes = measure_chat_state(state)
+        if store is not None and store.in_process:
+            nbytes += store.session_bytes(session_id)
+            evict = _clearing_store(evict, store, session_id)
+        now = self.clock()
+        with self._lock:
+            self._sessions[session_id] = _SessionEntry(last_seen=now, bytes=nbytes, evict=evict)
+            due = now - self._last_sweep >= self.sweep_interval_seconds
+        self.metrics.observe("sessions.bytes", nbytes)
+        if due or self.total_bytes() > self.max_total_bytes:
+            self.sweep(exclude=session_id)
+        self._publish()
+        return nbytes
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.bytes for entry in self._sessions.values())
+
+    def sweep(self, exclude: Optional[str] = None) -> List[str]:
+        """Evict sessions idle past the TTL, then least recently seen ones until under the cap."""
+
+        now = self.clock()
+        victims: List[tuple] = []
+        with self._lock:
+            self._last_sweep = now
+            for session_id, entry in list(self._sessions.items()):
+                if session_id != exclude and now - entry.last_seen > self.idle_ttl_seconds:
+                    victims.append((session_id, self._sessions.pop(session_id), "idle"))
+            total = sum(entry.bytes for entry in self._sessions.values())
+            for session_id, entry in sorted(self._sessions.items(), key=lambda item: item[1].last_seen):
+                if total <= self.max_total_bytes:
+                    break
+                if session_id == exclude:
+                    continue
+                total -= entry.bytes
+                victims.append((session_id, self._sessions.pop(session_id), "cap"))
+            self._evicted.update(session_id for session_id, _, _ in victims)
+
+        for _, entry, reason in victims:
+            try:
+                entry.evict()
+            except Exception:  # noqa: BLE001 - the session may already be gone
+                pass
+            self.metrics.increment("sessions.evicted")
+            self.metrics.increment(f"sessions.evicted.{reason}")
+            self.metrics.increment("sessions.evicted_bytes", entry.bytes)
+        if victims:
+            self._publish()
+        return [session_id for session_id, _, _ in victims]
+
+    def consume_eviction(self, session_id: str) -> bool:
+        """True once for a session whose chat state was evicted, so the UI can say so."""
+        with self._lock:
+            if session_id in self._evicted:
+                self._evicted.discard(session_id)
+                return True
+            return False
+
+    def _publish(self) -> None:
+        stats = self.stats()
+        self.metrics.set_gauge("sessions.live", stats["live"])
+        self.metrics.set_gauge("sessions.total_bytes", stats["total_bytes"])
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            sizes = [entry.bytes for entry in self._sessions.values()]
+        return {
+            "live": len(sizes),
+            "total_bytes": sum(sizes),
+            "mean_bytes": sum(sizes) / len(sizes) if sizes else 0,
+            "max_bytes": max(sizes, default=0),
+            "evictions": self.metrics.counter("sessions.evicted"),
+        }
+
+
+def _clearing_store(evict: Callable[[], None], store: "ConversationStore", session_id: str) -> Callable[[], None]:
+    def evict_with_history() -> None:
+        store.clear(session_id)
+        evict()
+
+    return evict_with_history
+
+
+SESSIONS = SessionMemoryTracker.from_env()
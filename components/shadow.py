@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from components.config import env_bool, env_float, env_int, env_str
+from components.metrics import MetricsRegistry
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from components.classification_schema import ClassificationResult
+    from components.event_log import EventLog
+    from components.intent_classifier import IntentClassifier
+    from components.response_bank import ResponseBank
+
+SHADOW_RATE_ENV_VAR = "RSV_SHADOW_RATE"
+# RSV_SHADOW_MODEL=local evaluates the local stages alone (exact phrases, seed, follow-ups) with no model call.
+LOCAL_ONLY_MODEL = "local"
+
+
+class ShadowEvaluator:
+    """Replays a sample of live messages against a candidate classifier, off the request path.
+
+    The production answer is never delayed or changed: sampled messages are handed to a small private
+    pool and dropped when ``max_pending`` comparisons are already queued. Each comparison records
+    agreement, the confidence delta and both latencies to ``metrics`` and the event log.
+    """
+
+    def __init__(
+        self,
+        candidate: "IntentClassifier",
+        rate: float,
+        metrics: MetricsRegistry,
+        event_log: Optional["EventLog"] = None,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        rng: Optional[random.Random] = None,
+    ):
+        self.candidate = candidate
+        self.rate = max(0.0, min(1.0, rate))
+        self.metrics = metrics
+        self.event_log = event_log
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._rng = rng or random.Random()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def label(self) -> str:
+        if self.candidate.client is None:
+            return LOCAL_ONLY_MODEL
+        return f"{self.candidate.model}/{self.candidate.output_format}{'/stream' if self.candidate.streaming else ''}"
+
+    @classmethod
+    def from_env(
+        cls, response_bank: "ResponseBank", metrics: MetricsRegistry, event_log: Optional["EventLog"]
+    ) -> Optional["ShadowEvaluator"]:
+        """``RSV_SHADOW_RATE`` > 0 enables shadowing; ``RSV_SHADOW_MODEL``, ``RSV_SHADOW_OUTPUT_FORMAT`` and
+        ``RSV_SHADOW_STREAMING`` describe the candidate (unset options match production defaults)."""
+
+        rate = env_float(SHADOW_RATE_ENV_VAR, 0.0)
+        if rate <= 0:
+            return None
+        from components.classification_cache import ClassificationCache
+        from components.intent_classifier import IntentClassifier
+        from components.usage import UsageTracker
+
+        model = env_str("RSV_SHADOW_MODEL", "gpt-4.1-mini")
+        candidate = IntentClassifier(
+            response_bank=response_bank,
+            model=model,
+            # Private cache, metrics and usage: the candidate must not serve or skew production answers and budgets.
+            cache=ClassificationCache(max_entries=0),
+            metrics=MetricsRegistry(),
+            usage=UsageTracker(prices={}),
+            event_log=None,
+            streaming=env_bool("RSV_SHADOW_STREAMING"),
+            output_format=env_str("RSV_SHADOW_OUTPUT_FORMAT", "json"),
+            shadow=None,
+        )
+        if model == LOCAL_ONLY_MODEL:
+            candidate.api_key = None
+        return cls(
+            candidate,
+            rate,
+            metrics,
+            event_log,
+            max_workers=env_int("RSV_SHADOW_WORKERS", 2),
+            max_pending=env_int("RSV_SHADOW_MAX_PENDING", 16),
+        )
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="shadow")
+        return self._executor
+
+    def maybe_submit(
+        self, message: str, production: "ClassificationResult", production_ms: float, source: Optional[str] = None, **classify_kwargs: Any
+    ) -> bool:
+        """Sample ``message`` for comparison; returns at once whether it was queued.
+
+        ``source`` is the production stage that answered (``llm`` or ``cache``), recorded with the comparison.
+        """
+        if self._rng.random() >= self.rate:
+            return False
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.metrics.increment("classifier.shadow.dropped")
+                return False
+            self._pending += 1
+        self.metrics.increment("classifier.shadow.submitted")
+        self._pool().submit(self._compare, message, production, production_ms, source, classify_kwargs)
+        return True
+
+    def _compare(
+        self, message: str, production: "ClassificationResult", production_ms: float, source: Optional[str], classify_kwargs: Dict[str, Any]
+    ) -> None:
+        try:
+            started = time.perf_counter()
+            candidate = self.candidate.classify(message, **classify_kwargs)
+            candidate_ms = (time.perf_counter() - started) * 1000
+        except Exception as exc:  # noqa: BLE001 - a failing candidate is a finding, not an outage
+            self.metrics.increment("classifier.shadow.errors")
+            if self.event_log:
+                self.event_log.record("shadow", candidate=self.label, message=message, error=str(exc))
+            return
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        agree = candidate.intent_id == production.intent_id
+        delta = candidate.confidence - production.confidence
+        self.metrics.increment("classifier.shadow.compared")
+        self.metrics.increment("classifier.shadow.agreements" if agree else "classifier.shadow.disagreements")
+        self.metrics.observe("classifier.shadow.confidence_delta", delta)
+        self.metrics.observe("classifier.shadow.production_ms", production_ms)
+        self.metrics.observe("classifier.shadow.candidate_ms", candidate_ms)
+        if self.event_log:
+            self.event_log.record(
+                "shadow",
+                candidate=self.label,
+                message=message,
+                agree=agree,
+                production_source=source,
+                production_intent_id=production.intent_id,
+                candidate_intent_id=candidate.intent_id,
+                production_confidence=production.confidence,
+                candidate_confidence=candidate.confidence,
+                confidence_delta=round(delta, 4),
+                production_ms=round(production_ms, 1),
+                candidate_ms=round(candidate_ms, 1),
+            )
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        return {
+            "rate": self.rate,
+            "submitted": self.metrics.counter("classifier.shadow.submitted"),
+            "dropped": self.metrics.counter("classifier.shadow.dropped"),
+            "over_budget": self.metrics.counter("classifier.shadow.over_budget"),
+            "compared": self.metrics.counter("classifier.shadow.compared"),
+            "errors": self.metrics.counter("classifier.shadow.errors"),
+            "agreement_rate": self.metrics.ratio("classifier.shadow.agreements", "classifier.shadow.compared"),
+            "confidence_delta_p50": self.metrics.percentile("classifier.shadow.confidence_delta", 50),
+            "production_p50_ms": self.metrics.percentile("classifier.shadow.production_ms", 50),
+            "candidate_p50_ms": self.metrics.percentile("classifier.shadow.candidate_ms", 50),
+            "candidate_p95_ms": self.metrics.percentile("classifier.shadow.candidate_ms", 95),
+        }
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_EARLY_FIELDS = frozenset({"intent_id", "confidence"})
+
+
+class IncrementalClassificationParser:
+    """Parses a streamed JSON object field by field so ``intent_id`` and ``confidence`` are known early.
+
+    Early exit is only offered when those two keys are the first ones in the object; any other key
+    arriving first marks the stream ``out_of_order`` and the caller should parse the full text instead.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.order: List[str] = []
+        self.out_of_order = False
+        self._pos: Optional[int] = None  # index just after ``{`` or the last complete field
+        self._failed = False
+
+    def feed(self, chunk: str) -> None:
+        self.text += chunk
+        if not self._failed:
+            self._advance()
+
+    def _skip(self, pos: int) -> int:
+        while pos < len(self.text) and self.text[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _advance(self) -> None:
+        if self._pos is None:
+            start = self._skip(0)
+            if start >= len(self.text):
+                return
+            if self.text[start] != "{":
+                self._failed = True
+                return
+            self._pos = start + 1
+
+        while True:
+            pos = self._skip(self._pos)
+            if pos < len(self.text) and self.text[pos] == ",":
+                pos = self._skip(pos + 1)
+            if pos >= len(self.text) or self.text[pos] == "}":
+                return
+            try:
+                key, pos = _DECODER.raw_decode(self.text, pos)
+            except json.JSONDecodeError:
+                return
+            pos = self._skip(pos)
+            if pos >= len(self.text):
+                return
+            if self.text[pos] != ":" or not isinstance(key, str):
+                self._failed = True
+                return
+            pos = self._skip(pos + 1)
+            try:
+                value, end = _DECODER.raw_decode(self.text, pos)
+            except json.JSONDecodeError:
+                return
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                # A number is only complete once a delimiter follows it ("0." or "0.9" may still become "0.95").
+                following = self._skip(end)
+                if following >= len(self.text) or self.text[following] not in ",}":
+                    return
+            self.fields[key] = value
+            self.order.append(key)
+            if key not in _EARLY_FIELDS and not _EARLY_FIELDS.issubset(self.fields):
+                self.out_of_order = True
+            self._pos = end
+
+    def decided(self) -> Optional[Dict[str, Any]]:
+        """``{"intent_id", "confidence"}`` once both arrived as the leading fields, else ``None``."""
+        if self._failed or self.out_of_order or not _EARLY_FIELDS.issubset(self.fields):
+            return None
+        return {"intent_id": self.fields["intent_id"], "confidence": self.fields["confidence"]}
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import streamlit.components.v1 as st_components
+
+FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "typeahead"
+
+_typeahead = st_components.declare_component("rsv_typeahead", path=str(FRONTEND_DIR))
+
+
+def typeahead_input(
+    label: str,
+    *,
+    key: str,
+    placeholder: str = "",
+    debounce_ms: int = 250,
+    disabled: bool = False,
+) -> str:
+    """Text box that reports its value after a typing pause, so suggestions can refresh without pressing Enter."""
+
+    value = _typeahead(
+        label=label,
+        placeholder=placeholder,
+        debounce_ms=debounce_ms,
+        disabled=disabled,
+        key=key,
+        default={"text": ""},
+    )
+    if not isinstance(value, dict):
+        return ""
+    return str(value.get("text") or "")
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from components.config import env_float, env_str
+
+# USD per million tokens (input, output). Override or extend with RSV_MODEL_PRICES='{"model": [in, out]}'.
+DEFAULT_MODEL_PRICES: Dict[str, tuple] = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+
+WINDOWS = {"1m": 60, "5m": 300, "1h": 3600}
+# The global budget sums cost in buckets of this many seconds, so its hour window is exact to within one bucket.
+BUDGET_BUCKET_SECONDS = 10
+
+
+def load_model_prices() -> Dict[str, tuple]:
+    prices = dict(DEFAULT_MODEL_PRICES)
+    override = env_str("RSV_MODEL_PRICES")
+    if override:
+        try:
+            prices.update({model: tuple(pair) for model, pair in json.loads(override).items()})
+        except (ValueError, TypeError):
+            pass
+    return prices
+
+
+@dataclass(frozen=True)
+class CallContext:
+    """Who a model call is made for, so its spend can be attributed and budgeted."""
+
+    session_id: Optional[str] = None
+    page: Optional[str] = None
+
+
+@dataclass
+class UsageRecord:
+    ts: float
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    wall_ms: float
+    cost_usd: float
+    intent_id: Optional[str] = None
+    page: Optional[str] = None
+    session_id: Optional[str] = None
+
+
+def extract_usage(response: Any) -> Dict[str, int]:
+    """Read token counts from an OpenAI response; missing usage counts as zero."""
+    usage = getattr(response, "usage", None)
+    return {
+        "prompt_tokens": int(getattr(usage, "prompt_tokens", 0) or 0),
+        "completion_tokens": int(getattr(usage, "completion_tokens", 0) or 0),
+    }
+
+
+class UsageTracker:
+    """Per-call token, cost and latency accounting with rolling windows and budget checks.
+
+    The last ``max_records`` calls are kept for the operations page breakdowns. Budgets do not depend on
+    that cap: the global hour is a running total over time buckets, and per-session spend is kept for
+    ``session_ttl_seconds`` after a session's last call (at most ``max_sessions``, least recent dropped first).
+    """
+
+    def __init__(
+        self,
+        prices: Optional[Dict[str, tuple]] = None,
+        session_budget_usd: Optional[float] = None,
+        global_budget_usd_per_hour: Optional[float] = None,
+        max_records: int = 50_000,
+        session_ttl_seconds: float = 24 * 3600,
+        max_sessions: int = 10_000,
+    ):
+        self.prices = prices if prices is not None else load_model_prices()
+        self.session_budget_usd = session_budget_usd
+        self.global_budget_usd_per_hour = global_budget_usd_per_hour
+        self.session_ttl_seconds = session_ttl_seconds
+        self.max_sessions = max_sessions
+        self._records: Deque[UsageRecord] = deque(maxlen=max_records)
+        self._hour_buckets: Deque[List[float]] = deque()  # [bucket start, cost]
+        self._hour_cost = 0.0
+        self._session_cost: "OrderedDict[str, List[float]]" = OrderedDict()  # session -> [cost, last call ts]
+        self._total_cost = 0.0
+        self._total_tokens = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "UsageTracker":
+        return cls(
+            session_budget_usd=env_float("RSV_SESSION_BUDGET_USD"),
+            global_budget_usd_per_hour=env_float("RSV_GLOBAL_BUDGET_USD_PER_HOUR"),
+        )
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        input_price, output_price = self.prices.get(model, (0.0, 0.0))
+        return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+    def record(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        wall_ms: float,
+        *,
+        intent_id: Optional[str] = None,
+        page: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> UsageRecord:
+        entry = UsageRecord(
+            ts=time.time(),
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            wall_ms=wall_ms,
+            cost_usd=self.cost(model, prompt_tokens, completion_tokens),
+            intent_id=intent_id,
+            page=page,
+            session_id=session_id,
+        )
+        with self._lock:
+            self._records.append(entry)
+            self._total_cost += entry.cost_usd
+            self._total_tokens += prompt_tokens + completion_tokens
+            bucket = entry.ts - entry.ts % BUDGET_BUCKET_SECONDS
+            if self._hour_buckets and self._hour_buckets[-1][0] == bucket:
+                self._hour_buckets[-1][1] += entry.cost_usd
+            else:
+                self._hour_buckets.append([bucket, entry.cost_usd])
+            self._hour_cost += entry.cost_usd
+            self._expire_hour(entry.ts)
+            if session_id:
+                spent = self._session_cost.pop(session_id, [0.0, 0.0])
+                self._session_cost[session_id] = [spent[0] + entry.cost_usd, entry.ts]
+                self._prune_sessions(entry.ts)
+        return entry
+
+    def _expire_hour(self, now: float) -> None:
+        cutoff = now - WINDOWS["1h"]
+        while self._hour_buckets and self._hour_buckets[0][0] + BUDGET_BUCKET_SECONDS <= cutoff:
+            self._hour_cost -= self._hour_buckets.popleft()[1]
+        if not self._hour_buckets:
+            self._hour_cost = 0.0  # drop accumulated float error
+
+    def _prune_sessions(self, now: float) -> None:
+        cutoff = now - self.session_ttl_seconds
+        while self._session_cost:
+            oldest = next(iter(self._session_cost.values()))
+            if len(self._session_cost) <= self.max_sessions and oldest[1] >= cutoff:
+                break
+            self._session_cost.popitem(last=False)
+
+    def hour_cost(self) -> float:
+        """Spend over the last hour (to within ``BUDGET_BUCKET_SECONDS``), whatever the call volume."""
+        with self._lock:
+            self._expire_hour(time.time())
+            return self._hour_cost
+
+    def _window(self, seconds: float) -> List[UsageRecord]:
+        cutoff = time.time() - seconds
+        with self._lock:
+            return [entry for entry in self._records if entry.ts >= cutoff]
+
+    def window_totals(self, seconds: float) -> Dict[str, float]:
+        records = self._window(seconds)
+        prompt = sum(entry.prompt_tokens for entry in records)
+        completion = sum(entry.completion_tokens for entry in records)
+        minutes = seconds / 60
+        return {
+            "calls": len(records),
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "tokens_per_minute": (prompt + completion) / minutes if minutes else 0.0,
+            "cost_usd": sum(entry.cost_usd for entry in records),
+        }
+
+    def breakdown(self, field: str, seconds: float = 3600) -> List[Dict[str, Any]]:
+        """Calls, tokens and cost grouped by ``intent_id``, ``page``, ``model`` or ``session_id``."""
+        groups: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "tokens": 0, "cost_usd": 0.0})
+        for entry in self._window(seconds):
+            group = groups[getattr(entry, field) or "(none)"]
+            group["calls"] += 1
+            group["tokens"] += entry.prompt_tokens + entry.completion_tokens
+            group["cost_usd"] += entry.cost_usd
+        rows = [{field: key, **values} for key, values in groups.items()]
+        return sorted(rows, key=lambda row: -row["cost_usd"])
+
+    def totals(self) -> Dict[str, float]:
+        with self._lock:
+            return {"cost_usd": self._total_cost, "tokens": self._total_tokens, "sessions": len(self._session_cost)}
+
+    def session_cost(self, session_id: Optional[str]) -> float:
+        with self._lock:
+            if not session_id or session_id not in self._session_cost:
+                return 0.0
+            cost, last_call = self._session_cost[session_id]
+            return cost if last_call >= time.time() - self.session_ttl_seconds else 0.0
+
+    def budget_status(self, session_id: Optional[str] = None) -> str:
+        """``ok``, ``session_exceeded`` or ``global_exceeded``; callers degrade to local/guided answers when not ok."""
+        if self.global_budget_usd_per_hour is not None and self.hour_cost() >= self.global_budget_usd_per_hour:
+            return "global_exceeded"
+        if self.session_budget_usd is not None and self.session_cost(session_id) >= self.session_budget_usd:
+            return "session_exceeded"
+        return "ok"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._hour_buckets.clear()
+            self._hour_cost = 0.0
+            self._session_cost.clear()
+            self._total_cost = 0.0
+            self._total_tokens = 0
+
+
+USAGE = UsageTracker.from_env()
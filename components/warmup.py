@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from components.config import env_bool
+from components.intent_classifier import IntentClassifier
+
+WARMUP_ENV_VAR = "RSV_WARMUP"
+
+_PROCESS_HANDLE: Optional["WarmupHandle"] = None
+_PROCESS_LOCK = threading.Lock()
+
+
+class WarmupHandle:
+    """Tracks a background warm-up so callers can poll or wait for steady-state readiness."""
+
+    def __init__(self) -> None:
+        self._ready = threading.Event()
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "steps": dict(self.steps),
+        }
+
+    def _mark_ready(self) -> None:
+        self.finished_at = datetime.now(timezone.utc)
+        self._ready.set()
+
+
+def _run_step(handle: WarmupHandle, name: str, func) -> None:
+    started = time.perf_counter()
+    try:
+        func()
+        handle.steps[name] = {"ok": True}
+    except Exception as exc:  # noqa: BLE001 - warm-up is best effort
+        handle.steps[name] = {"ok": False, "error": str(exc)}
+    handle.steps[name]["ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def warm_up(classifier: IntentClassifier, handle: Optional[WarmupHandle] = None) -> WarmupHandle:
+    """Pay first-request costs up front: prompt build, schema validation and the pooled HTTPS connection."""
+
+    handle = handle or WarmupHandle()
+    _run_step(handle, "system_prompt", classifier._build_system_prompt)
+
+    sample_intent = next(iter(classifier.response_bank.get_allowed_intent_ids()), "__NO_MATCH__")
+    sample = json.dumps({"intent_id": sample_intent, "confidence": 1.0, "slots": {}, "rationale": "warm-up"})
+
+    def parse_validate() -> None:
+        # Also pays the deferred pydantic import and schema build.
+        from components.classification_schema import ClassificationResult
+
+        ClassificationResult.model_validate(json.loads(sample))
+
+    _run_step(handle, "parse_validate", parse_validate)
+
+    if classifier.client is not None:
+        # Listing models resolves DNS and completes the TLS handshake on the shared client's pool.
+        _run_step(handle, "connection", classifier.client.models.list)
+
+    handle._mark_ready()
+    classifier.metrics.increment("classifier.warmup.completed")
+    if classifier.event_log:
+        classifier.event_log.record("warmup", **handle.status())
+    return handle
+
+
+def start_warmup(classifier: IntentClassifier) -> WarmupHandle:
+    handle = WarmupHandle()
+    thread = threading.Thread(target=warm_up, args=(classifier, handle), name="classifier-warmup", daemon=True)
+    thread.start()
+    return handle
+
+
+def ensure_process_warmup(classifier: IntentClassifier) -> Optional[WarmupHandle]:
+    """Start warm-up once per process when ``RSV_WARMUP`` is enabled; later calls return the same handle."""
+
+    global _PROCESS_HANDLE
+    if not env_bool(WARMUP_ENV_VAR):
+        return None
+    with _PROCESS_LOCK:
+        if _PROCESS_HANDLE is None:
+            _PROCESS_HANDLE = start_warmup(classifier)
+    return _PROCESS_HANDLE
+
+
+def process_warmup_handle() -> Optional[WarmupHandle]:
+    return _PROCESS_HANDLE
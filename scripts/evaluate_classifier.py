@@ -0,0 +1,137 @@
+"""Compare classifier output formats on accuracy, latency and tokens.
+
+Each labelled message is sent straight to the model (local matching and the
+classification cache are bypassed) once per output format, then run through the
+same allowed-intent and confidence checks as ``IntentClassifier.classify``.
+
+    python -m scripts.evaluate_classifier --formats json,compact
+    python -m scripts.evaluate_classifier --dataset eval.jsonl --model gpt-4.1-mini --repeat 3
+
+``--dataset`` is JSON lines of ``{"message": "...", "intent_id": "..."}``; without it
+the bank's ``sample_user_phrases`` are used as labelled examples. Point at the
+mock server with ``OPENAI_BASE_URL`` for an offline dry run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.bank_registry import DEFAULT_BANK_ID, get_registry  # noqa: E402
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.intent_classifier import OUTPUT_FORMATS, IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+
+
+def load_dataset(path: Path) -> List[Dict[str, str]]:
+    examples = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            examples.append({"message": entry["message"], "intent_id": entry["intent_id"]})
+    return examples
+
+
+def bank_examples(bank: ResponseBank) -> List[Dict[str, str]]:
+    return [
+        {"message": phrase, "intent_id": intent["intent_id"]}
+        for intent in bank.intents
+        for phrase in intent.get("sample_user_phrases", [])
+    ]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def evaluate_format(classifier: IntentClassifier, examples: List[Dict[str, str]], repeat: int = 1) -> Dict[str, Any]:
+    """Accuracy, error count, latency percentiles and mean tokens for one classifier configuration."""
+
+    system_prompt = classifier._build_system_prompt()
+    latencies: List[float] = []
+    correct = errors = 0
+    for _ in range(repeat):
+        for example in examples:
+            started = time.perf_counter()
+            result, ok = classifier.query_once(example["message"])
+            errors += not ok
+            latencies.append((time.perf_counter() - started) * 1000)
+            correct += result.intent_id == example["intent_id"]
+
+    calls = len(latencies)
+    usage = classifier.usage.window_totals(float("inf"))
+    return {
+        "format": classifier.output_format,
+        "examples": calls,
+        "accuracy": correct / calls if calls else 0.0,
+        "errors": errors,
+        "p50_ms": _percentile(latencies, 50) if latencies else 0.0,
+        "p95_ms": _percentile(latencies, 95) if latencies else 0.0,
+        "mean_prompt_tokens": usage["prompt_tokens"] / calls if calls else 0.0,
+        "mean_completion_tokens": usage["completion_tokens"] / calls if calls else 0.0,
+        "system_prompt_chars": len(system_prompt),
+    }
+
+
+def render_report(rows: List[Dict[str, Any]]) -> str:
+    header = f"{'format':<8} {'n':>5} {'accuracy':>9} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'prompt tok':>11} {'compl tok':>10}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['format']:<8} {row['examples']:>5} {row['accuracy']:>9.1%} {row['errors']:>7} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['mean_prompt_tokens']:>11.1f} {row['mean_completion_tokens']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", type=Path, help="JSON lines of {message, intent_id}; defaults to the bank's sample phrases")
+    parser.add_argument("--bank", default=DEFAULT_BANK_ID, help="Bank id from the RSV_BANKS manifest")
+    parser.add_argument("--formats", default=",".join(OUTPUT_FORMATS), help="Comma-separated output formats to compare")
+    parser.add_argument("--model", default="gpt-4.1-mini")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Confidence threshold applied to every format")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the dataset per format")
+    parser.add_argument("--limit", type=int, help="Only use the first N examples")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    bank = get_registry().get(args.bank)
+    examples = load_dataset(args.dataset) if args.dataset else bank_examples(bank)
+    examples = examples[: args.limit] if args.limit else examples
+
+    rows = []
+    for output_format in [item.strip() for item in args.formats.split(",") if item.strip()]:
+        classifier = IntentClassifier(
+            response_bank=bank,
+            model=args.model,
+            confidence_threshold=args.threshold,
+            metrics=MetricsRegistry(),
+            cache=ClassificationCache(max_entries=0),
+            usage=UsageTracker(prices={}),
+            output_format=output_format,
+            streaming=False,
+        )
+        if not classifier.client:
+            print("OPENAI_API_KEY is not set; nothing to evaluate.", file=sys.stderr)
+            return 1
+        rows.append(evaluate_format(classifier, examples, repeat=args.repeat))
+
+    print(json.dumps(rows, indent=2) if args.json else render_report(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Export guided mode as a static HTML/JS bundle for CDN serving.
+
+Guided mode only replays approved content: the page's primary question, the
+response, deep links from ``intent_to_page_map.json`` and the
+``next_best_intent_ids`` graph. This builds one HTML entry per page path plus
+content-hashed data, script and style assets, so the guided flow can be served
+without a Python rerun per click. Deep links point at the bundle's own entries;
+only free text hands off to the Streamlit app at ``--app-url``.
+
+    python -m scripts.export_static --out dist/guided --app-url https://rsv.example.org/
+
+Entry HTML files and ``manifest.json`` should be served with a short cache
+lifetime; everything under ``assets/`` is immutable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.bank_registry import DEFAULT_BANK_ID, get_registry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+
+ROOT_PAGE = "app.py"
+
+_RUNTIME_JS = r"""
+(function () {
+  const config = window.RSV_GUIDED;
+  const root = document.getElementById("guided");
+  const storageKey = "rsv-guided:" + config.fingerprint;
+
+  function el(tag, className, text) {
+    const node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+  }
+
+  function loadHistory() {
+    try { return JSON.parse(sessionStorage.getItem(storageKey)) || []; } catch (e) { return []; }
+  }
+
+  function saveHistory(history) {
+    try { sessionStorage.setItem(storageKey, JSON.stringify(history.slice(-100))); } catch (e) { /* storage full or disabled */ }
+  }
+
+  fetch(config.data).then((r) => r.json()).then((data) => {
+    let history = loadHistory();
+    const seen = new Set(history.filter((m) => m.role === "assistant").map((m) => m.intent_id));
+    let lastIntent = history.length ? history[history.length - 1].intent_id : null;
+
+    function ask(intentId) {
+      const intent = data.intents[intentId];
+      if (!intent) return;
+      history.push({ role: "user", content: intent.user_question, intent_id: null });
+      history.push({ role: "assistant", content: intent.response, intent_id: intentId });
+      lastIntent = intentId;
+      saveHistory(history);
+      render();
+    }
+
+    function render() {
+      root.replaceChildren();
+      const log = el("div", "rsv-history");
+      history.forEach((message) => {
+        const bubble = el("div", "rsv-message rsv-" + message.role);
+        bubble.appendChild(el("p", "", message.content));
+        const intent = message.intent_id && data.intents[message.intent_id];
+        if (intent && message.role === "assistant") {
+          intent.links.forEach((link) => {
+            const a = el("a", "rsv-link", "Go to " + link.label + " ➡️");
+            a.href = config.root + link.entry;
+            bubble.appendChild(a);
+          });
+        }
+        log.appendChild(bubble);
+      });
+      root.appendChild(log);
+
+      const next = lastIntent && data.intents[lastIntent] ? data.intents[lastIntent].next_best_intent_ids : [];
+      if (next.length) {
+        root.appendChild(el("p", "rsv-caption", "Next best questions"));
+        const row = el("div", "rsv-next");
+        next.forEach((intentId) => {
+          const button = el("button", "", data.intents[intentId].user_question);
+          button.addEventListener("click", () => ask(intentId));
+          row.appendChild(button);
+        });
+        root.appendChild(row);
+      }
+      log.lastElementChild && log.lastElementChild.scrollIntoView({ block: "nearest" });
+    }
+
+    const primary = data.pages[config.page] || data.default_intent_id;
+    if (primary && !seen.has(primary)) {
+      ask(primary);
+    } else {
+      render();
+    }
+  });
+})();
+"""
+
+_STYLE_CSS = """
+body { font-family: system-ui, sans-serif; margin: 0; padding: 1rem; max-width: 42rem; }
+.rsv-history { display: flex; flex-direction: column; gap: 0.5rem; }
+.rsv-message { border-radius: 0.5rem; padding: 0.5rem 0.75rem; }
+.rsv-user { background: #eef2ff; align-self: flex-end; }
+.rsv-assistant { background: #f4f4f5; }
+.rsv-message p { margin: 0 0 0.25rem; }
+.rsv-link { display: inline-block; margin-right: 0.75rem; }
+.rsv-caption { color: #6b7280; font-size: 0.875rem; }
+.rsv-next { display: flex; flex-wrap: wrap; gap: 0.5rem; }
+.rsv-next button { border: 1px solid #d4d4d8; border-radius: 0.5rem; background: white; padding: 0.4rem 0.75rem; cursor: pointer; }
+.rsv-free-text { display: inline-block; margin-top: 1rem; }
+"""
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+def url_path_for_page(page_path: str) -> str:
+    """Streamlit's URL path for a page script: ``pages/1_RSV_Basics.py`` -> ``RSV_Basics``, ``app.py`` -> ``""``."""
+    if page_path == ROOT_PAGE:
+        return ""
+    return re.sub(r"^\d+_", "", Path(page_path).stem)
+
+
+def entry_for_page(page_path: str) -> str:
+    """Bundle-relative entry file for a page script: ``pages/3_Eligibility.py`` -> ``Eligibility/index.html``."""
+    url_path = url_path_for_page(page_path)
+    return f"{url_path}/index.html" if url_path else "index.html"
+
+
+def build_guided_data(bank: ResponseBank) -> Dict[str, Any]:
+    intents = {}
+    for intent in bank.intents:
+        intent_id = intent["intent_id"]
+        intents[intent_id] = {
+            "user_question": intent.get("user_question", intent.get("display_name", "Question")),
+            "response": intent.get("response", ""),
+            "next_best_intent_ids": [item["intent_id"] for item in bank.get_next_best(intent_id)],
+            "links": [
+                {"label": link["label"], "entry": entry_for_page(link["page"])}
+                for link in bank.get_page_links_for_intent(intent_id)
+            ],
+        }
+
+    page_paths = sorted({ROOT_PAGE} | {link["page"] for links in bank.page_map.values() for link in links})
+    pages = {}
+    for page_path in page_paths:
+        primary = bank.get_primary_intent_for_page(page_path)
+        if primary:
+            pages[page_path] = primary["intent_id"]
+    return {
+        "fingerprint": bank.fingerprint,
+        "default_intent_id": bank.intents[0]["intent_id"] if bank.intents else None,
+        "intents": intents,
+        "pages": pages,
+        "page_paths": page_paths,
+    }
+
+
+def _render_entry(page_path: str, data: Dict[str, Any], assets: Dict[str, str], depth: int, app_url: str) -> str:
+    prefix = "../" * depth
+    primary = data["pages"].get(page_path) or data["default_intent_id"]
+    title = data["intents"][primary]["user_question"] if primary else "RSV guided questions"
+    config = {"root": prefix, "data": prefix + assets["data"], "page": page_path, "fingerprint": data["fingerprint"]}
+    free_text_url = app_url.rstrip("/") + "/" + url_path_for_page(page_path) + "?chat=free&panel=open"
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="stylesheet" href="{prefix}{assets['style']}">
+</head>
+<body>
+<main id="guided"></main>
+<a class="rsv-free-text" href="{html.escape(free_text_url)}">Ask your own question</a>
+<script>window.RSV_GUIDED = {json.dumps(config)};</script>
+<script src="{prefix}{assets['runtime']}" defer></script>
+</body>
+</html>
+"""
+
+
+def build_bundle(bank: ResponseBank, app_url: str = "/") -> Dict[str, str]:
+    """Return ``{relative path: file content}`` for the whole bundle, manifest included."""
+
+    data = build_guided_data(bank)
+    data_json = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    sources = {"data": (data_json, "guided-data", "json"), "runtime": (_RUNTIME_JS, "guided", "js"), "style": (_STYLE_CSS, "guided", "css")}
+
+    files: Dict[str, str] = {}
+    assets: Dict[str, str] = {}
+    for name, (content, stem, suffix) in sources.items():
+        assets[name] = f"assets/{stem}.{content_hash(content)}.{suffix}"
+        files[assets[name]] = content
+
+    entries: Dict[str, str] = {}
+    for page_path in data["page_paths"]:
+        entry = entry_for_page(page_path)
+        entries[page_path] = entry
+        files[entry] = _render_entry(page_path, data, assets, entry.count("/"), app_url)
+
+    manifest = {"fingerprint": data["fingerprint"], "assets": assets, "entries": entries}
+    files["manifest.json"] = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    return files
+
+
+def write_bundle(files: Dict[str, str], out_dir: Path) -> List[Path]:
+    written = []
+    for relative, content in sorted(files.items()):
+        path = out_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path("dist/guided"), help="Output directory")
+    parser.add_argument("--bank", default=DEFAULT_BANK_ID, help="Bank id from the RSV_BANKS manifest")
+    parser.add_argument("--app-url", default="/", help="Base URL of the Streamlit app, used for the free-text hand-off")
+    args = parser.parse_args(argv)
+
+    bank = get_registry().get(args.bank)
+    written = write_bundle(build_bundle(bank, args.app_url), args.out)
+    print(f"Wrote {len(written)} files to {args.out} (bank {bank.fingerprint[:12]})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+"""Propose new ``sample_user_phrases`` from confidently classified free-text messages.
+
+Reads the classifier event log (see ``RSV_EVENT_LOG``), keeps high-confidence LLM
+classifications, clusters near-duplicate phrasings per intent and prints a unified
+diff against ``data/response_bank.json`` for review. Pass ``--apply`` to write it.
+
+    python -m scripts.mine_phrases --log logs/events.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.event_log import read_events  # noqa: E402
+from components.local_matcher import jaccard, normalize_text, tokenize  # noqa: E402
+from components.response_bank import DEFAULT_BANK_PATH  # noqa: E402
+
+
+@dataclass
+class PhraseCluster:
+    tokens: frozenset
+    phrasings: Counter = field(default_factory=Counter)
+
+    @property
+    def support(self) -> int:
+        return sum(self.phrasings.values())
+
+    @property
+    def representative(self) -> str:
+        # Most frequent surface form; ties go to the first one seen.
+        return max(self.phrasings.items(), key=lambda item: item[1])[0]
+
+
+def collect_candidates(events: Iterable[Dict[str, Any]], allowed_intents: Iterable[str], min_confidence: float) -> Dict[str, List[str]]:
+    allowed = set(allowed_intents)
+    candidates: Dict[str, List[str]] = {}
+    for entry in events:
+        if entry.get("source") != "llm":
+            continue
+        intent_id = entry.get("intent_id")
+        message = (entry.get("message") or "").strip()
+        if intent_id not in allowed or not message:
+            continue
+        if float(entry.get("confidence") or 0.0) < min_confidence:
+            continue
+        candidates.setdefault(intent_id, []).append(" ".join(message.split()))
+    return candidates
+
+
+def cluster_phrases(phrases: Iterable[str], similarity: float) -> List[PhraseCluster]:
+    clusters: List[PhraseCluster] = []
+    for phrase in phrases:
+        tokens = tokenize(phrase)
+        if not tokens:
+            continue
+        best = max(clusters, key=lambda c: jaccard(c.tokens, tokens), default=None)
+        if best is not None and jaccard(best.tokens, tokens) >= similarity:
+            best.phrasings[phrase] += 1
+        else:
+            clusters.append(PhraseCluster(tokens=tokens, phrasings=Counter({phrase: 1})))
+    return clusters
+
+
+def propose_additions(
+    bank: Dict[str, Any],
+    events: Iterable[Dict[str, Any]],
+    *,
+    min_confidence: float = 0.9,
+    min_support: int = 2,
+    similarity: float = 0.6,
+    max_per_intent: int = 5,
+) -> Dict[str, List[str]]:
+    """Return new phrasings per intent that are not already covered by the bank."""
+
+    intents = bank.get("intents", [])
+    known_tokens = [
+        tokenize(phrase)
+        for intent in intents
+        for phrase in [intent.get("user_question", ""), *intent.get("sample_user_phrases", [])]
+    ]
+    known_normalized = {
+        normalize_text(phrase)
+        for intent in intents
+        for phrase in [intent.get("user_question", ""), *intent.get("sample_user_phrases", [])]
+    }
+
+    candidates = collect_candidates(events, [intent["intent_id"] for intent in intents], min_confidence)
+    proposals: Dict[str, List[str]] = {}
+    for intent_id, phrases in candidates.items():
+        clusters = sorted(cluster_phrases(phrases, similarity), key=lambda c: -c.support)
+        picked: List[str] = []
+        for cluster in clusters:
+            if cluster.support < min_support or len(picked) >= max_per_intent:
+                continue
+            phrase = cluster.representative
+            if normalize_text(phrase) in known_normalized:
+                continue
+            if any(jaccard(cluster.tokens, tokens) >= similarity for tokens in known_tokens):
+                continue
+            picked.append(phrase)
+        if picked:
+            proposals[intent_id] = picked
+    return proposals
+
+
+def apply_additions(bank: Dict[str, Any], proposals: Dict[str, List[str]]) -> Dict[str, Any]:
+    updated = json.loads(json.dumps(bank))
+    for intent in updated.get("intents", []):
+        additions = proposals.get(intent["intent_id"])
+        if additions:
+            intent["sample_user_phrases"] = [*intent.get("sample_user_phrases", []), *additions]
+    return updated
+
+
+def render_bank(bank: Dict[str, Any]) -> str:
+    return json.dumps(bank, indent=2, ensure_ascii=False) + "\n"
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", required=True, type=Path, help="Event log written via RSV_EVENT_LOG")
+    parser.add_argument("--bank", type=Path, default=DEFAULT_BANK_PATH, help="Response bank to extend")
+    parser.add_argument("--min-confidence", type=float, default=0.9)
+    parser.add_argument("--min-support", type=int, default=2, help="Minimum occurrences of a phrasing cluster")
+    parser.add_argument("--similarity", type=float, default=0.6, help="Token Jaccard similarity that merges phrasings")
+    parser.add_argument("--max-per-intent", type=int, default=5)
+    parser.add_argument("--apply", action="store_true", help="Write the proposed additions to the bank file")
+    args = parser.parse_args(argv)
+
+    original_text = args.bank.read_text(encoding="utf-8")
+    bank = json.loads(original_text)
+    proposals = propose_additions(
+        bank,
+        read_events(args.log, event="classification"),
+        min_confidence=args.min_confidence,
+        min_support=args.min_support,
+        similarity=args.similarity,
+        max_per_intent=args.max_per_intent,
+    )
+    if not proposals:
+        print("No new phrasings to propose.", file=sys.stderr)
+        return 0
+
+    updated_text = render_bank(apply_additions(bank, proposals))
+    diff = difflib.unified_diff(
+        original_text.splitlines(keepends=True),
+        updated_text.splitlines(keepends=True),
+        fromfile=f"a/{args.bank.name}",
+        tofile=f"b/{args.bank.name}",
+    )
+    sys.stdout.writelines(diff)
+
+    if args.apply:
+        args.bank.write_text(updated_text, encoding="utf-8")
+        print(f"Wrote {sum(len(v) for v in proposals.values())} phrasings to {args.bank}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,350 @@
+"""Local OpenAI-compatible mock for offline load and chaos testing.
+
+Implements the two endpoints the classifier uses, ``GET /v1/models`` and
+``POST /v1/chat/completions``, with configurable latency, injected faults and
+scripted intent answers. Point the app at it with ``OPENAI_BASE_URL``:
+
+    python -m scripts.mock_openai_server --port 8765 --latency lognormal:250,0.5 --error-429 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock streamlit run app.py
+
+Latency specs: ``fixed:MS``, ``uniform:LOW_MS,HIGH_MS``, ``normal:MEAN_MS,STDDEV_MS``
+or ``lognormal:MEDIAN_MS,SIGMA``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.local_matcher import LocalMatcher  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+
+COMPACT_PROMPT_MARKER = "Reply with only the code"
+_COMPACT_LINE = re.compile(r"^(\d+): (.+?) \(examples:", re.MULTILINE)
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Turn a latency spec into a sampler returning seconds."""
+
+    kind, _, params = spec.partition(":")
+    values = [float(part) for part in params.split(",") if part.strip()] if params else []
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal" and len(values) == 2:
+        median_ms, sigma = values
+        return lambda rng: median_ms * rng.lognormvariate(0.0, sigma) / 1000
+    raise ValueError(f"Unsupported latency spec: {spec!r}")
+
+
+@dataclass
+class ScriptedAnswer:
+    pattern: re.Pattern
+    intent_id: str
+    confidence: float = 0.95
+    model: Optional[str] = None  # only answer requests for this model
+    content: Optional[str] = None  # reply with exactly this text (e.g. malformed output) instead of a generated answer
+
+
+@dataclass
+class MockConfig:
+    latency: str = "fixed:0"
+    error_401: float = 0.0
+    error_429: float = 0.0
+    error_500: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 30.0
+    api_key: Optional[str] = None
+    default_confidence: float = 0.9
+    scripted: List[ScriptedAnswer] = field(default_factory=list)
+    seed: Optional[int] = None
+    stream_chunk_chars: int = 8
+    stream_chunk_ms: float = 0.0
+
+    @classmethod
+    def load_script(cls, path: Path) -> List[ScriptedAnswer]:
+        """Read ``[{"match": "regex", "intent_id": "...", "confidence": 0.9, "model": "...", "content": "..."}, ...]``."""
+        rules = json.loads(path.read_text(encoding="utf-8"))
+        return [
+            ScriptedAnswer(
+                re.compile(rule["match"], re.IGNORECASE),
+                rule.get("intent_id", "__NO_MATCH__"),
+                float(rule.get("confidence", 0.95)),
+                model=rule.get("model"),
+                content=rule.get("content"),
+            )
+            for rule in rules
+        ]
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple, config: MockConfig, response_bank: Optional[ResponseBank] = None):
+        super().__init__(address, MockOpenAIHandler)
+        self.config = config
+        self.matcher = LocalMatcher(response_bank or ResponseBank())
+        self.sample_latency = parse_latency(config.latency)
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+        self.request_count = 0
+        self.streams_abandoned = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def draw(self) -> float:
+        with self._rng_lock:
+            self.request_count += 1
+            return self._rng.random()
+
+    def latency(self) -> float:
+        with self._rng_lock:
+            return self.sample_latency(self._rng)
+
+    def stream_abandoned(self) -> None:
+        with self._rng_lock:
+            self.streams_abandoned += 1
+
+    def scripted_rule(self, message: str, model: Optional[str] = None) -> Optional[ScriptedAnswer]:
+        return next(
+            (rule for rule in self.config.scripted if rule.pattern.search(message) and rule.model in (None, model)),
+            None,
+        )
+
+    def answer(self, message: str, model: Optional[str] = None) -> Dict[str, Any]:
+        rule = self.scripted_rule(message, model)
+        if rule:
+            return {"intent_id": rule.intent_id, "confidence": rule.confidence}
+        intent_id = self.matcher.exact_match(message)
+        if not intent_id:
+            suggestions = self.matcher.suggest(message, limit=1)
+            intent_id = suggestions[0]["intent_id"] if suggestions else None
+        if intent_id:
+            return {"intent_id": intent_id, "confidence": self.config.default_confidence}
+        return {"intent_id": "__NO_MATCH__", "confidence": 0.2}
+
+    def compact_answer(self, answer: Dict[str, Any], system_prompt: str) -> str:
+        """Answer the compact protocol: the prompt's numbered intents are mapped back through the bank."""
+        codes = {}
+        for code, question in _COMPACT_LINE.findall(system_prompt):
+            intent_id = self.matcher.exact_match(question)
+            if intent_id:
+                codes.setdefault(intent_id, int(code))
+        return f"{codes.get(answer['intent_id'], 0)} {answer['confidence']}"
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    server: MockOpenAIServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature from BaseHTTPRequestHandler
+        return
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, error_type: str) -> None:
+        self._send_json(status, {"error": {"message": message, "type": error_type, "code": None, "param": None}})
+
+    def _inject_faults(self) -> bool:
+        """Apply latency and injected errors; returns True when a response was already sent."""
+        config = self.server.config
+        expected = f"Bearer {config.api_key}" if config.api_key else None
+        if expected and self.headers.get("Authorization") != expected:
+            self._send_error(401, "Incorrect API key provided.", "invalid_request_error")
+            return True
+
+        roll = self.server.draw()
+        time.sleep(self.server.latency())
+        thresholds = [
+            (config.timeout_rate, None),
+            (config.error_401, (401, "Injected authentication failure.", "invalid_request_error")),
+            (config.error_429, (429, "Injected rate limit.", "rate_limit_error")),
+            (config.error_500, (500, "Injected server error.", "server_error")),
+        ]
+        cumulative = 0.0
+        for rate, error in thresholds:
+            cumulative += rate
+            if roll < cumulative:
+                if error is None:
+                    # Hold the connection open past the client's timeout.
+                    time.sleep(config.timeout_seconds)
+                    self.close_connection = True
+                    return True
+                self._send_error(*error)
+                return True
+        return False
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path.rstrip("/") != "/v1/models":
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+            return
+        if self._inject_faults():
+            return
+        self._send_json(200, {"object": "list", "data": [{"id": "mock-model", "object": "model", "created": 0, "owned_by": "mock"}]})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+            return
+        if self._inject_faults():
+            return
+        try:
+            request = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(400, "Request body is not valid JSON.", "invalid_request_error")
+            return
+
+        messages = request.get("messages", [])
+        user_message = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+        model = request.get("model", "mock-model")
+        rule = self.server.scripted_rule(user_message, model)
+        answer = self.server.answer(user_message, model)
+        system_prompt = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") == "system")
+        if rule and rule.content is not None:
+            content = rule.content
+        elif COMPACT_PROMPT_MARKER in system_prompt:
+            content = self.server.compact_answer(answer, system_prompt)
+        else:
+            content = json.dumps({**answer, "slots": {}, "rationale": "mock answer"})
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4 + 1
+        completion_tokens = len(content) // 4 + 1
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        if request.get("stream"):
+            include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+            self._send_stream(completion_id, model, content, usage if include_usage else None)
+            return
+        self._send_json(
+            200,
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            },
+        )
+
+    def _send_stream(self, completion_id: str, model: str, content: str, usage: Optional[Dict[str, int]]) -> None:
+        """Server-sent events in ``chat.completion.chunk`` format, ``stream_chunk_chars`` characters per chunk."""
+
+        config = self.server.config
+        base = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model}
+        step = max(1, config.stream_chunk_chars)
+        events = [{**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]}]
+        events += [
+            {**base, "choices": [{"index": 0, "delta": {"content": content[i : i + step]}, "finish_reason": None}]}
+            for i in range(0, len(content), step)
+        ]
+        events.append({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if usage:
+            events.append({**base, "choices": [], "usage": usage})
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            for event in events:
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                if config.stream_chunk_ms:
+                    time.sleep(config.stream_chunk_ms / 1000)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading early, which is exactly what streaming classification does.
+            self.server.stream_abandoned()
+
+
+@contextmanager
+def run_mock_server(config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0) -> Iterator[MockOpenAIServer]:
+    """Serve in a background thread for the duration of the block (port 0 picks a free port)."""
+
+    server = MockOpenAIServer((host, port), config or MockConfig())
+    thread = threading.Thread(target=server.serve_forever, name="mock-openai", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0", help="Latency distribution, e.g. lognormal:250,0.5")
+    parser.add_argument("--error-401", type=float, default=0.0, help="Fraction of requests failing with 401")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Fraction of requests failing with 429")
+    parser.add_argument("--error-500", type=float, default=0.0, help="Fraction of requests failing with 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests that hang")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0, help="How long hanging requests stall")
+    parser.add_argument("--api-key", help="Reject requests whose bearer token differs (401)")
+    parser.add_argument("--confidence", type=float, default=0.9, help="Confidence for answers found in the response bank")
+    parser.add_argument("--script", type=Path, help="JSON list of {match, intent_id, confidence, model?, content?} rules checked first")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible latency and fault sequences")
+    parser.add_argument("--stream-chunk-chars", type=int, default=8, help="Characters per streamed chunk")
+    parser.add_argument("--stream-chunk-ms", type=float, default=0.0, help="Delay between streamed chunks")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency=args.latency,
+        error_401=args.error_401,
+        error_429=args.error_429,
+        error_500=args.error_500,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        api_key=args.api_key,
+        default_confidence=args.confidence,
+        scripted=MockConfig.load_script(args.script) if args.script else [],
+        seed=args.seed,
+        stream_chunk_chars=args.stream_chunk_chars,
+        stream_chunk_ms=args.stream_chunk_ms,
+    )
+    server = MockOpenAIServer((args.host, args.port), config)
+    print(f"Mock OpenAI server listening on {server.base_url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
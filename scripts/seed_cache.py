@@ -0,0 +1,187 @@
+"""Build the classification seed table so a fresh deploy answers common phrasings without a model call.
+
+Phrasings come from an optional paraphrase corpus and, optionally, past free-text
+traffic in the classifier event log. Each one is classified once at build time and
+written to ``data/classification_seed.json`` under the response bank's
+fingerprint; ``IntentClassifier`` loads the matching section at startup and
+answers those phrasings like exact matches.
+
+    python -m scripts.seed_cache --paraphrases data/paraphrases.jsonl
+    python -m scripts.seed_cache --log logs/events.jsonl --workers 8
+    python -m scripts.seed_cache --paraphrases data/paraphrases.jsonl --offline
+
+``--paraphrases`` is JSON lines of ``{"message": "...", "intent_id": "..."}``; the
+label is optional and labelled lines are trusted as-is. Unlabelled phrasings go to
+the model in parallel, or with ``--offline`` (or no ``OPENAI_API_KEY``) to a local
+word-overlap stand-in that only keeps clear winners, scored by their overlap.
+Results below ``--threshold`` (the classifier's confidence threshold) are not
+seeded. ``user_question`` and ``sample_user_phrases`` are already answered by the
+exact-phrase index, so they are counted but not re-classified.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.bank_registry import DEFAULT_BANK_ID, get_registry  # noqa: E402
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.classification_seed import DEFAULT_SEED_PATH, build_seed  # noqa: E402
+from components.event_log import read_events  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.local_matcher import LocalMatcher, normalize_text  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+
+# The offline stand-in only answers when one intent leads the runner-up by this much word overlap; how much
+# overlap is enough is left to build_seed's confidence threshold, like any other answer.
+OFFLINE_MIN_MARGIN = 0.2
+
+
+def load_paraphrases(path: Path) -> List[Dict[str, Optional[str]]]:
+    phrasings = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            phrasings.append({"message": entry["message"], "intent_id": entry.get("intent_id")})
+    return phrasings
+
+
+def logged_phrasings(path: Path) -> List[Dict[str, Optional[str]]]:
+    """Messages that needed a model call in past traffic: exactly the phrasings a warm start should cover."""
+    return [
+        {"message": entry["message"], "intent_id": None}
+        for entry in read_events(path, event="classification")
+        if entry.get("source") == "llm" and entry.get("message")
+    ]
+
+
+def collect_phrasings(bank: ResponseBank, sources: List[Dict[str, Optional[str]]]) -> Tuple[List[Dict[str, Optional[str]]], int]:
+    """Deduplicate by normalized text and drop phrasings the exact-phrase index already answers.
+
+    Returns the phrasings to classify and how many were already local (bank phrasings included).
+    """
+    matcher = LocalMatcher(bank)
+    bank_phrasings = [
+        {"message": phrase, "intent_id": intent["intent_id"]}
+        for intent in bank.intents
+        for phrase in [intent.get("user_question", ""), *intent.get("sample_user_phrases", [])]
+    ]
+    seen: Dict[str, Dict[str, Optional[str]]] = {}
+    already_local = set()
+    for phrasing in [*bank_phrasings, *sources]:
+        normalized = normalize_text(phrasing["message"])
+        if not normalized:
+            continue
+        if matcher.exact_match(normalized):
+            already_local.add(normalized)
+            continue
+        existing = seen.get(normalized)
+        if existing is None or (phrasing["intent_id"] and not existing["intent_id"]):
+            seen[normalized] = phrasing
+    return list(seen.values()), len(already_local)
+
+
+def _result(intent_id: str, confidence: float, rationale: str) -> Dict[str, Any]:
+    from components.classification_schema import ClassificationResult
+
+    return ClassificationResult(intent_id=intent_id, confidence=confidence, slots={}, rationale=rationale).model_dump()
+
+
+def classify_offline(matcher: LocalMatcher, message: str) -> Dict[str, Any]:
+    scores = matcher.scores(message)
+    if not scores or (len(scores) > 1 and scores[0][1] - scores[1][1] < OFFLINE_MIN_MARGIN):
+        return _result("__NO_MATCH__", 0.0, "No clear local winner")
+    # The overlap score is the confidence, so --threshold drops weak overlaps like weak model answers.
+    return _result(scores[0][0], scores[0][1], "Seeded offline by word overlap with the response bank")
+
+
+def classify_online(classifier: IntentClassifier, message: str) -> Dict[str, Any]:
+    result, _ = classifier.query_once(message)
+    return result.model_dump()
+
+
+def seed_results(
+    bank: ResponseBank, phrasings: List[Dict[str, Optional[str]]], classifier: Optional[IntentClassifier], workers: int = 8
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Classify every phrasing: labels are trusted, the rest go to ``classifier`` in parallel or the offline stand-in."""
+    allowed = set(bank.get_allowed_intent_ids())
+    results = [
+        (phrasing["message"], _result(phrasing["intent_id"], 1.0, "Labelled paraphrase"))
+        for phrasing in phrasings
+        if phrasing["intent_id"] in allowed
+    ]
+    unlabelled = [phrasing["message"] for phrasing in phrasings if phrasing["intent_id"] not in allowed]
+    if classifier is None:
+        matcher = LocalMatcher(bank)
+        results.extend((message, classify_offline(matcher, message)) for message in unlabelled)
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="seed") as pool:
+            results.extend(zip(unlabelled, pool.map(lambda message: classify_online(classifier, message), unlabelled)))
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paraphrases", type=Path, help="JSON lines of {message, intent_id?}")
+    parser.add_argument("--log", type=Path, help="Classifier event log (RSV_EVENT_LOG) to take past model-classified messages from")
+    parser.add_argument("--bank", default=DEFAULT_BANK_ID, help="Bank id from the RSV_BANKS manifest")
+    parser.add_argument("--out", type=Path, default=DEFAULT_SEED_PATH, help="Seed file; other deployed banks' sections are kept")
+    parser.add_argument("--model", default="gpt-4.1-mini")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel model calls")
+    parser.add_argument("--offline", action="store_true", help="Use the local word-overlap stand-in instead of the model")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Confidence below which results are not seeded")
+    args = parser.parse_args(argv)
+
+    registry = get_registry()
+    bank = registry.get(args.bank)
+    sources = load_paraphrases(args.paraphrases) if args.paraphrases else []
+    if args.log:
+        sources.extend(logged_phrasings(args.log))
+    phrasings, already_local = collect_phrasings(bank, sources)
+
+    classifier = None
+    if not args.offline:
+        classifier = IntentClassifier(
+            response_bank=bank,
+            model=args.model,
+            confidence_threshold=args.threshold,
+            metrics=MetricsRegistry(),
+            cache=ClassificationCache(max_entries=0),
+            usage=UsageTracker(prices={}),
+            streaming=False,
+        )
+        if not classifier.client:
+            print("OPENAI_API_KEY is not set; using the offline stand-in.", file=sys.stderr)
+            classifier = None
+    source = "offline" if classifier is None else f"model:{args.model}"
+
+    results = seed_results(bank, phrasings, classifier, workers=args.workers)
+    existing = json.loads(args.out.read_text(encoding="utf-8")) if args.out.exists() else None
+    keep = [registry.get(bank_id).fingerprint for bank_id in registry.bank_ids() if bank_id != args.bank]
+    payload = build_seed(
+        args.bank, bank, results, args.model, source, existing=existing, keep_fingerprints=keep, min_confidence=args.threshold
+    )
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    seeded = len(payload["banks"][bank.fingerprint]["entries"])
+    print(
+        f"Seeded {seeded} of {len(phrasings)} phrasings for bank {args.bank} ({bank.fingerprint[:12]}, {source}); "
+        f"{already_local} already answered locally. Wrote {args.out}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_cache import SHARED_CACHE  # noqa: E402
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+# Re-record every cassette-backed test against the mock server with:
+#   RSV_RECORD_CASSETTES=1 python -m pytest
+RECORDING = os.getenv("RSV_RECORD_CASSETTES") == "1"
+_RECORDED: set = set()
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "mock_openai(**options): how the mock server answers while recording; MockConfig fields plus "
+        "reachable=False (connection refused) and response_format=False (an SDK without that option)",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_classification_cache():
+    """Keep cached answers from one test leaking into the next."""
+    SHARED_CACHE.clear()
+    yield
+    SHARED_CACHE.clear()
+
+
+@pytest.fixture
+def openai_cassette(request):
+    """OpenAI client replaying ``tests/cassettes/<test module>.json``, so tests never touch the network.
+
+    With ``RSV_RECORD_CASSETTES=1`` the module's cassette is rebuilt instead: calls go to a mock server set
+    up from the test's ``mock_openai`` marker and are recorded as they happen. Each test must send
+    requests no other test in the module sends, since a cassette keeps one answer per request.
+    """
+
+    from components.cassette import Cassette, CassetteClient
+
+    path = CASSETTE_DIR / f"{request.module.__name__.rsplit('.', 1)[-1]}.json"
+    if not RECORDING:
+        yield CassetteClient(Cassette(path, mode="replay"))
+        return
+
+    from openai import OpenAI
+
+    from scripts.mock_openai_server import MockConfig, run_mock_server
+
+    if path not in _RECORDED:
+        path.unlink(missing_ok=True)
+        _RECORDED.add(path)
+    marker = request.node.get_closest_marker("mock_openai")
+    options = dict(marker.kwargs) if marker else {}
+    reachable = options.pop("reachable", True)
+    response_format = options.pop("response_format", True)
+    with run_mock_server(MockConfig(**options)) as server:
+        # Port 9 (discard) refuses connections, which the SDK reports as APIConnectionError.
+        live = OpenAI(api_key="mock-key", base_url=server.base_url if reachable else "http://127.0.0.1:9/v1", max_retries=0)
+        if not response_format:
+            create = live.chat.completions.create
+
+            def create_without_response_format(**kwargs):
+                if "response_format" in kwargs:
+                    raise TypeError("create() got an unexpected keyword argument 'response_format'")
+                return create(**kwargs)
+
+            live.chat.completions.create = create_without_response_format
+        yield CassetteClient(Cassette(path, mode="record"), inner=live)
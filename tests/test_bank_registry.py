@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.bank_registry import DEFAULT_BANK_ID, BankRegistry  # noqa: E402
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.local_matcher import LocalMatcher  # noqa: E402
+
+
+def write_manifest(tmp_path: Path) -> Path:
+    shared = {"intent_id": "scheduling", "user_question": "How do I book?", "response": "Book online."}
+    english = {"intents": [shared, {"intent_id": "cost", "user_question": "What does it cost?", "response": "Varies."}]}
+    spanish = {"intents": [shared, {"intent_id": "cost", "user_question": "¿Cuánto cuesta?", "response": "Varía."}]}
+    (tmp_path / "en.json").write_text(json.dumps(english), encoding="utf-8")
+    (tmp_path / "es.json").write_text(json.dumps(spanish), encoding="utf-8")
+    manifest = {"banks": {"en": {"bank": "en.json"}, "es": {"bank": "es.json", "label": "Español"}}}
+    (tmp_path / "banks.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return tmp_path / "banks.json"
+
+
+def test_registry_serves_banks_and_shares_identical_content(tmp_path: Path) -> None:
+    registry = BankRegistry.from_manifest(write_manifest(tmp_path))
+
+    english, spanish = registry.get("en"), registry.get("es")
+
+    assert registry.bank_ids() == [DEFAULT_BANK_ID, "en", "es"]
+    assert registry.get("en") is english
+    assert registry.resolve("fr") == DEFAULT_BANK_ID
+    assert registry.label("es") == "Español"
+    assert english.intents[0] is spanish.intents[0]
+    assert english.intents[1] is not spanish.intents[1]
+    assert english.fingerprint != spanish.fingerprint
+
+
+def test_each_bank_has_its_own_prompt_index_and_cache_namespace(tmp_path: Path) -> None:
+    registry = BankRegistry.from_manifest(write_manifest(tmp_path))
+    cache = ClassificationCache()
+    english = IntentClassifier(response_bank=registry.get("en"), cache=cache)
+    spanish = IntentClassifier(response_bank=registry.get("es"), cache=cache)
+
+    assert english._build_system_prompt() != spanish._build_system_prompt()
+    assert english.local_matcher is LocalMatcher.for_bank(registry.get("en"))
+    assert english.local_matcher is not spanish.local_matcher
+
+    cache.put(english.cache_namespace, english._cache_key("precio"), {"intent_id": "cost", "confidence": 0.9, "rationale": "x"})
+    assert english._cache_lookup("precio") is not None
+    assert spanish._cache_lookup("precio") is None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.cassette import Cassette, CassetteClient, CassetteError  # noqa: E402
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+
+CASSETTE = Path(__file__).parent / "cassettes" / "classifier.json"
+
+# Re-record against the mock server (or a real endpoint) with:
+#   RSV_RECORD_CASSETTES=1 python -m pytest tests/test_cassette.py
+RECORDING = os.getenv("RSV_RECORD_CASSETTES") == "1"
+
+
+def build_bank() -> ResponseBank:
+    intents = [
+        {"intent_id": "eligible", "user_question": "Am I eligible?", "sample_user_phrases": ["who qualifies"], "response": "Eligibility details."},
+        {"intent_id": "scheduling", "user_question": "How do I book?", "sample_user_phrases": ["book a slot"], "response": "Booking details."},
+    ]
+    return ResponseBank(bank={"intents": intents}, page_map={})
+
+
+def build_classifier(client, **options) -> IntentClassifier:
+    classifier = IntentClassifier(
+        response_bank=build_bank(),
+        client=client,
+        metrics=MetricsRegistry(),
+        cache=ClassificationCache(max_entries=0),
+        usage=UsageTracker(prices={}),
+        **options,
+    )
+    classifier.api_key = "cassette"
+    return classifier
+
+
+def exercise(client) -> dict:
+    """The fixed set of calls stored in the cassette."""
+    return {
+        "json": build_classifier(client).classify("can I get the jab at my age").intent_id,
+        "compact": build_classifier(client, output_format="compact").classify("where do I book the jab").intent_id,
+        "stream": build_classifier(client, streaming=True).classify("can I get the jab at my age").intent_id,
+        "rate_limited": build_classifier(client, model="rate-limited").classify("can I get the jab at my age").rationale,
+        "connection": build_classifier(client).validate_connection()[0],
+    }
+
+
+EXPECTED = {
+    "json": "eligible",
+    "compact": "scheduling",
+    "stream": "eligible",
+    "rate_limited": "OpenAI request failed (429). Please try again shortly.",
+    "connection": "ok",
+}
+
+
+@pytest.mark.skipif(not RECORDING, reason="set RSV_RECORD_CASSETTES=1 to re-record")
+def test_record_cassette(monkeypatch: pytest.MonkeyPatch) -> None:
+    from openai import OpenAI
+
+    from components.local_matcher import LocalMatcher
+    from scripts.mock_openai_server import MockConfig, ScriptedAnswer, run_mock_server
+
+    CASSETTE.unlink(missing_ok=True)
+    config = MockConfig(
+        scripted=[ScriptedAnswer(re.compile("book", re.I), "scheduling", 0.91), ScriptedAnswer(re.compile("age", re.I), "eligible", 0.93)]
+    )
+    with run_mock_server(config) as server:
+        server.matcher = LocalMatcher(build_bank())
+        live = OpenAI(api_key="mock-key", base_url=server.base_url, max_retries=0)
+        original_create = live.chat.completions.create
+
+        def create(**options):
+            # The mock has no per-model faults, so the "rate-limited" model is failed here.
+            if options.get("model") == "rate-limited":
+                with run_mock_server(MockConfig(error_429=1.0)) as failing:
+                    return OpenAI(api_key="mock-key", base_url=failing.base_url, max_retries=0).chat.completions.create(**options)
+            return original_create(**options)
+
+        monkeypatch.setattr(live.chat.completions, "create", create)
+        assert exercise(CassetteClient(Cassette(CASSETTE, mode="record"), inner=live)) == EXPECTED
+
+
+def test_replay_serves_recorded_answers_without_network() -> None:
+    started = time.perf_counter()
+    outcome = exercise(CassetteClient(Cassette(CASSETTE, mode="replay")))
+
+    assert outcome == EXPECTED
+    assert time.perf_counter() - started < 1.0
+
+
+def test_replay_misses_unrecorded_requests_and_rejects_other_versions(tmp_path: Path) -> None:
+    result = build_classifier(CassetteClient(Cassette(CASSETTE, mode="replay"))).classify("something never recorded")
+    assert result.intent_id == "__NO_MATCH__"
+    assert "No recorded interaction" in result.rationale
+
+    old = tmp_path / "old.json"
+    old.write_text(json.dumps({"version": 0, "interactions": []}), encoding="utf-8")
+    with pytest.raises(CassetteError):
+        Cassette(old)
+
+
+def test_replay_can_reproduce_recorded_latency() -> None:
+    cassette = Cassette(CASSETTE, mode="replay", replay_latency=True)
+    recorded = sum(entry["latency_ms"] for entry in cassette.interactions.values() if entry["request"]["endpoint"] == "models.list")
+
+    started = time.perf_counter()
+    build_classifier(CassetteClient(cassette)).validate_connection()
+
+    assert (time.perf_counter() - started) * 1000 >= recorded * 0.9
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_jobs import ClassificationJobs  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+
+
+def test_jobs_are_bounded_and_collected_once_finished() -> None:
+    release = threading.Event()
+    metrics = MetricsRegistry()
+    jobs = ClassificationJobs(max_workers=2, max_pending=2, metrics=metrics)
+
+    first = jobs.submit(lambda: release.wait(5) and "answer")
+    second = jobs.submit(lambda: release.wait(5))
+    assert first and second
+    assert jobs.submit(lambda: None) is None
+    assert metrics.counter("classifier.jobs.rejected") == 1
+    assert jobs.pop_finished(first) is None
+
+    release.set()
+    jobs.get(first).result(timeout=5)
+    future = jobs.pop_finished(first)
+    assert future is not None and future.result() == "answer"
+    assert jobs.get(first) is None
+    assert jobs.pop_finished("unknown") is None
+
+
+def test_repeated_submission_reuses_the_job_within_the_window() -> None:
+    from components.classification_jobs import submission_key
+
+    metrics = MetricsRegistry()
+    jobs = ClassificationJobs(max_workers=1, dedup_seconds=60, metrics=metrics)
+    calls = []
+    key = submission_key("session-a", "Can I get it?")
+
+    job_id = jobs.submit(lambda: calls.append(1), key=key)
+    jobs.get(job_id).result(timeout=5)
+    jobs.pop_finished(job_id)
+
+    assert jobs.duplicate_of(submission_key("session-a", "  can i get it ")) == job_id
+    assert jobs.duplicate_of(submission_key("session-b", "Can I get it?")) is None
+    assert calls == [1]
+    assert metrics.counter("classifier.jobs.suppressed") == 1
+
+    jobs.dedup_seconds = 0
+    assert jobs.duplicate_of(key) is None
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.conversation_store import ConversationStore, InMemoryConversationStore, SQLiteConversationStore  # noqa: E402
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryConversationStore()
+    store = SQLiteConversationStore(tmp_path / "conversations.sqlite3")
+    request.addfinalizer(store.close)
+    return store
+
+
+def test_recent_returns_last_page_in_order_per_session_and_history(store) -> None:
+    for i in range(5):
+        store.append("s1", "free_history", "user", f"question {i}")
+    store.append("s1", "guided_history", "assistant", "guided answer", intent_id="eligible")
+    store.append("s2", "free_history", "user", "other session")
+
+    assert store.count("s1", "free_history") == 5
+    assert [m["content"] for m in store.recent("s1", "free_history", 2)] == ["question 3", "question 4"]
+    assert store.recent("s1", "guided_history", 10) == [{"role": "assistant", "content": "guided answer", "intent_id": "eligible"}]
+    assert store.has_answer("s1", "guided_history", "eligible") is True
+    assert store.has_answer("s2", "guided_history", "eligible") is False
+
+    store.clear("s1")
+    assert store.count("s1", "free_history") == 0
+    assert store.count("s2", "free_history") == 1
+
+
+def test_sqlite_history_survives_reopen(tmp_path) -> None:
+    path = tmp_path / "conversations.sqlite3"
+    first = SQLiteConversationStore(path)
+    first.append("s1", "free_history", "user", "still here?")
+    first.close()
+
+    reopened = SQLiteConversationStore(path)
+    assert reopened.recent("s1", "free_history", 20)[0]["content"] == "still here?"
+    reopened.close()
+
+
+def test_sqlite_messages_past_the_ttl_are_purged(tmp_path) -> None:
+    store = SQLiteConversationStore(tmp_path / "conversations.sqlite3", ttl_seconds=60)
+    store.append("old", "free_history", "user", "from yesterday")
+    store.append("new", "free_history", "user", "just now")
+    store._conn.execute("UPDATE messages SET created_at = created_at - 3600 WHERE session_id = 'old'")
+
+    assert store.purge_expired() == 1
+    assert store.count("old", "free_history") == 0
+    assert store.count("new", "free_history") == 1
+    store.close()
+
+    # Opening the file purges too, so a restarted process never serves expired messages.
+    path = tmp_path / "conversations.sqlite3"
+    reopened = SQLiteConversationStore(path, ttl_seconds=0)
+    assert reopened.count("new", "free_history") == 0
+    reopened.close()
+
+
+def test_in_memory_store_drops_least_recent_sessions_past_limit() -> None:
+    store = InMemoryConversationStore(max_sessions=2)
+    for session_id in ("a", "b", "c"):
+        store.append(session_id, "free_history", "user", "hi")
+
+    assert store.count("a", "free_history") == 0
+    assert store.count("c", "free_history") == 1
+
+
+def test_in_memory_store_keeps_last_messages_per_history() -> None:
+    store = InMemoryConversationStore(max_messages=3)
+    for i in range(10):
+        store.append("s1", "free_history", "user", f"question {i}")
+    trimmed = store.session_bytes("s1")
+    store.append("s1", "guided_history", "user", "guided")
+    reference = InMemoryConversationStore()
+    for i in range(7, 10):
+        reference.append("s1", "free_history", "user", f"question {i}")
+
+    assert store.count("s1", "free_history") == 3
+    assert [m["content"] for m in store.recent("s1", "free_history", 10)] == ["question 7", "question 8", "question 9"]
+    assert store.count("s1", "guided_history") == 1
+    assert trimmed == reference.session_bytes("s1")
+
+
+def test_store_interface_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        ConversationStore()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+from scripts.evaluate_classifier import bank_examples, evaluate_format  # noqa: E402
+from scripts.mock_openai_server import run_mock_server  # noqa: E402
+
+
+def test_compact_and_json_formats_agree_through_mock_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    bank = ResponseBank()
+    examples = bank_examples(bank)[:6]
+
+    rows = {}
+    with run_mock_server() as server:
+        for output_format in ("json", "compact"):
+            classifier = IntentClassifier(
+                response_bank=bank,
+                base_url=server.base_url,
+                metrics=MetricsRegistry(),
+                cache=ClassificationCache(max_entries=0),
+                usage=UsageTracker(prices={}),
+                output_format=output_format,
+            )
+            rows[output_format] = evaluate_format(classifier, examples)
+
+    assert rows["json"]["accuracy"] == rows["compact"]["accuracy"] == 1.0
+    assert rows["compact"]["mean_completion_tokens"] < rows["json"]["mean_completion_tokens"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import itertools
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.hedging import HedgeAttempt, Hedger  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+
+
+def slow_first_call():
+    counter = itertools.count()
+
+    def call(attempt: HedgeAttempt) -> str:
+        if next(counter) == 0:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    return call
+
+
+def test_hedge_wins_when_primary_is_slow() -> None:
+    hedger = Hedger("test", delay_ms=20, metrics=MetricsRegistry())
+
+    started = time.perf_counter()
+    result = hedger.call(slow_first_call())
+    elapsed = time.perf_counter() - started
+
+    stats = hedger.stats()
+    assert result == "fast"
+    assert elapsed < 0.4
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_hedge_budget_suppresses_extra_requests() -> None:
+    hedger = Hedger("test", delay_ms=20, max_hedge_ratio=0.0, burst=0.0, metrics=MetricsRegistry())
+
+    result = hedger.call(slow_first_call())
+
+    assert result == "slow"
+    assert hedger.stats()["hedged"] == 0
+    assert hedger.stats()["suppressed"] == 1
+
+
+def test_percentile_delay_waits_for_history() -> None:
+    hedger = Hedger("test", delay_ms="p95", min_samples=3, metrics=MetricsRegistry())
+
+    assert hedger.current_delay() is None
+    for _ in range(3):
+        hedger.call(lambda attempt: "ok")
+
+    assert hedger.current_delay() is not None
+
+
+def test_losing_attempt_is_cancelled() -> None:
+    hedger = Hedger("test", delay_ms=20, metrics=MetricsRegistry())
+    counter = itertools.count()
+    closed = []
+    chunks_read = []
+
+    def streamed_call(attempt: HedgeAttempt) -> str:
+        index = next(counter)
+        attempt.on_cancel(lambda: closed.append(index))
+        if index == 0:
+            for chunk in range(50):
+                if attempt.cancelled:
+                    break
+                chunks_read.append(chunk)
+                time.sleep(0.01)
+            return "slow"
+        return "fast"
+
+    assert hedger.call(streamed_call) == "fast"
+    time.sleep(0.1)
+
+    assert closed == [0]
+    assert len(chunks_read) < 20
+
+
+def test_saved_latency_is_estimated_from_slower_attempts_when_the_hedge_wins() -> None:
+    metrics = MetricsRegistry()
+    hedger = Hedger("test", delay_ms=20, metrics=metrics)
+    for latency in (900.0, 1000.0, 1100.0):
+        metrics.observe("hedge.test.attempt_ms", latency)
+    counter = itertools.count()
+
+    def call(attempt: HedgeAttempt) -> str:
+        if next(counter) == 0:
+            # A slow primary that stops as soon as it is cancelled, like a closed stream.
+            for _ in range(100):
+                if attempt.cancelled:
+                    return "slow"
+                time.sleep(0.01)
+        return "fast"
+
+    assert hedger.call(call) == "fast"
+
+    saved = hedger.stats()["saved_p50_ms"]
+    assert saved is not None and 900 < saved < 1000
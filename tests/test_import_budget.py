@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Guided-mode pages import these modules on every cold worker. The contract is that none of the heavy
+# client libraries load until a model call needs them; module counts and wall-clock time vary by machine.
+DEFERRED_MODULES = ("openai", "pydantic", "dotenv", "httpx")
+
+PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+before = set(sys.modules)
+import components.intent_classifier
+import components.response_bank
+print(json.dumps({{"new_modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def run_probe() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=str(ROOT_DIR))],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_classifier_import_defers_heavy_dependencies() -> None:
+    probe = run_probe()
+
+    loaded = {name.split(".")[0] for name in probe["new_modules"]}
+    assert not loaded & set(DEFERRED_MODULES), sorted(loaded & set(DEFERRED_MODULES))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.input_guard import InputGuard, clean_text  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from scripts.mock_openai_server import ScriptedAnswer  # noqa: E402
+
+
+def build_classifier(guard: InputGuard, client) -> IntentClassifier:
+    from components.classification_cache import ClassificationCache
+
+    intents = [
+        {"intent_id": "eligible", "user_question": "Am I eligible?", "response": "Eligibility."},
+        {"intent_id": "urgent_support", "user_question": "I think this is an emergency", "response": "Call 911."},
+    ]
+    return IntentClassifier(
+        response_bank=ResponseBank(bank={"intents": intents}, page_map={}),
+        client=client,
+        metrics=MetricsRegistry(),
+        cache=ClassificationCache(max_entries=0),
+        input_guard=guard,
+    )
+
+
+def sent_messages(client) -> list:
+    return [request["messages"][-1]["content"] for request in client.requests]
+
+
+def test_clean_text_strips_control_characters_and_collapses_whitespace() -> None:
+    assert clean_text("  can\x00 I\u200b\tget   it?\n") == "can I get it?"
+
+
+def test_long_message_is_truncated_at_a_word_boundary() -> None:
+    guarded = InputGuard(max_chars=20).check("when can I get the vaccine for my father")
+
+    assert guarded.truncated and not guarded.rejected
+    assert guarded.text == "when can I get the"
+
+
+@pytest.mark.mock_openai(scripted=[ScriptedAnswer(re.compile("eligible"), "eligible", 0.9)])
+def test_oversized_paste_is_capped_before_the_prompt_but_fully_scanned_for_emergencies(openai_cassette) -> None:
+    classifier = build_classifier(InputGuard(max_chars=100), openai_cassette)
+    paste = "am I eligible " + "lorem ipsum " * 4000
+
+    assert classifier.classify(paste).intent_id == "eligible"
+    assert len(sent_messages(openai_cassette)[0]) <= 100
+
+    assert classifier.classify(paste + " my father has chest pain").intent_id == "urgent_support"
+    assert len(openai_cassette.requests) == 1
+
+
+def test_reject_policy_refuses_without_a_model_call(openai_cassette) -> None:
+    classifier = build_classifier(InputGuard(max_tokens=10, policy="reject"), openai_cassette)
+
+    result = classifier.classify("tell me " * 20)
+
+    assert result.intent_id == "__NO_MATCH__"
+    assert "too long" in result.rationale
+    assert openai_cassette.requests == []
+    assert classifier.metrics.snapshot()["counters"]["classifier.input.rejected"] == 1
+
+
+def test_emergency_match_sees_past_the_length_limit(openai_cassette) -> None:
+    classifier = build_classifier(InputGuard(max_chars=50, policy="reject"), openai_cassette)
+    message = "background " * 200 + "and now she can't breathe"
+
+    assert classifier.input_guard.check(message).rejected
+    assert classifier.emergency_match(message).intent_id == "urgent_support"
+    assert classifier.emergency_match("background " * 200) is None
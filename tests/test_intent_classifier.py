@@ -1,72 +1,48 @@
 from __future__ import annotations
 
-import json
-import os
+import re
 import sys
 from pathlib import Path
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-import sys
-from pathlib import Path
-
-import httpx
-import pytest
-
-from openai import APIConnectionError, AuthenticationError
-
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from components.classification_cache import ClassificationCache  # noqa: E402
 from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
 from components.response_bank import ResponseBank  # noqa: E402
+from scripts.mock_openai_server import ScriptedAnswer  # noqa: E402
 
+# Requests are answered from tests/cassettes/test_intent_classifier.json; the mock_openai markers say how the
+# mock server answered when it was recorded (see tests/conftest.py).
 
-class DummyModels:
-    def __init__(self, should_fail: bool = False):
-        self.should_fail = should_fail
-
-    def list(self):  # noqa: D401 - simple stub
-        if self.should_fail:
-            raise RuntimeError("models list failed")
-        return {"data": []}
 
+def answer(pattern: str, intent_id: str = "eligible", confidence: float = 0.9, **options) -> ScriptedAnswer:
+    return ScriptedAnswer(re.compile(pattern, re.IGNORECASE), intent_id, confidence, **options)
 
-class FakeResponse:
-    def __init__(self, content: str):
-        self.choices = [
-            type("Choice", (), {"message": type("Msg", (), {"content": content})()})()
-        ]
-
-
-class NoResponseFormatClient:
-    def __init__(self, content: str):
-        self._content = content
-        self.models = DummyModels()
-        self.chat = self
-        self.completions = self
-        self.calls = 0
-
-    def create(self, *_, **kwargs):
-        self.calls += 1
-        if "response_format" in kwargs and self.calls == 1:
-            raise TypeError("response_format not supported")
-        return FakeResponse(self._content)
 
+def build_response_bank() -> ResponseBank:
+    intents = [
+        {
+            "intent_id": "eligible",
+            "user_question": "Am I eligible?",
+            "response": "Eligibility details.",
+        }
+    ]
+    return ResponseBank(bank={"intents": intents}, page_map={})
 
-class FailingClient:
-    def __init__(self, error: Exception):
-        self._error = error
-        self.models = DummyModels(should_fail=True)
-        self.chat = self
-        self.completions = self
 
-    def create(self, *_, **__):
-        raise self._error
+def build_classifier(client, bank: ResponseBank | None = None, **options) -> IntentClassifier:
+    return IntentClassifier(
+        response_bank=bank or build_response_bank(),
+        client=client,
+        metrics=MetricsRegistry(),
+        cache=ClassificationCache(max_entries=0),
+        **options,
+    )
 
 
 def test_missing_api_key_returns_no_match(monkeypatch):
@@ -81,143 +57,213 @@ def test_missing_api_key_returns_no_match(monkeypatch):
     assert "OPENAI_API_KEY" in result.rationale
 
 
-def test_typeerror_response_format_fallback(monkeypatch):
-    monkeypatch.setenv("OPENAI_API_KEY", "test")
-    bank = ResponseBank()
-    payload = {
-        "intent_id": bank.intents[0]["intent_id"],
-        "confidence": 0.91,
-        "slots": {},
-        "rationale": "ok",
-    }
-    client = NoResponseFormatClient(json.dumps(payload))
+def test_cassette_without_api_key_counts_as_a_model_before_and_after_the_client_is_built(monkeypatch) -> None:
+    monkeypatch.setenv("RSV_CASSETTE", str(ROOT_DIR / "tests" / "cassettes" / "test_intent_classifier.json"))
+    classifier = IntentClassifier(response_bank=build_response_bank())
+    classifier.api_key = None
 
-    classifier = IntentClassifier(response_bank=bank)
-    classifier.client = client
-    classifier.api_key = "test"
-
-    result = classifier.classify("hello")
+    assert classifier.has_api_key() is True
+    assert classifier.client is not None
+    assert classifier.has_api_key() is True
 
-    assert result.intent_id == payload["intent_id"]
-    assert client.calls >= 2  # attempted response_format then fell back
 
+@pytest.mark.mock_openai(response_format=False, scripted=[answer("older sdk", confidence=0.91)])
+def test_typeerror_response_format_fallback(openai_cassette):
+    result = build_classifier(openai_cassette).classify("will this work with an older sdk")
 
-def test_connectivity_failure_reports_error(monkeypatch):
-    monkeypatch.setenv("OPENAI_API_KEY", "test")
-    bank = ResponseBank()
-    client = FailingClient(RuntimeError("boom"))
+    assert result.intent_id == "eligible"
+    first, second = openai_cassette.requests
+    assert "response_format" in first and "response_format" not in second
 
-    classifier = IntentClassifier(response_bank=bank)
-    classifier.client = client
-    classifier.api_key = "test"
 
-    status = classifier.check_connectivity()
+@pytest.mark.mock_openai(error_500=1.0)
+def test_connectivity_failure_reports_error(openai_cassette):
+    status = build_classifier(openai_cassette).check_connectivity()
 
     assert status["ok"] is False
     assert "failed" in status["message"].lower()
-class FakeContentBlock:
-    def __init__(self, text: str):
-        self.text = text
 
 
-class FakeResponseChunk:
-    def __init__(self, text: str):
-        self.content = [FakeContentBlock(text)]
+def test_classify_without_key_returns_actionable_message(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    classifier = IntentClassifier(response_bank=build_response_bank(), client=None)
 
+    result = classifier.classify("Hello")
 
-class FakeOpenAIResponse:
-    def __init__(self, text: str):
-        self.output = [FakeResponseChunk(text)]
+    assert result.intent_id == "__NO_MATCH__"
+    assert "OPENAI_API_KEY" in result.rationale
+    assert "env" in result.rationale.lower()
 
 
-class FakeResponsesClient:
-    def __init__(self, *, exc: Exception | None = None, response_text: str | None = None):
-        self.exc = exc
-        self.response_text = response_text or '{"intent_id": "eligible", "confidence": 0.9, "slots": {}, "rationale": "match"}'
+@pytest.mark.mock_openai(api_key="a-different-key")
+def test_classify_invalid_key_surfaces_authentication_error(openai_cassette) -> None:
+    result = build_classifier(openai_cassette).classify("Hello, is my key accepted?")
 
-    def create(self, **_: object) -> FakeOpenAIResponse:
-        if self.exc:
-            raise self.exc
-        return FakeOpenAIResponse(self.response_text)
+    assert result.intent_id == "__NO_MATCH__"
+    assert "rejected the API key" in result.rationale
 
 
-class FakeModelsClient:
-    def __init__(self, *, exc: Exception | None = None):
-        self.exc = exc
+@pytest.mark.mock_openai(reachable=False)
+def test_classify_network_failure_returns_retriable_message(openai_cassette) -> None:
+    result = build_classifier(openai_cassette).classify("Hello, can you hear me?")
 
-    def list(self) -> list[str]:
-        if self.exc:
-            raise self.exc
-        return ["ok"]
+    assert result.intent_id == "__NO_MATCH__"
+    assert "Unable to reach OpenAI" in result.rationale
 
 
-class FakeOpenAIClient:
-    def __init__(self, *, responses_exc: Exception | None = None, models_exc: Exception | None = None, response_text: str | None = None):
-        self.responses = FakeResponsesClient(exc=responses_exc, response_text=response_text)
-        self.models = FakeModelsClient(exc=models_exc)
+@pytest.mark.mock_openai(
+    scripted=[answer("hello", content='{"intent_id": "eligible", "confidence": 0.9, "slots": {}, "rationale": "match"}')]
+)
+def test_classify_success_path_uses_response_payload(openai_cassette) -> None:
+    result = build_classifier(openai_cassette).classify("Hello")
 
+    assert result.intent_id == "eligible"
+    assert result.confidence == 0.9
+    assert result.rationale == "match"
 
-def build_response_bank() -> ResponseBank:
-    intents = [
-        {
-            "intent_id": "eligible",
-            "user_question": "Am I eligible?",
-            "response": "Eligibility details.",
-        }
-    ]
-    return ResponseBank(bank={"intents": intents}, page_map={})
 
+def test_known_phrasing_is_answered_locally_and_logged(openai_cassette, tmp_path: Path) -> None:
+    from components.event_log import EventLog, read_events
 
-def test_classify_without_key_returns_actionable_message(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    classifier = IntentClassifier(response_bank=build_response_bank(), client=None)
+    log = EventLog(tmp_path / "events.jsonl")
+    classifier = build_classifier(openai_cassette, event_log=log)
 
-    result = classifier.classify("Hello")
+    result = classifier.classify("am i eligible")
 
-    assert result.intent_id == "__NO_MATCH__"
-    assert "OPENAI_API_KEY" in result.rationale
-    assert "env" in result.rationale.lower()
+    assert result.intent_id == "eligible"
+    assert result.confidence == 1.0
+    assert openai_cassette.requests == []
+    assert [entry["source"] for entry in read_events(log.path)] == ["local"]
 
 
-def test_classify_invalid_key_surfaces_authentication_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "bad-key")
-    request = httpx.Request("GET", "https://api.openai.com")
-    auth_error = AuthenticationError("auth failed", response=httpx.Response(401, request=request), body=None)
-    classifier = IntentClassifier(
-        response_bank=build_response_bank(),
-        client=FakeOpenAIClient(responses_exc=auth_error),
-    )
+def build_cascade(client) -> IntentClassifier:
+    return build_classifier(client, model="cheap", escalation_model="strong", escalation_band=(0.4, 0.85))
 
-    result = classifier.classify("Hello")
+
+def called_models(client) -> list:
+    return [request["model"] for request in client.requests]
+
+
+@pytest.mark.mock_openai(scripted=[answer("sure of it", confidence=0.95, model="cheap")])
+def test_cascade_accepts_confident_primary_without_escalating(openai_cassette) -> None:
+    classifier = build_cascade(openai_cassette)
+
+    result = classifier.classify("can I get it, I am sure of it")
+
+    assert result.intent_id == "eligible"
+    assert called_models(openai_cassette) == ["cheap"]
+    assert classifier.cascade_stats()["escalation_rate"] == 0.0
+
+
+@pytest.mark.mock_openai(scripted=[answer("just a guess", confidence=0.1, model="cheap")])
+def test_cascade_rejects_low_confidence_without_escalating(openai_cassette) -> None:
+    classifier = build_cascade(openai_cassette)
+
+    result = classifier.classify("can I get it, just a guess")
 
     assert result.intent_id == "__NO_MATCH__"
-    assert "rejected the API key" in result.rationale
+    assert called_models(openai_cassette) == ["cheap"]
 
 
-def test_classify_network_failure_returns_retriable_message(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "network-key")
-    request = httpx.Request("GET", "https://api.openai.com")
-    network_error = APIConnectionError(request=request)
-    classifier = IntentClassifier(
-        response_bank=build_response_bank(),
-        client=FakeOpenAIClient(responses_exc=network_error),
-    )
+@pytest.mark.mock_openai(
+    scripted=[
+        answer("maybe", model="cheap", content='{"intent_id": "eligible", "confidence": 0.6, "rationale": "maybe"}'),
+        answer("maybe", model="strong", content='{"intent_id": "eligible", "confidence": 0.92, "rationale": "confirmed"}'),
+    ]
+)
+def test_cascade_escalates_gray_zone_and_tracks_agreement(openai_cassette) -> None:
+    classifier = build_cascade(openai_cassette)
+
+    result = classifier.classify("can I get it, maybe?")
+    stats = classifier.cascade_stats()
+
+    assert result.rationale == "confirmed"
+    assert called_models(openai_cassette) == ["cheap", "strong"]
+    assert stats["escalation_rate"] == 1.0
+    assert stats["agreement_rate"] == 1.0
+    assert stats["escalation_p50_ms"] is not None
+
+
+COMPACT_ANSWERS = [("1 0.93", "eligible"), ("1 0.4", "__NO_MATCH__"), ("0 0.9", "__NO_MATCH__"), ("7 0.99", "__NO_MATCH__"), ("eligible", "__NO_MATCH__")]
+
+
+@pytest.mark.mock_openai(scripted=[answer(rf"compact reply {i}\b", content=content) for i, (content, _) in enumerate(COMPACT_ANSWERS)])
+@pytest.mark.parametrize(("index", "expected"), [(i, expected) for i, (_, expected) in enumerate(COMPACT_ANSWERS)])
+def test_compact_format_maps_codes_back_and_keeps_guards(openai_cassette, index: int, expected: str) -> None:
+    classifier = build_classifier(openai_cassette, output_format="compact")
+
+    result = classifier.classify(f"can I get it (compact reply {index})")
+
+    assert result.intent_id == expected
+    [request] = openai_cassette.requests
+    assert "1: " in request["messages"][0]["content"] and "response_format" not in request
 
-    result = classifier.classify("Hello")
+
+@pytest.mark.mock_openai(scripted=[answer("insurance", content='{"intent_id": "eligible", "confidence": 0.3, "rationale": "unsure"}')])
+def test_no_match_offers_model_pick_then_local_ranking_as_candidates(openai_cassette) -> None:
+    intents = [
+        {"intent_id": "eligible", "user_question": "Am I eligible?", "response": "Eligibility details."},
+        {"intent_id": "cost", "user_question": "Is the vaccine covered by insurance?", "response": "Coverage."},
+    ]
+    classifier = build_classifier(openai_cassette, ResponseBank(bank={"intents": intents}, page_map={}))
+
+    result = classifier.classify("does insurance pay for it")
 
     assert result.intent_id == "__NO_MATCH__"
-    assert "Unable to reach OpenAI" in result.rationale
+    assert result.candidates == ["eligible", "cost"]
+    assert len(openai_cassette.requests) == 1
 
 
-def test_classify_success_path_uses_response_payload(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("OPENAI_API_KEY", "success-key")
-    classifier = IntentClassifier(
-        response_bank=build_response_bank(),
-        client=FakeOpenAIClient(response_text='{"intent_id": "eligible", "confidence": 0.9, "slots": {}, "rationale": "match"}'),
-    )
+def build_follow_up_classifier(client) -> IntentClassifier:
+    intents = [
+        {"intent_id": "eligible", "user_question": "Who is eligible?", "next_best_intent_ids": ["cost", "timing"], "response": "Eligibility."},
+        {"intent_id": "cost", "user_question": "How much does vaccination cost?", "response": "Coverage."},
+        {"intent_id": "timing", "user_question": "When should the vaccine be given?", "response": "Timing."},
+        {"intent_id": "side_effects", "user_question": "What are the side effects of the vaccine?", "response": "Side effects."},
+    ]
+    return build_classifier(client, ResponseBank(bank={"intents": intents}, page_map={}))
 
-    result = classifier.classify("Hello")
 
-    assert result.intent_id == "eligible"
-    assert result.confidence == 0.9
-    assert result.rationale == "match"
+def test_follow_up_is_resolved_locally_against_next_best_questions(openai_cassette) -> None:
+    classifier = build_follow_up_classifier(openai_cassette)
+
+    result = classifier.classify("and what would it cost me?", previous_intent_id="eligible")
+
+    assert result.intent_id == "cost"
+    assert openai_cassette.requests == []
+    assert classifier.metrics.snapshot()["counters"]["classifier.follow_up.local"] == 1
+
+
+@pytest.mark.mock_openai(scripted=[answer("pregnan")])
+def test_unresolved_follow_up_sends_the_previous_topic_to_the_model(openai_cassette) -> None:
+    classifier = build_follow_up_classifier(openai_cassette)
+
+    classifier.classify("and for pregnant people?", previous_intent_id="eligible")
+    classifier.classify("Is there anything I should know about pregnancy and the vaccine in general terms?", previous_intent_id="eligible")
+
+    first, second = (request["messages"][-1]["content"] for request in openai_cassette.requests)
+    assert 'previous answer about: "Who is eligible?"' in first
+    assert "previous answer" not in second
+
+
+@pytest.mark.mock_openai(scripted=[answer("household", intent_id="cost")])
+def test_standalone_question_after_a_previous_intent_reaches_the_model(openai_cassette) -> None:
+    classifier = build_follow_up_classifier(openai_cassette)
+    message = "How much does vaccination cost for a household with three children and two grandparents?"
+
+    result = classifier.classify(message, previous_intent_id="eligible")
+
+    assert result.intent_id == "cost"
+    [request] = openai_cassette.requests
+    assert request["messages"][-1]["content"] == message
+    assert "classifier.follow_up.local" not in classifier.metrics.snapshot()["counters"]
+
+
+@pytest.mark.mock_openai(scripted=[answer("side effects", intent_id="side_effects")])
+def test_follow_up_that_matches_another_topic_better_goes_to_the_model(openai_cassette) -> None:
+    classifier = build_follow_up_classifier(openai_cassette)
+
+    result = classifier.classify("and what about vaccine side effects?", previous_intent_id="eligible")
+
+    assert result.intent_id == "side_effects"
+    assert len(openai_cassette.requests) == 1
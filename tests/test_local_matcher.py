@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.local_matcher import LocalMatcher  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+
+
+def build_matcher() -> LocalMatcher:
+    intents = [
+        {
+            "intent_id": "symptom_signs",
+            "display_name": "Symptoms to watch",
+            "user_question": "What symptoms should I look for?",
+            "sample_user_phrases": ["RSV symptoms"],
+            "response": "Symptoms.",
+        },
+        {
+            "intent_id": "cost_coverage",
+            "display_name": "Cost and coverage",
+            "user_question": "Is the vaccine covered by insurance?",
+            "sample_user_phrases": ["How much does it cost?"],
+            "response": "Coverage.",
+        },
+    ]
+    return LocalMatcher(ResponseBank(bank={"intents": intents}, page_map={}))
+
+
+def test_exact_match_ignores_case_and_punctuation() -> None:
+    assert build_matcher().exact_match("  how much does it COST ") == "cost_coverage"
+
+
+def test_suggest_matches_partial_words_across_fields() -> None:
+    matcher = build_matcher()
+
+    assert [intent["intent_id"] for intent in matcher.suggest("how much does it co")] == ["cost_coverage"]
+    assert [intent["intent_id"] for intent in matcher.suggest("sympt")] == ["symptom_signs"]
+    assert [intent["intent_id"] for intent in matcher.suggest("insur")] == ["cost_coverage"]
+
+
+def test_suggest_ignores_short_or_unrelated_queries() -> None:
+    matcher = build_matcher()
+
+    assert matcher.suggest("s") == []
+    assert matcher.suggest("weather tomorrow") == []
+
+
+def test_rank_orders_intents_by_overlap_with_a_full_message() -> None:
+    matcher = build_matcher()
+
+    assert matcher.rank("will my insurance cover the vaccine cost") == ["cost_coverage"]
+    assert matcher.rank("purple elephants") == []
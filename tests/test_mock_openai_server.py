@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+import time
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from scripts.mock_openai_server import MockConfig, ScriptedAnswer, parse_latency, run_mock_server  # noqa: E402
+
+
+def build_classifier(base_url: str) -> IntentClassifier:
+    return IntentClassifier(response_bank=ResponseBank(), base_url=base_url)
+
+
+def test_classifier_round_trips_through_mock_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    config = MockConfig(scripted=[ScriptedAnswer(re.compile("jab", re.IGNORECASE), "scheduling", 0.93)])
+
+    with run_mock_server(config) as server:
+        classifier = build_classifier(server.base_url)
+        assert classifier.validate_connection()[0] == "ok"
+        result = classifier.classify("Where do I get the jab?")
+
+    assert result.intent_id == "scheduling"
+    assert result.confidence == 0.93
+
+
+def test_mock_server_injects_rate_limit_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    monkeypatch.setenv("RSV_OPENAI_MAX_RETRIES", "0")
+
+    with run_mock_server(MockConfig(error_429=1.0, seed=1)) as server:
+        result = build_classifier(server.base_url).classify("Where do I get the jab?")
+
+    assert result.intent_id == "__NO_MATCH__"
+    assert "429" in result.rationale
+
+
+def test_mock_server_rejects_wrong_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "wrong-key")
+
+    with run_mock_server(MockConfig(api_key="expected-key")) as server:
+        state, message = build_classifier(server.base_url).validate_connection()
+
+    assert state == "error"
+    assert "rejected the API key" in message
+
+
+def test_parse_latency_specs() -> None:
+    import random
+
+    rng = random.Random(0)
+    assert parse_latency("fixed:250")(rng) == 0.25
+    assert 0.1 <= parse_latency("uniform:100,200")(rng) <= 0.2
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1,2")
+
+
+def test_streaming_classification_exits_early_with_same_answer(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    config = MockConfig(
+        scripted=[ScriptedAnswer(re.compile("jab", re.IGNORECASE), "scheduling", 0.93)],
+        stream_chunk_chars=4,
+        stream_chunk_ms=20,
+    )
+
+    with run_mock_server(config) as server:
+        streamed = IntentClassifier(response_bank=ResponseBank(), base_url=server.base_url, streaming=True)
+        result = streamed.classify("Where do I get the jab?")
+        early_exits = streamed.metrics.counter("classifier.stream.early_exit")
+
+    assert (result.intent_id, result.confidence) == ("scheduling", 0.93)
+    assert early_exits >= 1
+
+
+@pytest.mark.parametrize("output_format", ["json", "compact"])
+def test_hedged_loser_stream_is_closed(monkeypatch: pytest.MonkeyPatch, output_format: str) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "mock-key")
+    config = MockConfig(stream_chunk_chars=2, stream_chunk_ms=15)
+
+    with run_mock_server(config) as server:
+        classifier = IntentClassifier(
+            response_bank=ResponseBank(),
+            base_url=server.base_url,
+            streaming=False,
+            output_format=output_format,
+            hedge_delay_ms=30,
+            hedge_max_ratio=1.0,
+            shadow=None,
+        )
+        result = classifier.classify("Where do I get the jab?")
+        deadline = time.monotonic() + 2
+        while server.streams_abandoned < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+    assert result.intent_id != "__NO_MATCH__"
+    assert server.request_count == 2
+    assert server.streams_abandoned == 1
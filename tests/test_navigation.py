@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.navigation import SITE_PAGES  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from scripts.export_static import url_path_for_page  # noqa: E402
+
+
+def test_every_linked_page_path_is_served_at_its_previous_url() -> None:
+    bank = ResponseBank()
+    linked = {link["page"] for links in bank.page_map.values() for link in links}
+    served = {item["page"]: item["url_path"] for item in SITE_PAGES}
+
+    assert linked <= set(served)
+    for page_path, url_path in served.items():
+        assert url_path == url_path_for_page(page_path)
+
+
+def test_every_view_module_exposes_render() -> None:
+    for item in SITE_PAGES:
+        assert callable(importlib.import_module(item["view"]).render)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.event_log import EventLog, read_events  # noqa: E402
+from scripts.mine_phrases import apply_additions, propose_additions  # noqa: E402
+
+
+def build_bank() -> dict:
+    return {
+        "intents": [
+            {
+                "intent_id": "scheduling",
+                "user_question": "How do I book an appointment?",
+                "sample_user_phrases": ["Schedule my RSV shot"],
+                "response": "Scheduling details.",
+            },
+            {
+                "intent_id": "cost_coverage",
+                "user_question": "Is it covered by insurance?",
+                "sample_user_phrases": [],
+                "response": "Coverage details.",
+            },
+        ]
+    }
+
+
+def llm_event(message: str, intent_id: str, confidence: float = 0.95) -> dict:
+    return {"event": "classification", "source": "llm", "message": message, "intent_id": intent_id, "confidence": confidence}
+
+
+def test_propose_additions_clusters_and_filters() -> None:
+    events = [
+        llm_event("Where can I get the jab nearby?", "scheduling"),
+        llm_event("where can i get the jab nearby", "scheduling"),
+        llm_event("Where can I get a jab near me?", "scheduling"),
+        llm_event("Schedule my RSV shot!", "scheduling"),  # already in the bank
+        llm_event("Schedule my RSV shot", "scheduling"),
+        llm_event("What does the vaccine cost?", "cost_coverage", confidence=0.5),  # low confidence
+        llm_event("What does the vaccine cost?", "cost_coverage", confidence=0.5),
+        llm_event("Random one-off question", "cost_coverage"),  # single occurrence
+        llm_event("Unknown intent phrasing", "not_in_bank"),
+        llm_event("Unknown intent phrasing", "not_in_bank"),
+    ]
+
+    proposals = propose_additions(build_bank(), events)
+
+    assert proposals == {"scheduling": ["Where can I get the jab nearby?"]}
+
+
+def test_apply_additions_appends_without_mutating_source() -> None:
+    bank = build_bank()
+
+    updated = apply_additions(bank, {"cost_coverage": ["How much will it cost me?"]})
+
+    assert updated["intents"][1]["sample_user_phrases"] == ["How much will it cost me?"]
+    assert bank["intents"][1]["sample_user_phrases"] == []
+
+
+def test_event_log_round_trip(tmp_path: Path) -> None:
+    log = EventLog(tmp_path / "events.jsonl")
+    log.record("classification", message="hi", intent_id="scheduling", confidence=0.9, source="llm")
+    log.record("other", value=1)
+
+    entries = list(read_events(log.path, event="classification"))
+
+    assert len(entries) == 1
+    assert entries[0]["intent_id"] == "scheduling"
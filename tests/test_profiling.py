@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.profiling import DeterministicProfiler, SamplingProfiler, write_profile  # noqa: E402
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(200))
+
+
+def test_sampling_profile_writes_collapsed_stacks_and_summary(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RSV_PROFILE_DIR", str(tmp_path))
+    profiler = SamplingProfiler(interval_seconds=0.001)
+    profiler.start()
+    _busy(0.1)
+    profiler.stop()
+
+    paths = write_profile("pages/1_RSV_Basics.py", profiler, 100.0, top_n=5)
+
+    collapsed = paths["flamegraph"].read_text(encoding="utf-8").splitlines()
+    assert paths["flamegraph"].suffix == ".collapsed"
+    assert collapsed and all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+    assert any("_busy (test_profiling.py" in line for line in collapsed)
+    assert "Top functions by inclusive time" in paths["summary"].read_text(encoding="utf-8")
+
+
+def test_deterministic_profile_writes_pstats(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RSV_PROFILE_DIR", str(tmp_path))
+    profiler = DeterministicProfiler()
+    profiler.start()
+    _busy(0.01)
+    profiler.stop()
+
+    paths = write_profile("chatbot", profiler, 10.0, top_n=5)
+
+    assert paths["flamegraph"].suffix == ".prof" and paths["flamegraph"].stat().st_size > 0
+    assert "_busy" in paths["summary"].read_text(encoding="utf-8")
+
+
+def test_env_profile_is_one_shot(monkeypatch) -> None:
+    from components import profiling
+
+    monkeypatch.setenv("RSV_PROFILE", "cprofile")
+    monkeypatch.setattr(profiling, "_env_profile_taken", False)
+
+    assert profiling.requested_profile_mode() == ("cprofile", False)
+    assert profiling.requested_profile_mode() == (None, False)
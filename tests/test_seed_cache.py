@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_seed import SeedTable, build_seed  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from scripts import seed_cache  # noqa: E402
+
+
+def build_bank(response: str = "Coverage.") -> ResponseBank:
+    intents = [
+        {"intent_id": "eligible", "user_question": "Who is eligible?", "sample_user_phrases": ["Am I eligible?"], "response": "Eligibility."},
+        {"intent_id": "cost", "user_question": "How much does vaccination cost?", "response": response},
+    ]
+    return ResponseBank(bank={"intents": intents}, page_map={})
+
+
+def test_offline_seed_answers_paraphrases_without_a_model_call(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bank = build_bank()
+    phrasings, already_local = seed_cache.collect_phrasings(
+        bank,
+        [
+            {"message": "Does insurance pay for it?", "intent_id": "cost"},
+            {"message": "how much does vaccination cost", "intent_id": None},
+            {"message": "eligible for cost help", "intent_id": None},
+        ],
+    )
+    assert already_local == 3
+    payload = build_seed("default", bank, seed_cache.seed_results(bank, phrasings, classifier=None), "gpt-4.1-mini", "offline")
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text(json.dumps(payload), encoding="utf-8")
+    monkeypatch.setenv("RSV_CLASSIFICATION_SEED", str(seed_path))
+
+    classifier = IntentClassifier(response_bank=bank, metrics=MetricsRegistry())
+    classifier.api_key = None
+
+    assert classifier.classify("does insurance PAY for it").intent_id == "cost"
+    # No clear local winner, so the phrasing is left for the model.
+    assert classifier.seed.lookup("eligible for cost help") is None
+    assert classifier.metrics.snapshot()["counters"]["classifier.seed.hits"] == 1
+
+
+def test_seed_for_other_bank_content_is_stale(tmp_path: Path) -> None:
+    payload = build_seed("default", build_bank(), [("does insurance pay", {"intent_id": "cost", "confidence": 1.0, "slots": {}, "rationale": "x"})], "m", "offline")
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert len(SeedTable.load(seed_path, build_bank())) == 1
+    edited = SeedTable.load(seed_path, build_bank(response="Coverage has changed."))
+    assert edited.stale and len(edited) == 0
+
+
+def test_online_seed_classifies_unlabelled_phrasings_in_parallel() -> None:
+    from components.classification_cache import ClassificationCache
+    from components.local_matcher import LocalMatcher
+    from components.usage import UsageTracker
+    from scripts.mock_openai_server import MockConfig, ScriptedAnswer, run_mock_server
+
+    bank = build_bank()
+    config = MockConfig(scripted=[ScriptedAnswer(re.compile("insurance", re.I), "cost", 0.92), ScriptedAnswer(re.compile("weather", re.I), "__NO_MATCH__", 0.2)])
+    with run_mock_server(config) as server:
+        server.matcher = LocalMatcher(bank)
+        classifier = IntentClassifier(
+            response_bank=bank,
+            base_url=server.base_url,
+            metrics=MetricsRegistry(),
+            cache=ClassificationCache(max_entries=0),
+            usage=UsageTracker(prices={}),
+            streaming=False,
+        )
+        classifier.api_key = "mock-key"
+        phrasings = [{"message": "does insurance cover it", "intent_id": None}, {"message": "what is the weather", "intent_id": None}]
+        results = dict(seed_cache.seed_results(bank, phrasings, classifier, workers=2))
+
+    assert results["does insurance cover it"]["intent_id"] == "cost"
+    assert results["what is the weather"]["intent_id"] == "__NO_MATCH__"
+    assert server.request_count == 2
+
+
+def test_offline_seed_keeps_the_overlap_score_and_drops_results_below_the_threshold() -> None:
+    from components.local_matcher import LocalMatcher
+
+    bank = build_bank()
+    strong, weak = "what does vaccination cost", "vaccination cost for kids"
+    results = [(message, seed_cache.classify_offline(LocalMatcher(bank), message)) for message in (strong, weak)]
+
+    assert [result["confidence"] for _, result in results] == [pytest.approx(2 / 3), 0.5]
+    entries = build_seed("default", bank, results, "m", "offline", min_confidence=0.6)["banks"][bank.fingerprint]["entries"]
+    assert [entry["message"] for entry in entries] == [strong]
+
+
+def test_committed_seed_matches_the_bundled_bank() -> None:
+    from components.classification_seed import DEFAULT_SEED_PATH
+
+    table = SeedTable.load(DEFAULT_SEED_PATH, ResponseBank())
+
+    assert not table.stale and len(table) > 0, "Rebuild it: python -m scripts.seed_cache --paraphrases data/paraphrases.jsonl --offline"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.session_memory import SessionMemoryTracker, measure_chat_state  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(messages: int) -> dict:
+    return {
+        "chat_mode": "Guided",
+        "guided_auto_prompts": {f"pages/{i}_Page.py": f"intent_{i}" for i in range(messages)},
+        "chat_session_id": "kept",
+    }
+
+
+def _evictor(state: dict):
+    return lambda: [state.pop(key, None) for key in ("chat_mode", "guided_auto_prompts")]
+
+
+def test_measure_counts_only_chat_keys_and_grows_with_state() -> None:
+    small, large = _state(1), _state(50)
+    assert 0 < measure_chat_state(small) < measure_chat_state(large)
+    assert measure_chat_state({"chat_session_id": "x" * 10_000}) == 0
+
+
+def test_idle_sessions_are_evicted_after_ttl() -> None:
+    clock, metrics = FakeClock(), MetricsRegistry()
+    tracker = SessionMemoryTracker(idle_ttl_seconds=60, sweep_interval_seconds=0, metrics=metrics, clock=clock)
+    idle_state, active_state = _state(3), _state(3)
+
+    tracker.touch("idle", idle_state, _evictor(idle_state))
+    clock.now += 120
+    tracker.touch("active", active_state, _evictor(active_state))
+
+    assert "guided_auto_prompts" not in idle_state and idle_state["chat_session_id"] == "kept"
+    assert "guided_auto_prompts" in active_state
+    assert tracker.consume_eviction("idle") is True
+    assert tracker.consume_eviction("idle") is False
+    assert metrics.counter("sessions.evicted.idle") == 1
+    assert metrics.gauge("sessions.live") == 1
+
+
+def test_cap_evicts_least_recently_seen_sessions_first() -> None:
+    clock, metrics = FakeClock(), MetricsRegistry()
+    states = {name: _state(20) for name in ("oldest", "middle", "newest")}
+    per_session = measure_chat_state(states["oldest"])
+    tracker = SessionMemoryTracker(idle_ttl_seconds=3600, max_total_bytes=per_session * 2, metrics=metrics, clock=clock)
+
+    for name, state in states.items():
+        clock.now += 1
+        tracker.touch(name, state, _evictor(state))
+
+    assert "guided_auto_prompts" not in states["oldest"]
+    assert "guided_auto_prompts" in states["middle"] and "guided_auto_prompts" in states["newest"]
+    assert metrics.counter("sessions.evicted.cap") == 1
+    assert tracker.stats()["live"] == 2
+
+
+def test_in_process_history_is_counted_and_evicted_with_the_session() -> None:
+    from components.conversation_store import InMemoryConversationStore
+
+    clock, metrics = FakeClock(), MetricsRegistry()
+    store = InMemoryConversationStore()
+    tracker = SessionMemoryTracker(idle_ttl_seconds=60, sweep_interval_seconds=0, metrics=metrics, clock=clock)
+    state = _state(1)
+    for i in range(50):
+        store.append("idle", "free_history", "user", f"question {i} " * 20)
+
+    measured = tracker.touch("idle", state, _evictor(state), store=store)
+    assert measured == measure_chat_state(state) + store.session_bytes("idle")
+    assert store.session_bytes("idle") > 50 * 200
+
+    clock.now += 120
+    tracker.touch("active", _state(1), lambda: None, store=store)
+
+    assert store.count("idle", "free_history") == 0
+    assert store.session_bytes("idle") == 0
+    assert metrics.counter("sessions.evicted.idle") == 1
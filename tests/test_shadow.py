@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+import re
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.event_log import EventLog, read_events  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.shadow import ShadowEvaluator  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+from scripts.mock_openai_server import ScriptedAnswer  # noqa: E402
+
+CANDIDATE_MODEL = "candidate-model"
+
+
+def build_bank() -> ResponseBank:
+    intents = [
+        {"intent_id": "eligible", "user_question": "Am I eligible?", "response": "Eligibility."},
+        {"intent_id": "cost", "user_question": "What does it cost?", "response": "Coverage."},
+    ]
+    return ResponseBank(bank={"intents": intents}, page_map={})
+
+
+def build(client, tmp_path: Path, rate: float = 1.0, max_pending: int = 16):
+    """Production and a candidate on another model, both answered from tests/cassettes/test_shadow.json."""
+    bank = build_bank()
+    metrics = MetricsRegistry()
+    log = EventLog(tmp_path / "events.jsonl")
+    candidate = IntentClassifier(
+        response_bank=bank, client=client, model=CANDIDATE_MODEL, metrics=MetricsRegistry(), cache=ClassificationCache(max_entries=0), shadow=None
+    )
+    shadow = ShadowEvaluator(candidate, rate, metrics, log, max_workers=1, max_pending=max_pending, rng=random.Random(0))
+    production = IntentClassifier(
+        response_bank=bank,
+        client=client,
+        metrics=metrics,
+        cache=ClassificationCache(max_entries=0),
+        event_log=log,
+        shadow=shadow,
+    )
+    return production, shadow, log
+
+
+def candidate_calls(client) -> int:
+    return sum(request["model"] == CANDIDATE_MODEL for request in client.requests)
+
+
+@pytest.mark.mock_openai(
+    scripted=[ScriptedAnswer(re.compile("."), "cost", 0.8, model=CANDIDATE_MODEL), ScriptedAnswer(re.compile("."), "eligible", 0.9)]
+)
+def test_shadow_records_agreement_confidence_delta_and_latency(openai_cassette, tmp_path: Path) -> None:
+    production, shadow, log = build(openai_cassette, tmp_path)
+
+    assert production.classify("can I get it").intent_id == "eligible"
+    shadow._executor.shutdown(wait=True)
+
+    stats = shadow.stats()
+    assert stats["compared"] == 1 and stats["agreement_rate"] == 0.0
+    [event] = list(read_events(log.path, event="shadow"))
+    assert event["production_source"] == "llm"
+    assert event["production_intent_id"] == "eligible" and event["candidate_intent_id"] == "cost"
+    assert event["confidence_delta"] == -0.1
+    assert event["candidate_ms"] >= 0 and event["production_ms"] >= 0
+
+
+@pytest.mark.mock_openai(scripted=[ScriptedAnswer(re.compile("."), "eligible", 0.9)])
+def test_slow_candidate_never_delays_production_and_excess_is_dropped(openai_cassette, tmp_path: Path) -> None:
+    production, shadow, _ = build(openai_cassette, tmp_path, max_pending=1)
+    # Hold the shadow pool's only worker, as a slow candidate call would.
+    gate = threading.Event()
+    shadow._pool().submit(gate.wait, 5)
+
+    for _ in range(3):
+        assert production.classify("is it free for me").intent_id == "eligible"
+
+    assert shadow.stats()["dropped"] == 2
+    gate.set()
+    shadow._executor.shutdown(wait=True)
+    assert candidate_calls(openai_cassette) == 1
+    assert shadow.stats()["agreement_rate"] == 1.0
+
+
+@pytest.mark.mock_openai(scripted=[ScriptedAnswer(re.compile("."), "eligible", 0.9)])
+def test_local_answers_and_calls_over_budget_are_not_shadowed(openai_cassette, tmp_path: Path) -> None:
+    production, shadow, _ = build(openai_cassette, tmp_path)
+    production.usage = UsageTracker(prices={"gpt-4.1-mini": (10_000.0, 10_000.0)}, global_budget_usd_per_hour=0.5)
+
+    assert production.classify("Am I eligible?").intent_id == "eligible"
+    assert shadow.stats()["submitted"] == 0
+
+    # This model call spends the whole hourly budget, so the candidate is not asked to repeat it.
+    assert production.classify("do my kids need it").intent_id == "eligible"
+    stats = shadow.stats()
+    assert stats["submitted"] == 0 and stats["over_budget"] == 1
+    assert candidate_calls(openai_cassette) == 0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.response_bank import ResponseBank  # noqa: E402
+from scripts.export_static import build_bundle, content_hash, url_path_for_page  # noqa: E402
+
+
+def _bank(response: str = "Adults 60+ may qualify.") -> ResponseBank:
+    return ResponseBank(
+        bank={
+            "intents": [
+                {"intent_id": "overview", "user_question": "What is this?", "response": "An RSV guide.", "next_best_intent_ids": ["eligible", "missing"]},
+                {"intent_id": "eligible", "user_question": "Am I eligible?", "response": response, "next_best_intent_ids": []},
+            ]
+        },
+        page_map={"overview": [{"label": "Home", "page": "app.py"}], "eligible": [{"label": "Eligibility", "page": "pages/3_Eligibility.py"}]},
+    )
+
+
+def test_bundle_has_an_entry_per_page_and_hashed_assets() -> None:
+    files = build_bundle(_bank(), app_url="https://rsv.example.org/")
+    manifest = json.loads(files["manifest.json"])
+
+    assert manifest["entries"] == {"app.py": "index.html", "pages/3_Eligibility.py": "Eligibility/index.html"}
+    for path in manifest["assets"].values():
+        assert content_hash(files[path]) in path
+    assert '"page": "pages/3_Eligibility.py"' in files["Eligibility/index.html"]
+    assert f'src="../{manifest["assets"]["runtime"]}"' in files["Eligibility/index.html"]
+
+    data = json.loads(files[manifest["assets"]["data"]])
+    assert data["pages"] == {"app.py": "overview", "pages/3_Eligibility.py": "eligible"}
+    assert data["intents"]["overview"]["next_best_intent_ids"] == ["eligible"]
+    assert data["intents"]["eligible"]["links"] == [{"label": "Eligibility", "entry": "Eligibility/index.html"}]
+    assert '"root": "../"' in files["Eligibility/index.html"] and '"root": ""' in files["index.html"]
+    assert 'href="https://rsv.example.org/Eligibility?chat=free&amp;panel=open"' in files["Eligibility/index.html"]
+
+
+def test_content_change_busts_only_the_data_asset() -> None:
+    before = json.loads(build_bundle(_bank())["manifest.json"])["assets"]
+    after = json.loads(build_bundle(_bank("Updated guidance."))["manifest.json"])["assets"]
+
+    assert before["data"] != after["data"]
+    assert before["runtime"] == after["runtime"] and before["style"] == after["style"]
+    assert url_path_for_page("app.py") == ""
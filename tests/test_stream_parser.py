@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.stream_parser import IncrementalClassificationParser  # noqa: E402
+
+
+def _feed_until_decided(text: str, step: int = 3):
+    parser = IncrementalClassificationParser()
+    for i in range(0, len(text), step):
+        parser.feed(text[i : i + step])
+        decided = parser.decided()
+        if decided:
+            return parser, decided, i + step
+    return parser, None, len(text)
+
+
+def test_decides_before_rationale_arrives() -> None:
+    text = json.dumps({"intent_id": "scheduling", "confidence": 0.95, "slots": {}, "rationale": "x" * 200})
+
+    parser, decided, consumed = _feed_until_decided(text)
+
+    assert decided == {"intent_id": "scheduling", "confidence": 0.95}
+    assert consumed < len(text) / 2
+
+
+def test_waits_for_number_to_finish() -> None:
+    parser = IncrementalClassificationParser()
+    parser.feed('{"intent_id": "scheduling", "confidence": 0.')
+    assert parser.decided() is None
+    parser.feed("9")
+    assert parser.decided() is None
+    parser.feed('5, "slots"')
+    assert parser.decided() == {"intent_id": "scheduling", "confidence": 0.95}
+
+
+def test_out_of_order_fields_fall_back_to_full_parse() -> None:
+    text = json.dumps({"rationale": "because", "intent_id": "scheduling", "confidence": 0.95, "slots": {}})
+
+    parser, decided, _ = _feed_until_decided(text)
+
+    assert decided is None
+    assert parser.out_of_order is True
+    assert json.loads(parser.text)["intent_id"] == "scheduling"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.classification_cache import ClassificationCache  # noqa: E402
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.usage import UsageTracker  # noqa: E402
+from scripts.mock_openai_server import ScriptedAnswer  # noqa: E402
+
+# Model calls replay tests/cassettes/test_usage.json (see tests/conftest.py); the mock answers every question
+# with the "eligible" intent and reports token usage from the prompt length.
+mock_eligible = pytest.mark.mock_openai(scripted=[ScriptedAnswer(re.compile("."), "eligible", 0.9)])
+
+
+def build_classifier(usage: UsageTracker, client) -> IntentClassifier:
+    bank = ResponseBank(bank={"intents": [{"intent_id": "eligible", "user_question": "Am I eligible?", "response": "Yes."}]}, page_map={})
+    return IntentClassifier(response_bank=bank, client=client, usage=usage, metrics=MetricsRegistry(), cache=ClassificationCache(max_entries=0))
+
+
+@mock_eligible
+def test_classify_records_tokens_cost_and_attribution(openai_cassette) -> None:
+    usage = UsageTracker(prices={"gpt-4.1-mini": (0.40, 1.60)})
+    classifier = build_classifier(usage, openai_cassette)
+
+    classifier.classify("can I get it", session_id="s1", page="pages/3_Eligibility.py")
+
+    [request] = openai_cassette.requests
+    reported = openai_cassette.cassette.lookup(request)["response"]["usage"]
+    totals = usage.window_totals(60)
+    assert totals["prompt_tokens"] == reported["prompt_tokens"] > 0
+    assert totals["completion_tokens"] == reported["completion_tokens"] > 0
+    assert abs(totals["cost_usd"] - (reported["prompt_tokens"] * 0.40 + reported["completion_tokens"] * 1.60) / 1_000_000) < 1e-12
+    assert usage.breakdown("page")[0]["page"] == "pages/3_Eligibility.py"
+    assert usage.breakdown("intent_id")[0]["intent_id"] == "eligible"
+
+
+@mock_eligible
+def test_session_budget_degrades_to_local_answers(openai_cassette) -> None:
+    usage = UsageTracker(prices={"gpt-4.1-mini": (10_000.0, 10_000.0)}, session_budget_usd=0.5)
+    classifier = build_classifier(usage, openai_cassette)
+
+    classifier.classify("will my plan cover it", session_id="s1")
+    blocked = classifier.classify("something else entirely", session_id="s1")
+    local = classifier.classify("Am I eligible?", session_id="s1")
+    other_session = classifier.classify("something else entirely", session_id="s2")
+
+    assert len(openai_cassette.requests) == 2
+    assert blocked.intent_id == "__NO_MATCH__"
+    assert "budget" in blocked.rationale
+    assert local.intent_id == "eligible"
+    assert other_session.intent_id == "eligible"
+    assert usage.budget_status("s1") == "session_exceeded"
+
+
+@mock_eligible
+def test_global_budget_applies_to_every_session(openai_cassette) -> None:
+    usage = UsageTracker(prices={"gpt-4.1-mini": (10_000.0, 10_000.0)}, global_budget_usd_per_hour=0.5)
+    classifier = build_classifier(usage, openai_cassette)
+
+    classifier.classify("where is the nearest clinic", session_id="s1")
+
+    assert usage.budget_status("s2") == "global_exceeded"
+
+
+def test_global_budget_does_not_depend_on_the_record_cap() -> None:
+    usage = UsageTracker(prices={"m": (1.0, 0.0)}, global_budget_usd_per_hour=0.004, max_records=2)
+
+    for _ in range(5):
+        usage.record("m", 1000, 0, 10.0)
+
+    assert usage.window_totals(3600)["calls"] == 2
+    assert abs(usage.hour_cost() - 0.005) < 1e-12
+    assert usage.budget_status() == "global_exceeded"
+
+
+def test_session_costs_are_pruned() -> None:
+    usage = UsageTracker(prices={"m": (1.0, 0.0)}, max_sessions=2)
+
+    for session_id in ("s1", "s2", "s3"):
+        usage.record("m", 1000, 0, 10.0, session_id=session_id)
+
+    assert usage.totals()["sessions"] == 2
+    assert usage.session_cost("s1") == 0.0
+    assert usage.session_cost("s3") == 0.001
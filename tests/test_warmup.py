@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from components.intent_classifier import IntentClassifier  # noqa: E402
+from components.metrics import MetricsRegistry  # noqa: E402
+from components.response_bank import ResponseBank  # noqa: E402
+from components.warmup import start_warmup  # noqa: E402
+
+
+def test_background_warmup_reports_ready_and_caches_prompt(openai_cassette) -> None:
+    bank = ResponseBank(bank={"intents": [{"intent_id": "eligible", "user_question": "Am I eligible?", "response": "Yes."}]}, page_map={})
+    classifier = IntentClassifier(response_bank=bank, client=openai_cassette, metrics=MetricsRegistry())
+
+    handle = start_warmup(classifier)
+
+    assert handle.wait(timeout=5)
+    status = handle.status()
+    assert status["ready"] is True
+    assert all(step["ok"] for step in status["steps"].values())
+    assert [request["endpoint"] for request in openai_cassette.requests] == ["models.list"]
+    assert classifier._build_system_prompt() is IntentClassifier(response_bank=bank, client=openai_cassette)._build_system_prompt()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("Scheduling and Coverage")
+
+    st.markdown(
+        """
+        Discover scheduling reminders and coverage considerations for RSV visits.
+
+        **What to expect from this section**
+        - Planning prompts for discussing vaccine availability and timing with your clinician.
+        - Coverage considerations to raise with your insurer or benefits team.
+        - Navigation links that bounce you to eligibility or vaccination details when questions overlap.
+
+        The chatbot leverages the response bank to share consistent information and deep-link you to other relevant pages.
+        """
+    )
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("Eligibility Scenarios")
+
+    st.markdown(
+        """
+        Use this page to explore how different audiences—such as older adults or pregnant people—might
+        approach RSV vaccination decisions with their clinicians.
+
+        **What you'll find here**
+        - High-level reminders that eligibility is determined with a clinician, not the assistant.
+        - Separate guidance for older adults and pregnancy-related conversations.
+        - Deep links to vaccination timing details so you can continue researching next steps.
+
+        The chatbot stays strictly within the approved response bank and does not make eligibility decisions.
+        """
+    )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("Support and Escalation")
+
+    st.markdown(
+        """
+        Find links to supportive resources and understand when to escalate to emergency care.
+
+        **Support resources**
+        - Quick reminders to seek local emergency services for severe breathing issues.
+        - Links to general support resources that are aligned with the response bank content.
+        - Reinforcement that this assistant does not provide triage or medical advice.
+
+        The chatbot's hard-rule overrides immediately route urgent phrases to emergency guidance within the response bank.
+        """
+    )
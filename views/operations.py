@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from components.admin import require_admin
+from components.metrics import METRICS
+from components.session_memory import SESSIONS
+from components.usage import USAGE, WINDOWS
+
+
+def _fmt_ms(value: float | None) -> str:
+    return f"{value:,.0f} ms" if value is not None else "—"
+
+
+def _fmt_rate(numerator: float, denominator: float) -> str:
+    return f"{numerator / denominator:.1%}" if denominator else "—"
+
+
+def render() -> None:
+    st.title("Operations")
+
+    if not require_admin():
+        return
+
+    window_label = st.radio("Window", list(WINDOWS), index=len(WINDOWS) - 1, horizontal=True)
+    window = USAGE.window_totals(WINDOWS[window_label])
+    totals = USAGE.totals()
+
+    st.subheader("Tokens and spend")
+    cols = st.columns(4)
+    cols[0].metric("Model calls", f"{window['calls']:,}")
+    cols[1].metric("Tokens / minute", f"{window['tokens_per_minute']:,.0f}")
+    cols[2].metric(f"Cost ({window_label})", f"${window['cost_usd']:.4f}")
+    cols[3].metric("Cost since start", f"${totals['cost_usd']:.4f}")
+    st.caption(f"Prompt tokens: {window['prompt_tokens']:,} · Completion tokens: {window['completion_tokens']:,}")
+
+    st.subheader("Latency and outcomes")
+    requests = METRICS.counter("classifier.requests")
+    cache_hits = METRICS.counter("classifier.cache.hits")
+    cache_lookups = cache_hits + METRICS.counter("classifier.cache.misses")
+    cols = st.columns(5)
+    cols[0].metric("Classify p50", _fmt_ms(METRICS.percentile("classifier.total.latency_ms", 50)))
+    cols[1].metric("Classify p95", _fmt_ms(METRICS.percentile("classifier.total.latency_ms", 95)))
+    cols[2].metric("Classify p99", _fmt_ms(METRICS.percentile("classifier.total.latency_ms", 99)))
+    cols[3].metric("Cache hit rate", _fmt_rate(cache_hits, cache_lookups))
+    cols[4].metric("No-match rate", _fmt_rate(METRICS.counter("classifier.no_match"), requests))
+
+    st.subheader("Budgets")
+    cols = st.columns(3)
+    cols[0].metric("Session budget", f"${USAGE.session_budget_usd:.2f}" if USAGE.session_budget_usd is not None else "Unlimited")
+    cols[1].metric("Global budget / hour", f"${USAGE.global_budget_usd_per_hour:.2f}" if USAGE.global_budget_usd_per_hour is not None else "Unlimited")
+    cols[2].metric("Over-budget requests", f"{METRICS.counter('classifier.budget.session_exceeded') + METRICS.counter('classifier.budget.global_exceeded'):,.0f}")
+
+    st.subheader("Sessions")
+    sessions = SESSIONS.stats()
+    cols = st.columns(4)
+    cols[0].metric("Live sessions", f"{sessions['live']:,}")
+    cols[1].metric("Chat state total", f"{sessions['total_bytes'] / 1024:,.1f} KiB")
+    cols[2].metric("Per session (mean / max)", f"{sessions['mean_bytes'] / 1024:,.1f} / {sessions['max_bytes'] / 1024:,.1f} KiB")
+    cols[3].metric("Evictions", f"{sessions['evictions']:,.0f}")
+    st.caption(
+        f"Idle sessions are cleared after {SESSIONS.idle_ttl_seconds / 60:,.0f} minutes; "
+        f"process cap {SESSIONS.max_total_bytes / (1024 * 1024):,.0f} MiB."
+    )
+
+    if METRICS.counter("classifier.shadow.submitted"):
+        st.subheader("Shadow evaluation")
+        compared = METRICS.counter("classifier.shadow.compared")
+        cols = st.columns(5)
+        cols[0].metric("Compared", f"{compared:,.0f}")
+        cols[1].metric("Agreement", _fmt_rate(METRICS.counter("classifier.shadow.agreements"), compared))
+        delta = METRICS.percentile("classifier.shadow.confidence_delta", 50)
+        cols[2].metric("Confidence delta p50", f"{delta:+.2f}" if delta is not None else "—")
+        cols[3].metric("Production p50", _fmt_ms(METRICS.percentile("classifier.shadow.production_ms", 50)))
+        cols[4].metric("Candidate p50", _fmt_ms(METRICS.percentile("classifier.shadow.candidate_ms", 50)))
+        st.caption(
+            f"Dropped while busy: {METRICS.counter('classifier.shadow.dropped'):,.0f} · "
+            f"Skipped over budget: {METRICS.counter('classifier.shadow.over_budget'):,.0f} · "
+            f"Candidate errors: {METRICS.counter('classifier.shadow.errors'):,.0f}. Per-message comparisons are in the event log."
+        )
+
+    st.subheader("Spend breakdown")
+    for field, label in (("intent_id", "By intent"), ("page", "By page"), ("model", "By model")):
+        rows = USAGE.breakdown(field, WINDOWS[window_label])
+        st.caption(label)
+        if rows:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+        else:
+            st.write("No model calls in this window.")
+
+    st.button("Refresh")
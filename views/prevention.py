@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("Prevention and Preparedness")
+
+    st.markdown(
+        """
+        Simple prevention steps such as hand hygiene and masking can reduce RSV spread.
+
+        **Prevention guidance covered**
+        - Everyday tactics: handwashing, staying home when sick, and cleaning shared surfaces.
+        - Community reminders: masking during surges and protecting high-risk loved ones.
+        - When prevention is not enough: links to symptom and support pages for escalation.
+
+        Use the chatbot to quickly surface approved prevention tips and navigate to other sections with deep links.
+        """
+    )
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("RSV Basics")
+
+    st.markdown(
+        """
+        Learn how RSV impacts communities and why this proof of concept focuses on navigation and education.
+
+        **Key takeaways**
+        - RSV is a common respiratory virus with seasonal surges that disproportionately affect infants and older adults.
+        - This site does not diagnose conditions; it curates approved educational responses and links you to other sections.
+        - Guided mode automatically surfaces the most relevant question for this page so you can move quickly.
+        - Free-text mode requires an API key and only classifies to the approved intents.
+
+        **How this prototype is structured**
+        - A response bank keeps answers consistent across pages.
+        - The assistant highlights deep links so you can hop between navigation topics without searching.
+        - Next-best suggestions show related questions once you review the primary guidance.
+        """
+    )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def render() -> None:
+    st.title("Vaccination Details")
+
+    st.markdown(
+        """
+        Explore high-level vaccination details, such as timing considerations and available products.
+
+        **Highlights on this page**
+        - Context on seasonal timing and how that affects planning with a clinician.
+        - A quick primer on product differences without endorsing or recommending a specific option.
+        - Links back to eligibility and appointment logistics so you can complete next steps.
+
+        All answers shown here originate from the approved response bank and avoid personal medical guidance.
+        """
+    )